@@ -1,19 +1,24 @@
 import os
 from dotenv import load_dotenv
+import groq
 from groq import Groq
+from google.api_core import exceptions as google_exceptions
 import google.generativeai as genai
 from typing import List
 import json
 from pydantic import BaseModel
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Request, Response, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 import uuid
 import traceback
 import zipfile
 import tempfile
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.builder import HTMLParserTreeBuilder
+from bs4.builder._htmlparser import BeautifulSoupHTMLParser
 import re
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
@@ -23,6 +28,32 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from io import BytesIO
 import PyPDF2
+import importlib.util
+import random
+import threading
+import time
+import tracemalloc
+import bisect
+import codecs
+import hashlib
+import itertools
+import multiprocessing
+import socket
+import contextvars
+import abc
+import copy
+import functools
+import queue
+import sqlite3
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urldefrag, urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
 
 load_dotenv()
 
@@ -35,10 +66,530 @@ if not groq_api_key:
 if not gemini_api_key:
     print("ERROR: GEMINI_API_KEY not found!")
 
-groq_client = Groq(api_key=groq_api_key)
+# Retries are handled by call_llm_provider so they go through the rate limiter
+groq_client = Groq(api_key=groq_api_key, max_retries=0)
 genai.configure(api_key=gemini_api_key)
 gemini_model = genai.GenerativeModel('gemini-pro')
 
+# Scraping configuration
+HTML_PARSER_BACKEND = os.getenv('HTML_PARSER_BACKEND', 'lxml')
+HTML_PARSER_MEMORY_SAMPLE_RATE = float(os.getenv('HTML_PARSER_MEMORY_SAMPLE_RATE', '0.05'))
+PORTFOLIO_CRAWL_ENABLED = os.getenv('PORTFOLIO_CRAWL_ENABLED', 'False').lower() == 'true'
+CRAWL_MAX_PAGES = int(os.getenv('CRAWL_MAX_PAGES', '5'))
+CRAWL_MAX_WORKERS = int(os.getenv('CRAWL_MAX_WORKERS', '16'))
+CRAWL_PER_HOST_CONCURRENCY = int(os.getenv('CRAWL_PER_HOST_CONCURRENCY', '4'))
+CRAWL_TIME_BUDGET = float(os.getenv('CRAWL_TIME_BUDGET', '25'))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '10'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '20'))
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '32'))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '4'))
+# Per-host pool size overrides as "suffix=size,...", matched on the host name
+HTTP_POOL_HOST_MAXSIZE = os.getenv('HTTP_POOL_HOST_MAXSIZE', 'vercel.app=16,netlify.app=16,github.io=16')
+HTTP_RETRY_TOTAL = int(os.getenv('HTTP_RETRY_TOTAL', '2'))
+HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', '0.5'))
+HTTP_RETRY_MAX_BACKOFF = float(os.getenv('HTTP_RETRY_MAX_BACKOFF', '8'))
+HTTP_CLIENT_HTTP2 = os.getenv('HTTP_CLIENT_HTTP2', 'False').lower() == 'true'
+# Upper bound only: getaddrinfo does not report record TTLs, so a failed connect also drops the entry
+HTTP_DNS_CACHE_TTL = float(os.getenv('HTTP_DNS_CACHE_TTL', '60'))
+SCRAPE_MAX_BYTES = int(os.getenv('SCRAPE_MAX_BYTES', str(5 * 1024 * 1024)))
+SCRAPE_CHUNK_SIZE = int(os.getenv('SCRAPE_CHUNK_SIZE', str(64 * 1024)))
+SCRAPE_INCREMENTAL_PARSE = os.getenv('SCRAPE_INCREMENTAL_PARSE', 'False').lower() == 'true'
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'True').lower() == 'true'
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', 'http_cache')
+HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', '3600'))
+HTTP_CACHE_MAX_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', str(100 * 1024 * 1024)))
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'True').lower() == 'true'
+LLM_CACHE_DIR = os.getenv('LLM_CACHE_DIR', 'llm_cache')
+LLM_CACHE_TTL = float(os.getenv('LLM_CACHE_TTL', str(7 * 24 * 3600)))
+LLM_CACHE_MAX_BYTES = int(os.getenv('LLM_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv('LLM_CACHE_MEMORY_ENTRIES', '256'))
+# Requests carrying this header skip cached model responses (fresh ones are still stored)
+LLM_CACHE_BYPASS_HEADER = 'X-LLM-Cache-Bypass'
+PROMPT_COMPACTION_ENABLED = os.getenv('PROMPT_COMPACTION_ENABLED', 'True').lower() == 'true'
+PROMPT_CONTEXT_MAX_CHARS = int(os.getenv('PROMPT_CONTEXT_MAX_CHARS', '3000'))
+# Client-side model budgets. The defaults are free-tier figures; set them to your
+# account's limits (see "Model rate limits" in the README)
+GROQ_REQUESTS_PER_MINUTE = float(os.getenv('GROQ_REQUESTS_PER_MINUTE', '30'))
+GROQ_TOKENS_PER_MINUTE = float(os.getenv('GROQ_TOKENS_PER_MINUTE', '12000'))
+GEMINI_REQUESTS_PER_MINUTE = float(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '60'))
+GEMINI_TOKENS_PER_MINUTE = float(os.getenv('GEMINI_TOKENS_PER_MINUTE', '32000'))
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '8'))
+LLM_MAX_QUEUE = int(os.getenv('LLM_MAX_QUEUE', '32'))
+LLM_MAX_WAIT = float(os.getenv('LLM_MAX_WAIT', '30'))
+# Completion tokens reserved per call until a prompt has reported real usage
+LLM_COMPLETION_TOKEN_ESTIMATE = int(os.getenv('LLM_COMPLETION_TOKEN_ESTIMATE', '1000'))
+LLM_RETRY_TOTAL = int(os.getenv('LLM_RETRY_TOTAL', '3'))
+LLM_RETRY_BACKOFF = float(os.getenv('LLM_RETRY_BACKOFF', '1'))
+LLM_RETRY_MAX_BACKOFF = float(os.getenv('LLM_RETRY_MAX_BACKOFF', '20'))
+# Candidate extraction fires a backup request at the other provider once the
+# primary has been running longer than its recent LLM_HEDGE_QUANTILE latency
+LLM_HEDGE_ENABLED = os.getenv('LLM_HEDGE_ENABLED', 'True').lower() == 'true'
+LLM_HEDGE_PRIMARY = os.getenv('LLM_HEDGE_PRIMARY', 'groq')
+if LLM_HEDGE_PRIMARY not in ('groq', 'gemini'):
+    print(f"Unknown LLM_HEDGE_PRIMARY '{LLM_HEDGE_PRIMARY}', using groq")
+    LLM_HEDGE_PRIMARY = 'groq'
+LLM_HEDGE_QUANTILE = float(os.getenv('LLM_HEDGE_QUANTILE', '0.95'))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv('LLM_HEDGE_MIN_SAMPLES', '20'))
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv('LLM_HEDGE_DEFAULT_DELAY', '10'))
+LLM_HEDGE_MIN_DELAY = float(os.getenv('LLM_HEDGE_MIN_DELAY', '1'))
+LLM_LATENCY_WINDOW = int(os.getenv('LLM_LATENCY_WINDOW', '1000'))
+STRUCTURED_DATA_ENABLED = os.getenv('STRUCTURED_DATA_ENABLED', 'True').lower() == 'true'
+STRUCTURED_DATA_MIN_COMPLETENESS = float(os.getenv('STRUCTURED_DATA_MIN_COMPLETENESS', '0.8'))
+RULE_BASED_EXTRACTION_ENABLED = os.getenv('RULE_BASED_EXTRACTION_ENABLED', 'True').lower() == 'true'
+RULE_BASED_MIN_CONFIDENCE = float(os.getenv('RULE_BASED_MIN_CONFIDENCE', '0.7'))
+RULE_BASED_FILL_MISSING = os.getenv('RULE_BASED_FILL_MISSING', 'True').lower() == 'true'
+# 'two_pass' summarises the portfolio to prose and then parses the prose into
+# a Candidate; 'single_pass' goes from portfolio text to Candidate JSON in one call
+LLM_EXTRACTION_MODE = os.getenv('LLM_EXTRACTION_MODE', 'two_pass')
+if LLM_EXTRACTION_MODE not in ('two_pass', 'single_pass'):
+    print(f"Unknown LLM_EXTRACTION_MODE '{LLM_EXTRACTION_MODE}', using two_pass")
+    LLM_EXTRACTION_MODE = 'two_pass'
+BATCH_CONVERT_CONCURRENCY = int(os.getenv('BATCH_CONVERT_CONCURRENCY', '4'))
+BATCH_CONVERT_MAX_URLS = int(os.getenv('BATCH_CONVERT_MAX_URLS', '100'))
+MODIFY_COMPONENT_MAX_BATCH = int(os.getenv('MODIFY_COMPONENT_MAX_BATCH', '20'))
+UPLOAD_MAX_BYTES = int(os.getenv('UPLOAD_MAX_BYTES', str(10 * 1024 * 1024)))
+UPLOAD_CACHE_ENABLED = os.getenv('UPLOAD_CACHE_ENABLED', 'True').lower() == 'true'
+UPLOAD_CACHE_DIR = os.getenv('UPLOAD_CACHE_DIR', 'upload_cache')
+UPLOAD_CACHE_TTL = float(os.getenv('UPLOAD_CACHE_TTL', str(7 * 24 * 3600)))
+UPLOAD_CACHE_MAX_BYTES = int(os.getenv('UPLOAD_CACHE_MAX_BYTES', str(20 * 1024 * 1024)))
+# Uploads are held in memory up to this size, then spill to UPLOAD_SPILL_DIR
+UPLOAD_SPOOL_MAX_BYTES = int(os.getenv('UPLOAD_SPOOL_MAX_BYTES', str(2 * 1024 * 1024)))
+UPLOAD_SPILL_DIR = os.getenv('UPLOAD_SPILL_DIR', '/dev/shm' if os.path.isdir('/dev/shm') else None)
+PDF_TEXT_BACKEND = os.getenv('PDF_TEXT_BACKEND', 'pypdfium2')
+# Keep the page's visual layout (columns side by side) where the backend supports it
+PDF_TEXT_LAYOUT = os.getenv('PDF_TEXT_LAYOUT', 'False').lower() == 'true'
+PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '10'))
+# Documents with at least this many pages are split across PDF_PROCESS_WORKERS processes
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '8'))
+PDF_PROCESS_WORKERS = int(os.getenv('PDF_PROCESS_WORKERS', str(min(4, os.cpu_count() or 1))))
+# POST /, /convert-portfolio and /generate-resume-pdf run as background jobs on request
+JOB_QUEUE_ENABLED = os.getenv('JOB_QUEUE_ENABLED', 'True').lower() == 'true'
+JOB_QUEUE_PATH = os.getenv('JOB_QUEUE_PATH', 'job_queue.sqlite3')
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '4'))
+JOB_MAX_QUEUED = int(os.getenv('JOB_MAX_QUEUED', '200'))
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+JOB_RESULT_TTL = float(os.getenv('JOB_RESULT_TTL', str(24 * 3600)))
+# Running jobs send a heartbeat every quarter of this; a job silent for this
+# long is assumed lost with its process and runs again
+JOB_STALE_SECONDS = float(os.getenv('JOB_STALE_SECONDS', '120'))
+JOB_POLL_MAX_WAIT = float(os.getenv('JOB_POLL_MAX_WAIT', '30'))
+SKILL_TAXONOMY_PATH = os.getenv('SKILL_TAXONOMY_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skill_taxonomy.json'))
+
+class Metrics:
+    """Thread-safe in-process counters and timings, exported on GET /metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._observations = {}
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float):
+        with self._lock:
+            stats = self._observations.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0, 'last': 0.0})
+            stats['count'] += 1
+            stats['total'] += value
+            stats['max'] = max(stats['max'], value)
+            stats['last'] = value
+
+    def average(self, name: str) -> float:
+        with self._lock:
+            stats = self._observations.get(name)
+            return stats['total'] / stats['count'] if stats else 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            observations = {
+                name: {**stats, 'avg': stats['total'] / stats['count'] if stats['count'] else 0.0}
+                for name, stats in self._observations.items()
+            }
+            return {'counters': dict(self._counters), 'observations': observations}
+
+metrics = Metrics()
+
+class DiskCache:
+    """Size-bounded on-disk cache of JSON-serialisable values.
+
+    Each entry is one file under ``directory``. Once the total size passes
+    ``max_bytes`` the least recently used entries are evicted, and entries
+    older than ``ttl`` seconds (when set) read as missing. The size index is
+    per process, so several workers sharing a directory only approximate
+    the limit.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, ttl: float = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+
+        entries = []
+        for file_name in os.listdir(directory):
+            if file_name.endswith('.json'):
+                stat = os.stat(os.path.join(directory, file_name))
+                entries.append((stat.st_mtime, file_name[:-len('.json')], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str):
+        return self.get_entry(key)[0]
+
+    def get_entry(self, key: str) -> tuple:
+        """``(value, stored_at)``, or ``(None, None)`` when missing or expired"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+        if self.ttl is not None and time.time() - entry['stored_at'] > self.ttl:
+            self.delete(key)
+            return None, None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        try:
+            # mtime doubles as the LRU clock when the index is rebuilt
+            os.utime(path)
+        except OSError:
+            pass
+        return entry['value'], entry['stored_at']
+
+    def set(self, key: str, value):
+        path = self._path(key)
+        payload = json.dumps({'stored_at': time.time(), 'value': value})
+        tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+        size = len(payload.encode('utf-8'))
+        evicted = []
+        with self._lock:
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                old_key, old_size = self._index.popitem(last=False)
+                self._total_bytes -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._remove_file(old_key)
+        return len(evicted)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            size = self._index.pop(key, None)
+            if size is not None:
+                self._total_bytes -= size
+        return self._remove_file(key)
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_file(key)
+
+    def _remove_file(self, key: str) -> bool:
+        try:
+            os.remove(self._path(key))
+            return True
+        except OSError:
+            return False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._index), 'bytes': self._total_bytes, 'max_bytes': self.max_bytes}
+
+class LlmResponseCache:
+    """Model responses cached in an in-memory LRU in front of a DiskCache.
+
+    Values are small dicts (response text plus the call's latency), so the
+    memory tier is bounded by entry count and both tiers by the disk
+    cache's TTL. Disk hits are promoted into memory with their original
+    store time, so promotion does not extend an entry's lifetime.
+    """
+
+    def __init__(self, disk: DiskCache, memory_entries: int):
+        self.disk = disk
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return ``(value, tier)`` or ``(None, None)`` on a miss"""
+        with self._lock:
+            if key in self._memory:
+                stored_at, value = self._memory[key]
+                if self.disk.ttl is None or time.time() - stored_at <= self.disk.ttl:
+                    self._memory.move_to_end(key)
+                    return value, 'memory'
+                del self._memory[key]
+        value, stored_at = self.disk.get_entry(key)
+        if value is None:
+            return None, None
+        self._remember(key, value, stored_at)
+        return value, 'disk'
+
+    def set(self, key: str, value) -> int:
+        self._remember(key, value, time.time())
+        return self.disk.set(key, value)
+
+    def _remember(self, key: str, value, stored_at: float):
+        with self._lock:
+            self._memory[key] = (stored_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        self.disk.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            memory_entries = len(self._memory)
+        return {'memory_entries': memory_entries, 'memory_max_entries': self.memory_entries, 'disk': self.disk.stats()}
+
+class _FlightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key onto one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and get a deep copy of its result, or its
+    exception re-raised. Nothing is cached once the call finishes.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: str, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _FlightCall()
+
+        if not leader:
+            metrics.incr(f'singleflight.{self.name}.coalesced')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        metrics.incr(f'singleflight.{self.name}.executed')
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'in_flight': len(self._calls)}
+
+class ProviderBusyError(Exception):
+    """A model provider is over its rate limit and the call could not be
+    scheduled in time; ``retry_after`` is a hint in seconds for the client."""
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram for quantile estimates.
+
+    Bucket bounds grow by 25% from 50ms to about two minutes. Counts are
+    halved whenever ``window`` samples have accumulated, so quantiles follow
+    recent latency rather than the whole process lifetime.
+    """
+
+    BOUNDS = tuple(round(0.05 * 1.25 ** i, 3) for i in range(36))
+
+    def __init__(self, window: int):
+        self.window = window
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.BOUNDS) + 1)
+        self._count = 0
+
+    def observe(self, seconds: float):
+        index = bisect.bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            if self._count >= self.window:
+                self._counts = [count // 2 for count in self._counts]
+                self._count = sum(self._counts)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile, 0.0 when empty"""
+        with self._lock:
+            if not self._count:
+                return 0.0
+            target = q * self._count
+            cumulative = 0
+            for index, count in enumerate(self._counts):
+                cumulative += count
+                if cumulative >= target:
+                    return self.BOUNDS[min(index, len(self.BOUNDS) - 1)]
+            return self.BOUNDS[-1]
+
+    def stats(self) -> dict:
+        return {
+            'samples': self._count,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+class LlmCallCancelled(Exception):
+    """A model call abandoned before it started, e.g. the losing side of a hedge"""
+
+class ProviderLimiter:
+    """Client-side admission control for one model provider.
+
+    Calls need a slot in two token buckets (requests and tokens per minute)
+    and a concurrency slot. The concurrency limit adapts AIMD style: it grows
+    by about one per limit's worth of fast successes, shrinks by 10% when a
+    call takes more than twice the smoothed latency, and halves on throttling
+    or provider errors. At most ``max_queue`` callers wait, each for at most
+    ``max_wait`` seconds, before ProviderBusyError is raised.
+    """
+
+    LATENCY_TOLERANCE = 2.0
+
+    def __init__(self, name: str, requests_per_minute: float, tokens_per_minute: float,
+                 max_concurrency: int, max_queue: int, max_wait: float):
+        self.name = name
+        self.request_rate = requests_per_minute / 60
+        self.token_rate = tokens_per_minute / 60
+        self.request_capacity = max(1.0, requests_per_minute)
+        self.token_capacity = max(1.0, tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._requests = self.request_capacity
+        self._tokens = self.token_capacity
+        self._refilled_at = time.monotonic()
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self._latency_ewma = None
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._requests = min(self.request_capacity, self._requests + elapsed * self.request_rate)
+        self._tokens = min(self.token_capacity, self._tokens + elapsed * self.token_rate)
+
+    def acquire(self, tokens: int, cancel: threading.Event = None):
+        """Block until the call may start; raises ProviderBusyError, or
+        LlmCallCancelled once ``cancel`` is set"""
+        # A single call larger than the bucket can still run once it is full
+        tokens = min(tokens, self.token_capacity)
+        deadline = time.monotonic() + self.max_wait
+        with self._cond:
+            if self._waiting >= self.max_queue:
+                metrics.incr(f'llm_limiter.{self.name}.rejected')
+                raise ProviderBusyError(f'{self.name} request queue is full', retry_after=self.max_wait)
+            self._waiting += 1
+            wait_start = time.monotonic()
+            try:
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        raise LlmCallCancelled(f'{self.name} call cancelled while queued')
+                    self._refill()
+                    if self._in_flight < max(1, int(self._limit)) and self._requests >= 1 and self._tokens >= tokens:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        metrics.incr(f'llm_limiter.{self.name}.rejected')
+                        raise ProviderBusyError(f'{self.name} rate limit wait exceeded {self.max_wait:g}s', retry_after=self.max_wait)
+                    # Sleep until the buckets could have refilled, or a slot is released
+                    refill_wait = max((1 - self._requests) / self.request_rate, (tokens - self._tokens) / self.token_rate, 0.01)
+                    self._cond.wait(min(remaining, refill_wait))
+            finally:
+                self._waiting -= 1
+            
+            waited = time.monotonic() - wait_start
+            if waited > 0.001:
+                metrics.incr(f'llm_limiter.{self.name}.throttled')
+            metrics.observe(f'llm_limiter.{self.name}.wait_seconds', waited)
+            self._requests -= 1
+            self._tokens -= tokens
+            self._in_flight += 1
+
+    def release(self, latency: float, estimated_tokens: int, used_tokens: int = None, overloaded: bool = False):
+        """Return the concurrency slot and feed the outcome into the AIMD limit"""
+        with self._cond:
+            self._in_flight -= 1
+            if used_tokens is not None:
+                # Settle the estimate against what the provider actually counted
+                self._tokens -= used_tokens - min(estimated_tokens, self.token_capacity)
+            
+            if overloaded:
+                self._limit = max(1.0, self._limit / 2)
+                metrics.incr(f'llm_limiter.{self.name}.concurrency_decreases')
+            elif self._latency_ewma is not None and latency > self.LATENCY_TOLERANCE * self._latency_ewma:
+                self._limit = max(1.0, self._limit * 0.9)
+                metrics.incr(f'llm_limiter.{self.name}.concurrency_decreases')
+            else:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+            if not overloaded:
+                self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+            self._cond.notify_all()
+
+    def wake(self):
+        """Let queued callers re-check their cancel events"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            self._refill()
+            return {
+                'queue_depth': self._waiting,
+                'in_flight': self._in_flight,
+                'concurrency_limit': round(self._limit, 2),
+                'requests_available': round(self._requests, 2),
+                'tokens_available': round(self._tokens),
+                'latency_ewma': round(self._latency_ewma, 3) if self._latency_ewma is not None else None,
+            }
+
 class Project(BaseModel):
     project_name: str
     about_project: str
@@ -74,59 +625,1508 @@ class Candidate(BaseModel):
     Position_of_Responsibility: List[Position_of_Responsibility]
     Contact_Info: dict
 
-def get_all_info(info: str) -> Candidate:
+class PromptTemplate:
+    """One registered prompt: fixed instructions plus a template for the
+    per-request part, identified as ``name@vversion``.
+
+    The instructions are built once and always sent first, byte for byte,
+    so providers that cache prompt prefixes can reuse them. Only the text
+    rendered from ``user_template`` varies between requests.
+    """
+
+    def __init__(self, name: str, version: int, instructions: str, user_template: str,
+                 model: str = None, temperature: float = 0, json_output: bool = False):
+        self.name = name
+        self.version = version
+        self.id = f'{name}@v{version}'
+        self.instructions = instructions
+        self.user_template = user_template
+        self.model = model
+        self.temperature = temperature
+        self.json_output = json_output
+        self.prefix_hash = hashlib.sha256(instructions.encode('utf-8')).hexdigest()[:12]
+
+    def messages(self, **values) -> list:
+        return [
+            {"role": "system", "content": self.instructions},
+            {"role": "user", "content": self.user_template.format(**values)},
+        ]
+
+    def text(self, **values) -> str:
+        """Single-string form for providers without a system role"""
+        return f"{self.instructions}\n\n{self.user_template.format(**values)}"
+
+PROMPTS = {}
+
+def register_prompt(prompt: PromptTemplate) -> PromptTemplate:
+    PROMPTS[prompt.name] = prompt
+    return prompt
+
+GROQ_EXTRACTION_MODEL = "llama-3.3-70b-versatile"
+# Minified once at import; key order is fixed so the bytes never change between calls
+CANDIDATE_SCHEMA_JSON = json.dumps(Candidate.model_json_schema(), separators=(',', ':'), sort_keys=True)
+
+register_prompt(PromptTemplate(
+    'summarise', 1,
+    """You are an expert at extracting professional information from portfolio websites and converting it into a structured resume format that matches industry standards.
+
+Based on the portfolio data provided, extract and structure the following information in a professional resume format:
+
+1. NAME: Full name of the person
+2. TITLE: Current role or title (e.g., Full Stack Developer, Frontend Developer, Software Engineer)
+3. CONTACT: Email, phone, location, LinkedIn, GitHub, portfolio URL
+4. ABOUT: Professional summary or objective (2-3 sentences about career goals, expertise, and what you bring to the table)
+5. EDUCATION: Institution name, degree, year, GPA if mentioned
+6. SKILLS: Technical skills organized by category (Frontend, Backend, Database, Tools & DevOps)
+7. PROJECTS: Project names, descriptions, technologies used, GitHub links, live demo links
+8. EXPERIENCE: Work experience, internships, positions held with company names and durations
+9. ACHIEVEMENTS: Certifications, awards, notable accomplishments
+
+Format the response as a comprehensive, professional resume summary that follows industry standards and is ready for LaTeX resume generation. If information is missing, make reasonable assumptions based on the context and portfolio content.
+
+Example format:
+NAME: [Full Name]
+TITLE: [Current Position - e.g., Full Stack Developer]
+CONTACT: [Email, Phone, Location, LinkedIn, GitHub]
+ABOUT: [Professional summary about career goals and expertise - 2-3 sentences]
+EDUCATION: [Institution, Degree, Year, GPA]
+SKILLS: [Organized by Frontend, Backend, Database, Tools & DevOps]
+PROJECTS: [Detailed project descriptions with technologies and links]
+EXPERIENCE: [Work experience with company names and durations]
+ACHIEVEMENTS: [Certifications and awards]
+
+Ensure the extracted data is professional, well-structured, and ready for high-quality resume generation.""",
+    "Extract and structure resume information from this portfolio data for professional resume generation:\n\n{portfolio_text}",
+    model=GROQ_EXTRACTION_MODEL, temperature=0.1,
+))
+register_prompt(PromptTemplate(
+    'parse', 1,
+    "You are a resume parser that extracts information from resume.\n"
+    f"The JSON object must use the schema: {CANDIDATE_SCHEMA_JSON}",
+    "use this {info}",
+    model=GROQ_EXTRACTION_MODEL, json_output=True,
+))
+register_prompt(PromptTemplate(
+    'single_pass', 1,
+    "You extract professional resume information from scraped portfolio websites.\n"
+    "Use only facts present in the portfolio data: full name, contact details (email, phone, "
+    "location, LinkedIn, GitHub), technical skills, projects with the technologies used, work "
+    "experience, education and achievements. Use empty strings or empty lists for anything missing.\n"
+    f"The JSON object must use the schema: {CANDIDATE_SCHEMA_JSON}",
+    "Extract the resume information from this portfolio data:\n\n{portfolio_text}",
+    model=GROQ_EXTRACTION_MODEL, json_output=True,
+))
+register_prompt(PromptTemplate(
+    'fill_sections', 1,
+    "You complete a resume that was partly built from a scraped portfolio website.\n"
+    "Return a JSON object with only the requested keys, using only facts present in the portfolio "
+    "data. Use empty strings or empty lists for anything missing.\n"
+    f"Each key has the shape it has in this schema: {CANDIDATE_SCHEMA_JSON}",
+    "Requested keys: {sections}\n\nPortfolio data:\n{portfolio_text}",
+    model=GROQ_EXTRACTION_MODEL, json_output=True,
+))
+register_prompt(PromptTemplate(
+    'modify_component', 2,
+    "You are a web developer editing HTML components of a generated portfolio website.\n"
+    "Each component below has a number, a type, the user's instructions and its current HTML. Follow "
+    "the instructions while keeping the same structure, CSS classes and data-component attributes.\n"
+    "Answer with one section per component, in order, each starting with the line \"=== component N ===\".\n"
+    "For a small edit give only the changed parts, as one or more blocks of the form:\n"
+    "<<<<<<< SEARCH\n"
+    "lines copied exactly from the current HTML\n"
+    "=======\n"
+    "replacement lines\n"
+    ">>>>>>> REPLACE\n"
+    "Each SEARCH text must match the current HTML exactly once. When most of a component changes, "
+    "give its complete modified HTML instead. No explanations and no markdown.",
+    "{components}",
+))
+
+def record_llm_usage(stage: str, chat_completion, elapsed: float):
+    """Count and log calls, latency and token usage per stage (the prompt id
+    for registered prompts, so prompt versions can be compared)"""
+    prompt_tokens = completion_tokens = None
+    usage = getattr(chat_completion, 'usage', None)
+    if isinstance(chat_completion, dict):
+        # Streamed completions report usage in the final chunk's x_groq dict
+        usage = chat_completion.get('usage')
+    if isinstance(usage, dict):
+        prompt_tokens, completion_tokens = usage.get('prompt_tokens'), usage.get('completion_tokens')
+    elif usage:
+        prompt_tokens, completion_tokens = usage.prompt_tokens, usage.completion_tokens
+    usage_metadata = getattr(chat_completion, 'usage_metadata', None)
+    if usage_metadata:
+        # Gemini reports usage under different names
+        prompt_tokens = getattr(usage_metadata, 'prompt_token_count', None)
+        completion_tokens = getattr(usage_metadata, 'candidates_token_count', None)
+    
+    metrics.incr(f'llm.{stage}.calls')
+    metrics.observe(f'llm.{stage}.seconds', elapsed)
+    metrics.incr(f'llm.{stage}.prompt_tokens', prompt_tokens or 0)
+    metrics.incr(f'llm.{stage}.completion_tokens', completion_tokens or 0)
+    if completion_tokens is not None:
+        metrics.observe(f'llm.{stage}.completion_tokens_per_call', completion_tokens)
+    print(f"🤖 {stage}: {elapsed:.2f}s, {prompt_tokens or '?'} prompt + {completion_tokens or '?'} completion tokens")
+
+def completion_token_estimate(stage: str) -> int:
+    """Tokens to reserve for a call's completion in the rate limiter: the
+    stage's observed average plus 20% headroom, or LLM_COMPLETION_TOKEN_ESTIMATE
+    until the stage has reported usage"""
+    observed = metrics.average(f'llm.{stage}.completion_tokens_per_call')
+    return round(observed * 1.2) if observed else LLM_COMPLETION_TOKEN_ESTIMATE
+
+def prompt_stats() -> dict:
+    """Per registered prompt: version id, prefix fingerprint and usage so far"""
+    snapshot = metrics.snapshot()
+    counters, observations = snapshot['counters'], snapshot['observations']
+    stats = {}
+    for prompt in PROMPTS.values():
+        calls = counters.get(f'llm.{prompt.id}.calls', 0)
+        stats[prompt.name] = {
+            'id': prompt.id,
+            'prefix_hash': prompt.prefix_hash,
+            'prefix_tokens': estimate_tokens(prompt.instructions),
+            'calls': calls,
+            'avg_seconds': observations.get(f'llm.{prompt.id}.seconds', {}).get('avg', 0.0),
+            'avg_prompt_tokens': counters.get(f'llm.{prompt.id}.prompt_tokens', 0) / calls if calls else 0.0,
+            'avg_completion_tokens': counters.get(f'llm.{prompt.id}.completion_tokens', 0) / calls if calls else 0.0,
+        }
+    return stats
+
+llm_cache = LlmResponseCache(
+    DiskCache(LLM_CACHE_DIR, LLM_CACHE_MAX_BYTES, ttl=LLM_CACHE_TTL),
+    LLM_CACHE_MEMORY_ENTRIES
+) if LLM_CACHE_ENABLED else None
+
+# Set per request from LLM_CACHE_BYPASS_HEADER; worker threads get it via copy_context()
+llm_cache_bypass = contextvars.ContextVar('llm_cache_bypass', default=False)
+
+def _cached_llm_text(stage: str, key_parts: tuple, call, validate=None) -> str:
+    """Serve a model response from llm_cache or run ``call`` and store it.
+
+    ``key_parts`` must cover everything that changes the output: provider,
+    model, messages/prompt, schema and temperature. ``call`` returns the
+    response text. When ``validate`` is given it must accept the text (or
+    raise) before the response is cached or returned, so a malformed reply
+    is retried on the next request instead of being replayed.
+    """
+    if llm_cache is None:
+        text = call()
+        if validate:
+            validate(text)
+        return text
+    
+    key = DiskCache.make_key('llm', *key_parts)
+    if llm_cache_bypass.get():
+        metrics.incr('llm_cache.bypassed')
+    else:
+        cached, tier = llm_cache.get(key)
+        if cached is not None:
+            metrics.incr(f'llm_cache.{tier}_hits')
+            metrics.incr(f'llm_cache.{stage}.hits')
+            metrics.incr('llm_cache.seconds_saved', cached['seconds'])
+            return cached['text']
+        metrics.incr('llm_cache.misses')
+        metrics.incr(f'llm_cache.{stage}.misses')
+    
+    call_start = time.perf_counter()
+    text = call()
+    if validate:
+        validate(text)
+    evicted = llm_cache.set(key, {'text': text, 'seconds': time.perf_counter() - call_start})
+    metrics.incr('llm_cache.evictions', evicted)
+    return text
+
+groq_limiter = ProviderLimiter('groq', GROQ_REQUESTS_PER_MINUTE, GROQ_TOKENS_PER_MINUTE,
+                               LLM_MAX_CONCURRENCY, LLM_MAX_QUEUE, LLM_MAX_WAIT)
+gemini_limiter = ProviderLimiter('gemini', GEMINI_REQUESTS_PER_MINUTE, GEMINI_TOKENS_PER_MINUTE,
+                                 LLM_MAX_CONCURRENCY, LLM_MAX_QUEUE, LLM_MAX_WAIT)
+# Latency of calls that reached the provider (cache hits are not counted)
+provider_latency = {
+    'groq': LatencyHistogram(LLM_LATENCY_WINDOW),
+    'gemini': LatencyHistogram(LLM_LATENCY_WINDOW),
+}
+llm_hedge_executor = ThreadPoolExecutor(max_workers=2 * LLM_MAX_CONCURRENCY, thread_name_prefix='llm-hedge')
+
+# Set in a worker's context to abandon its model call while it is still queued
+llm_call_cancelled = contextvars.ContextVar('llm_call_cancelled', default=None)
+
+# Rate limiting, overload, 5xx and transport failures; retried with backoff
+RETRYABLE_LLM_ERRORS = (
+    groq.RateLimitError, groq.InternalServerError, groq.APIConnectionError,
+    google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError, google_exceptions.DeadlineExceeded,
+)
+THROTTLE_LLM_ERRORS = (groq.RateLimitError, google_exceptions.ResourceExhausted)
+
+def _llm_retry_delay(attempt: int, error: Exception) -> float:
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None and hasattr(response, 'headers') else None
+    delay = min(LLM_RETRY_BACKOFF * (2 ** attempt), LLM_RETRY_MAX_BACKOFF) * random.uniform(0.5, 1.5)
     try:
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a resume parser that extracts information from resume.\n"
-                    f" The JSON object must use the schema: {json.dumps(Candidate.model_json_schema(), indent=2)}",
-                },
-                {
-                    "role": "user",
-                    "content": f"use this {info}",
-                },
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0,
-            stream=False,
-            response_format={"type": "json_object"},
-        )
-        return Candidate.model_validate_json(chat_completion.choices[0].message.content)
+        return max(delay, min(float(retry_after), LLM_RETRY_MAX_BACKOFF))
+    except (TypeError, ValueError):
+        return delay
+
+def call_llm_provider(limiter: ProviderLimiter, estimated_tokens: int, call, retryable=lambda: True):
+    """Run ``call`` under ``limiter`` with retries.
+
+    ``call`` returns ``(result, used_tokens)``. Retryable provider errors are
+    retried up to LLM_RETRY_TOTAL times with exponential backoff and jitter,
+    waiting at least as long as a Retry-After header asks, while
+    ``retryable()`` allows it (a stream that already forwarded output does
+    not). Throttling that outlasts the retries becomes ProviderBusyError.
+    A call whose llm_call_cancelled event is set stops before its next
+    attempt with LlmCallCancelled.
+    """
+    cancel = llm_call_cancelled.get()
+    for attempt in range(LLM_RETRY_TOTAL + 1):
+        if cancel is not None and cancel.is_set():
+            raise LlmCallCancelled(f'{limiter.name} call cancelled')
+        limiter.acquire(estimated_tokens, cancel=cancel)
+        call_start = time.perf_counter()
+        try:
+            result, used_tokens = call()
+        except RETRYABLE_LLM_ERRORS as e:
+            # A rejected call is not billed, so its token estimate is refunded
+            limiter.release(time.perf_counter() - call_start, estimated_tokens, used_tokens=0, overloaded=True)
+            throttled = isinstance(e, THROTTLE_LLM_ERRORS)
+            if throttled:
+                metrics.incr(f'llm_limiter.{limiter.name}.provider_throttled')
+            if attempt == LLM_RETRY_TOTAL or not retryable():
+                if throttled:
+                    raise ProviderBusyError(f'{limiter.name} is rate limiting requests', retry_after=_llm_retry_delay(attempt, e)) from e
+                raise
+            metrics.incr(f'llm_limiter.{limiter.name}.retries')
+            if cancel is not None:
+                cancel.wait(_llm_retry_delay(attempt, e))
+            else:
+                time.sleep(_llm_retry_delay(attempt, e))
+        except Exception:
+            limiter.release(time.perf_counter() - call_start, estimated_tokens)
+            raise
+        else:
+            limiter.release(time.perf_counter() - call_start, estimated_tokens, used_tokens)
+            return result
+
+def _total_tokens(usage) -> int:
+    if isinstance(usage, dict):
+        return (usage.get('prompt_tokens') or 0) + (usage.get('completion_tokens') or 0) or None
+    return getattr(usage, 'total_tokens', None) if usage else None
+
+def groq_chat_completion(stage: str, validate=None, on_delta=None, **params) -> str:
+    """Run a Groq chat completion through the response cache and return its text.
+
+    With ``on_delta`` the completion is requested with ``stream=True`` and
+    each content delta is passed to it as it arrives. JSON-mode calls are
+    not streamed by Groq, and cached responses have nothing left to stream,
+    so in those cases ``on_delta`` receives the whole text once.
+    """
+    stream = on_delta is not None and 'response_format' not in params
+    streamed = []
+    forwarded = []
+    estimated_tokens = estimate_tokens(json.dumps(params.get('messages'))) + completion_token_estimate(stage)
+    
+    def attempt():
+        call_start = time.perf_counter()
+        if not stream:
+            chat_completion = groq_client.chat.completions.create(**params)
+            provider_latency['groq'].observe(time.perf_counter() - call_start)
+            record_llm_usage(stage, chat_completion, time.perf_counter() - call_start)
+            return chat_completion.choices[0].message.content, _total_tokens(getattr(chat_completion, 'usage', None))
+        
+        parts = []
+        last_chunk = None
+        for chunk in groq_client.chat.completions.create(**{**params, 'stream': True}):
+            last_chunk = chunk
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                forwarded.append(True)
+                on_delta(delta)
+        streamed.append(True)
+        provider_latency['groq'].observe(time.perf_counter() - call_start)
+        x_groq = getattr(last_chunk, 'x_groq', None)
+        record_llm_usage(stage, x_groq, time.perf_counter() - call_start)
+        return ''.join(parts), _total_tokens(x_groq.get('usage') if isinstance(x_groq, dict) else None)
+    
+    def call():
+        return call_llm_provider(groq_limiter, estimated_tokens, attempt, retryable=lambda: not forwarded)
+    
+    key_params = {name: value for name, value in params.items() if name != 'stream'}
+    text = _cached_llm_text(stage, ('groq', key_params), call, validate)
+    if on_delta is not None and not streamed:
+        on_delta(text)
+    return text
+
+JSON_FENCE = re.compile(r'^\s*```(?:json)?\s*\n(.*?)\n?\s*```\s*$', re.DOTALL | re.IGNORECASE)
+
+def gemini_generate_text(stage: str, prompt: str, validate=None, json_output: bool = False) -> str:
+    """Run a Gemini prompt through the response cache and return its text.
+
+    gemini-pro has no JSON mode, so with ``json_output`` the prompt's own
+    instructions carry the format and a markdown fence around the reply is
+    removed; ``validate`` still decides whether the JSON is usable.
+    """
+    def attempt():
+        call_start = time.perf_counter()
+        response = gemini_model.generate_content(prompt)
+        provider_latency['gemini'].observe(time.perf_counter() - call_start)
+        record_llm_usage(stage, response, time.perf_counter() - call_start)
+        usage_metadata = getattr(response, 'usage_metadata', None)
+        text = response.text
+        if json_output:
+            fenced = JSON_FENCE.match(text)
+            text = fenced.group(1) if fenced else text
+        return text, getattr(usage_metadata, 'total_token_count', None)
+    
+    def call():
+        estimated_tokens = estimate_tokens(prompt) + completion_token_estimate(stage)
+        return call_llm_provider(gemini_limiter, estimated_tokens, attempt)
+    
+    key_parts = ('gemini', gemini_model.model_name, prompt) + (('json',) if json_output else ())
+    return _cached_llm_text(stage, key_parts, call, validate)
+
+def run_prompt(name: str, on_delta=None, validate=None, **values) -> str:
+    """Render a registered Groq prompt and run it; metrics use the prompt id"""
+    prompt = PROMPTS[name]
+    params = {}
+    if prompt.json_output:
+        params['response_format'] = {"type": "json_object"}
+    return groq_chat_completion(
+        prompt.id,
+        validate=validate,
+        on_delta=on_delta,
+        messages=prompt.messages(**values),
+        model=prompt.model,
+        temperature=prompt.temperature,
+        stream=False,
+        **params
+    )
+
+LLM_PROVIDERS = ('groq', 'gemini')
+
+def run_prompt_on(provider: str, name: str, validate=None, **values) -> str:
+    """Run a registered prompt on either provider; Gemini gets the
+    single-string form of the same prompt"""
+    if provider == 'gemini':
+        prompt = PROMPTS[name]
+        return gemini_generate_text(prompt.id, prompt.text(**values), validate=validate, json_output=prompt.json_output)
+    return run_prompt(name, validate=validate, **values)
+
+def _run_hedge_leg(cancel: threading.Event, provider: str, name: str, validate, values: dict) -> str:
+    llm_call_cancelled.set(cancel)
+    return run_prompt_on(provider, name, validate=validate, **values)
+
+def hedge_delay(provider: str) -> float:
+    """How long to wait on ``provider`` before firing the backup request"""
+    histogram = provider_latency[provider]
+    if histogram.count < LLM_HEDGE_MIN_SAMPLES:
+        return LLM_HEDGE_DEFAULT_DELAY
+    return max(LLM_HEDGE_MIN_DELAY, histogram.quantile(LLM_HEDGE_QUANTILE))
+
+def run_prompt_hedged(name: str, validate, on_delta=None, **values) -> str:
+    """Run a registered prompt on the primary provider, hedged by the other.
+
+    The backup request is fired when the primary errors (failover) or is
+    still running after hedge_delay(). The first response that passes
+    ``validate`` wins. The loser is cancelled if it is still queued or
+    between retries; a request already sent cannot be interrupted, so its
+    response is discarded when it arrives.
+    """
+    if not LLM_HEDGE_ENABLED:
+        return run_prompt(name, on_delta=on_delta, validate=validate, **values)
+    
+    primary = LLM_HEDGE_PRIMARY
+    backup = next(provider for provider in LLM_PROVIDERS if provider != primary)
+    futures = {}
+    cancels = {}
+    errors = {}
+    
+    def start(provider):
+        # Copy the context so the cache bypass flag reaches the worker thread
+        context = contextvars.copy_context()
+        cancels[provider] = threading.Event()
+        futures[llm_hedge_executor.submit(context.run, _run_hedge_leg, cancels[provider], provider, name, validate, values)] = provider
+    
+    metrics.incr('llm_hedge.calls')
+    hedge_at = time.monotonic() + hedge_delay(primary)
+    start(primary)
+    while futures:
+        timeout = None if backup in futures.values() or backup in errors else max(0.0, hedge_at - time.monotonic())
+        done, _ = wait(list(futures), timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            provider = futures.pop(future)
+            try:
+                text = future.result()
+            except Exception as e:
+                print(f"⚠️ {provider} failed for {PROMPTS[name].id}: {str(e)}")
+                errors[provider] = e
+                continue
+            for loser, loser_provider in futures.items():
+                loser.cancel()
+                cancels[loser_provider].set()
+                metrics.incr('llm_hedge.cancelled')
+            if futures:
+                for limiter in (groq_limiter, gemini_limiter):
+                    limiter.wake()
+            if provider != primary:
+                metrics.incr('llm_hedge.backup_wins')
+                print(f"🏁 {provider} answered {PROMPTS[name].id} first")
+            if on_delta is not None:
+                on_delta(text)
+            return text
+        
+        if backup not in futures.values() and backup not in errors:
+            if primary in errors:
+                metrics.incr('llm_hedge.failovers')
+                print(f"🔀 Failing over {PROMPTS[name].id} to {backup}")
+                start(backup)
+            elif time.monotonic() >= hedge_at:
+                metrics.incr('llm_hedge.hedged')
+                print(f"🔀 {primary} slower than {hedge_delay(primary):.1f}s, hedging {PROMPTS[name].id} on {backup}")
+                start(backup)
+    
+    raise errors.get(primary) or errors[backup]
+
+def get_all_info(info: str, on_delta=None) -> Candidate:
+    try:
+        content = run_prompt_hedged('parse', Candidate.model_validate_json, on_delta=on_delta, info=info)
+        return Candidate.model_validate_json(content)
     except Exception as e:
         print(f"Error in resume parsing: {str(e)}")
         raise e
 
-def scrape_portfolio(url: str) -> str:
-    """Scrape portfolio website and extract relevant information for professional resume"""
+def extract_candidate_from_portfolio(portfolio_text: str, on_delta=None) -> Candidate:
+    """Single-pass extraction: portfolio text straight to a validated Candidate"""
+    try:
+        content = run_prompt_hedged('single_pass', Candidate.model_validate_json, on_delta=on_delta, portfolio_text=portfolio_text)
+        return Candidate.model_validate_json(content)
+    except Exception as e:
+        print(f"Error in single-pass portfolio extraction: {str(e)}")
+        raise e
+
+def _merge_filled_sections(candidate: Candidate, sections: List[str], content: str) -> Candidate:
+    filled = json.loads(content)
+    if not isinstance(filled, dict):
+        raise ValueError("expected a JSON object")
+    merged = candidate.model_dump()
+    for section in sections:
+        if section == 'Contact_Info' and isinstance(filled.get(section), dict):
+            # Keep the contact details the scraper did find
+            merged[section] = {**filled[section], **{key: value for key, value in merged[section].items() if value}}
+        elif section in filled:
+            merged[section] = filled[section]
+    return Candidate.model_validate(merged)
+
+def fill_missing_sections(candidate: Candidate, sections: List[str], portfolio_text: str, on_delta=None) -> Candidate:
+    """Ask the model for only the sections the rule-based builder left
+    empty. On a failed or malformed response the candidate is kept as is."""
+    merge = lambda content: _merge_filled_sections(candidate, sections, content)
+    try:
+        content = run_prompt('fill_sections', on_delta=on_delta, validate=merge,
+                             sections=', '.join(sections), portfolio_text=portfolio_text)
+        return merge(content)
+    except (ConversionCancelled, ProviderBusyError):
+        raise
+    except Exception as e:
+        print(f"⚠️ Could not fill missing sections ({', '.join(sections)}): {str(e)}")
+        return candidate
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every skill alias in the taxonomy.
+
+    One linear scan of the text finds all aliases at once, so matching cost
+    does not grow with the size of the taxonomy. Matches must sit on word
+    boundaries ("java" does not match inside "javascript") and each match
+    carries its canonical skill name and taxonomy category.
+
+    Aliases of SHORT_ALIAS_LENGTH characters or fewer ("Go", "R", "ts") are
+    ordinary words or stray letters in prose, so they only match in the
+    taxonomy's case or all caps and not as the first word of a sentence,
+    and single letters ("C") only as a list item: between separators such
+    as commas or slashes, or on their own.
+    """
+
+    SHORT_ALIAS_LENGTH = 2
+    LIST_SEPARATORS = set(',;:/|()[]\n\r•·')
+
+    def __init__(self, taxonomy: dict):
+        self.categories = list(taxonomy)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for category, skills in taxonomy.items():
+            for canonical, aliases in skills.items():
+                for alias in dict.fromkeys([canonical, *aliases]):
+                    self._add(alias, canonical, category)
+        self._build_failure_links()
+
+    def _add(self, alias: str, canonical: str, category: str):
+        exact = alias if len(alias) <= self.SHORT_ALIAS_LENGTH else None
+        alias = alias.lower()
+        state = 0
+        for char in alias:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        # The first category in taxonomy order wins for duplicate aliases
+        if not any(length == len(alias) for length, _, _, _ in self._output[state]):
+            self._output[state].append((len(alias), canonical, category, exact))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum()
+
+    @staticmethod
+    def _starts_sentence(text: str, start: int, end: int) -> bool:
+        """First word of a sentence that runs on in lowercase, as in 'Go check out my work'"""
+        before = text[:start].rstrip()[-1:]
+        return (not before or before in '.!?') and bool(re.match(r'\s+[a-z]', text[end:]))
+
+    def _is_list_item(self, text: str, start: int, end: int) -> bool:
+        before = text[:start].rstrip(' \t')[-1:]
+        after = text[end:].lstrip(' \t')[:1]
+        return (not before or before in self.LIST_SEPARATORS) and (not after or after in self.LIST_SEPARATORS)
+
+    def finditer(self, text: str):
+        """Yield (start, end, canonical, category) for every alias on word boundaries"""
+        lowered = text.lower()
+        state = 0
+        for end, char in enumerate(lowered, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, canonical, category, exact in self._output[state]:
+                start = end - length
+                if self._is_word_char(lowered[start]) and start > 0 and self._is_word_char(lowered[start - 1]):
+                    continue
+                if self._is_word_char(lowered[end - 1]) and end < len(lowered) and self._is_word_char(lowered[end]):
+                    continue
+                if exact is not None and (text[start:end] not in (exact, exact.upper()) or self._starts_sentence(text, start, end)):
+                    continue
+                if length == 1 and not self._is_list_item(text, start, end):
+                    continue
+                yield start, end, canonical, category
+
+    def find(self, text: str) -> list:
+        """Return leftmost-longest, non-overlapping (canonical, category) matches"""
+        matches = sorted(self.finditer(text), key=lambda match: (match[0], match[0] - match[1]))
+        result = []
+        covered_until = 0
+        for start, end, canonical, category in matches:
+            if start >= covered_until:
+                result.append((canonical, category))
+                covered_until = end
+        return result
+
+    def category_of(self, text: str):
+        """Return the highest-priority taxonomy category found in ``text``, or None"""
+        found = {category for _, _, _, category in self.finditer(text)}
+        for category in self.categories:
+            if category in found:
+                return category
+        return None
+
+def load_skill_taxonomy(path: str = SKILL_TAXONOMY_PATH) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Built once at startup and shared by scraping, categorisation and titling
+skill_matcher = SkillMatcher(load_skill_taxonomy())
+
+# Taxonomy categories that are folded together in the resume skill sections
+SKILL_CATEGORY_SECTIONS = {
+    'Frontend': 'Frontend',
+    'Backend': 'Backend',
+    'Data Science': 'Data Science',
+    'Database': 'Database',
+    'DevOps': 'DevOps & Tools',
+    'Tools': 'DevOps & Tools',
+}
+
+# Section selectors used by scrape_portfolio, in priority order
+NAME_SELECTORS = [
+    'h1', '.name', '#name', '[class*="name"]', '[id*="name"]',
+    '.hero h1', '.header h1', '.intro h1', '.profile h1',
+    '.title h1', '.main-title', '.hero-title'
+]
+
+TITLE_SELECTORS = [
+    'h2', '.title', '#title', '[class*="title"]', '[id*="title"]',
+    '.role', '.position', '.job-title', '.profession',
+    '.hero h2', '.header h2', '.intro h2', '.profile h2',
+    '.subtitle', '.tagline', '.description'
+]
+
+SKILL_SELECTORS = [
+    '.skills', '#skills', '[class*="skill"]', '[id*="skill"]',
+    '.technologies', '.tech-stack', '.tools', '.languages',
+    '.frontend', '.backend', '.database', '.frameworks'
+]
+
+PROJECT_SELECTORS = [
+    '.project', '#project', '[class*="project"]', '[id*="project"]',
+    '.portfolio-item', '.work-item', '.case-study', '.app',
+    '.card', '.item', '.work', '.portfolio'
+]
+
+EDUCATION_SELECTORS = [
+    '.education', '#education', '[class*="education"]', '[id*="education"]',
+    '.academic', '.degree', '.university', '.college', '.school'
+]
+
+ABOUT_SELECTORS = [
+    '.about', '#about', '[class*="about"]', '[id*="about"]',
+    '.intro', '.summary', '.bio', '.description', '.profile'
+]
+
+EXPERIENCE_SELECTORS = [
+    '.experience', '#experience', '[class*="experience"]', '[id*="experience"]',
+    '.work', '.employment', '.career', '.job', '.position'
+]
+
+class PortfolioDomIndex:
+    """Single-pass index of a parsed portfolio page.
+
+    The tree is walked once and every element is bucketed by tag name, id and
+    class token. Selector lookups (including ``[class*=...]``/``[id*=...]``
+    substring matches and descendant selectors like ``.hero h1``) are then
+    answered from the buckets instead of a full traversal per selector.
+    Anything outside that selector subset falls back to ``soup.select``.
+    """
+
+    _COMPOUND_PART = re.compile(
+        r'\.(?P<cls>[\w-]+)'
+        r'|#(?P<id>[\w-]+)'
+        r'|\[(?P<attr>class|id)\*=(?P<quote>["\']?)(?P<needle>[^"\'\]]+)(?P=quote)\]'
+    )
+    _TAG = re.compile(r'[a-zA-Z][a-zA-Z0-9-]*')
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.elements = []
+        self.position = {}
+        self.subtree_end = []
+        self.by_tag = {}
+        self.by_id = {}
+        self.by_class = {}
+        self._substring_cache = {}
+        self._select_cache = {}
+
+        for elem in soup.descendants:
+            if not isinstance(elem, Tag):
+                continue
+            pos = len(self.elements)
+            self.elements.append(elem)
+            self.position[id(elem)] = pos
+            self.subtree_end.append(pos)
+            self.by_tag.setdefault(elem.name, []).append(elem)
+            elem_id = elem.get('id')
+            if elem_id:
+                self.by_id.setdefault(elem_id, []).append(elem)
+            for cls in elem.get('class') or []:
+                bucket = self.by_class.setdefault(cls, [])
+                # class="card card" must not index the element twice
+                if not bucket or bucket[-1] is not elem:
+                    bucket.append(elem)
+
+        # Children come after their parent in document order, so a reverse
+        # sweep is enough to propagate the last descendant position upwards
+        for pos in range(len(self.elements) - 1, -1, -1):
+            parent_pos = self.position.get(id(self.elements[pos].parent))
+            if parent_pos is not None and self.subtree_end[pos] > self.subtree_end[parent_pos]:
+                self.subtree_end[parent_pos] = self.subtree_end[pos]
+
+    def contains(self, outer, inner) -> bool:
+        """Return True if ``inner`` is a strict descendant of ``outer``"""
+        outer_pos = self.position[id(outer)]
+        inner_pos = self.position[id(inner)]
+        return outer_pos < inner_pos <= self.subtree_end[outer_pos]
+
+    def _parse_compound(self, compound: str):
+        tag_match = self._TAG.match(compound)
+        parsed = {'tag': None, 'classes': [], 'ids': [], 'class_subs': [], 'id_subs': []}
+        offset = 0
+        if tag_match:
+            parsed['tag'] = tag_match.group().lower()
+            offset = tag_match.end()
+        while offset < len(compound):
+            part = self._COMPOUND_PART.match(compound, offset)
+            if not part:
+                return None
+            if part.group('cls'):
+                parsed['classes'].append(part.group('cls'))
+            elif part.group('id'):
+                parsed['ids'].append(part.group('id'))
+            elif part.group('attr') == 'class':
+                parsed['class_subs'].append(part.group('needle'))
+            else:
+                parsed['id_subs'].append(part.group('needle'))
+            offset = part.end()
+        return parsed
+
+    def _substring_bucket(self, attr: str, needle: str) -> list:
+        key = (attr, needle)
+        if key not in self._substring_cache:
+            buckets = self.by_class if attr == 'class' else self.by_id
+            # The token vocabulary is far smaller than the tree, so scan it
+            # once per needle and merge the matching buckets
+            seen = set()
+            matched = []
+            for token, elems in buckets.items():
+                if needle in token:
+                    for elem in elems:
+                        if id(elem) not in seen:
+                            seen.add(id(elem))
+                            matched.append(elem)
+            matched.sort(key=lambda elem: self.position[id(elem)])
+            self._substring_cache[key] = matched
+        return self._substring_cache[key]
+
+    @staticmethod
+    def _matches(elem, parsed) -> bool:
+        if parsed['tag'] and elem.name != parsed['tag']:
+            return False
+        classes = elem.get('class') or []
+        if any(cls not in classes for cls in parsed['classes']):
+            return False
+        if any(all(needle not in cls for cls in classes) for needle in parsed['class_subs']):
+            return False
+        elem_id = elem.get('id') or ''
+        if any(elem_id != wanted for wanted in parsed['ids']):
+            return False
+        if any(needle not in elem_id for needle in parsed['id_subs']):
+            return False
+        return True
+
+    def _select_compound(self, parsed) -> list:
+        # Start from the smallest bucket the compound can be answered from
+        if parsed['ids']:
+            candidates = self.by_id.get(parsed['ids'][0], [])
+        elif parsed['classes']:
+            candidates = self.by_class.get(parsed['classes'][0], [])
+        elif parsed['class_subs']:
+            candidates = self._substring_bucket('class', parsed['class_subs'][0])
+        elif parsed['id_subs']:
+            candidates = self._substring_bucket('id', parsed['id_subs'][0])
+        elif parsed['tag']:
+            return self.by_tag.get(parsed['tag'], [])
+        else:
+            return []
+        return [elem for elem in candidates if self._matches(elem, parsed)]
+
+    def select(self, selector: str) -> list:
+        """Return all elements matching ``selector`` in document order"""
+        if selector in self._select_cache:
+            return self._select_cache[selector]
+
+        compounds = [self._parse_compound(part) for part in selector.split()]
+        if not compounds or any(parsed is None for parsed in compounds):
+            result = self.soup.select(selector)
+        else:
+            result = self._select_compound(compounds[0])
+            # Descendant combinators: keep elements with a matching ancestor
+            for parsed in compounds[1:]:
+                ancestor_ids = {id(elem) for elem in result}
+                result = [
+                    elem for elem in self._select_compound(parsed)
+                    if any(id(parent) in ancestor_ids for parent in elem.parents)
+                ]
+        self._select_cache[selector] = result
+        return result
+
+    def select_one(self, selector: str):
+        """Return the first element matching ``selector``, or None"""
+        result = self.select(selector)
+        return result[0] if result else None
+
+def _parse_with_html_parser(content: bytes) -> BeautifulSoup:
+    return BeautifulSoup(content, 'html.parser')
+
+def _parse_with_lxml(content: bytes) -> BeautifulSoup:
+    return BeautifulSoup(content, 'lxml')
+
+def _lexbor_tree_builder(tree):
+    from bs4.builder import HTMLTreeBuilder
+    from bs4.element import Comment
+
+    class _LexborTreeBuilder(HTMLTreeBuilder):
+        """Tree builder that copies an already parsed lexbor DOM into
+        BeautifulSoup instead of serialising and re-parsing the markup"""
+
+        def prepare_markup(self, markup, *args, **kwargs):
+            yield markup, None, None, False
+
+        def feed(self, markup):
+            soup = self.soup
+            # Iterative walk: portfolio DOMs can nest deeper than the recursion limit
+            stack = [(tree.root, False)] if tree.root is not None else []
+            while stack:
+                node, closing = stack.pop()
+                if closing:
+                    soup.handle_endtag(node.tag)
+                elif node.is_text_node:
+                    soup.handle_data(node.text_content)
+                elif node.is_comment_node:
+                    soup.endData()
+                    soup.handle_data(node.comment_content or '')
+                    soup.endData(Comment)
+                elif node.is_element_node:
+                    attrs = {name: value or '' for name, value in node.attributes.items()}
+                    soup.handle_starttag(node.tag, None, None, attrs)
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in reversed(list(node.iter(include_text=True))))
+
+    return _LexborTreeBuilder()
+
+def _parse_with_lexbor(content: bytes) -> BeautifulSoup:
+    """Parse with lexbor and build the BeautifulSoup tree from its DOM.
+
+    SPA exports are dominated by inline bundles, styles and SVG that the
+    extractors never look at. lexbor drops them in C, and the slimmed DOM
+    is copied into BeautifulSoup node by node rather than parsed a second
+    time. JSON data scripts and Nuxt 2's ``window.__NUXT__`` state are kept
+    for extract_structured_data.
+    """
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(content)
+    for node in tree.css('script, style, noscript, svg, template, iframe'):
+        if node.tag == 'script' and (
+            'json' in (node.attributes.get('type') or '') or '__NUXT__' in node.text(deep=True)
+        ):
+            continue
+        node.decompose()
+    return BeautifulSoup('', builder=_lexbor_tree_builder(tree))
+
+# name -> (module the backend needs, parse function), in fallback order
+HTML_PARSER_BACKENDS = {
+    'lexbor': ('selectolax', _parse_with_lexbor),
+    'lxml': ('lxml', _parse_with_lxml),
+    'html.parser': (None, _parse_with_html_parser),
+}
+
+def resolve_html_parser_backend(requested: str) -> str:
+    """Return the configured parser backend, or the next installed one"""
+    names = list(HTML_PARSER_BACKENDS)
+    if requested not in HTML_PARSER_BACKENDS:
+        print(f"Unknown HTML_PARSER_BACKEND '{requested}', using html.parser")
+        return 'html.parser'
+    for name in names[names.index(requested):]:
+        module, _ = HTML_PARSER_BACKENDS[name]
+        if module is None or importlib.util.find_spec(module):
+            if name != requested:
+                print(f"HTML parser backend '{requested}' is not installed, falling back to '{name}'")
+            return name
+
+ACTIVE_HTML_PARSER = resolve_html_parser_backend(HTML_PARSER_BACKEND)
+_parse_memory_lock = threading.Lock()
+
+def _measured_parse(build, input_bytes, idle_seconds=lambda: 0.0) -> BeautifulSoup:
+    """Run ``build()`` and record the active backend's parse metrics.
+
+    A sample of parses (HTML_PARSER_MEMORY_SAMPLE_RATE) runs under tracemalloc
+    to record the peak Python heap used to build the tree. tracemalloc is
+    process-wide, so only one parse is traced at a time and traced parses are
+    left out of the timing figures. ``input_bytes()`` and ``idle_seconds()``
+    are read afterwards; time spent idle (waiting for the network) is not
+    parse time.
+    """
+    trace_memory = (
+        random.random() < HTML_PARSER_MEMORY_SAMPLE_RATE
+        and not tracemalloc.is_tracing()
+        and _parse_memory_lock.acquire(blocking=False)
+    )
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
+        soup = build()
+    finally:
+        elapsed = time.perf_counter() - start - idle_seconds()
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _parse_memory_lock.release()
+            metrics.observe(f'scrape.parse.{ACTIVE_HTML_PARSER}.peak_bytes', peak)
+    if not trace_memory:
+        metrics.observe(f'scrape.parse.{ACTIVE_HTML_PARSER}.seconds', elapsed)
+    metrics.observe(f'scrape.parse.{ACTIVE_HTML_PARSER}.input_bytes', input_bytes())
+    return soup
+
+def parse_portfolio_html(content: bytes) -> BeautifulSoup:
+    """Parse a fetched page with the active backend and record parse metrics"""
+    parse = HTML_PARSER_BACKENDS[ACTIVE_HTML_PARSER][1]
+    return _measured_parse(lambda: parse(content), lambda: len(content))
+
+class _StreamingHTMLParserTreeBuilder(HTMLParserTreeBuilder):
+    """html.parser tree builder that pulls markup from a chunk iterator"""
+
+    def __init__(self, chunks, encoding: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chunks = chunks
+        self.encoding = encoding
+
+    def prepare_markup(self, markup, *args, **kwargs):
+        yield markup, self.encoding, None, False
+
+    def feed(self, markup):
+        args, kwargs = self.parser_args
+        parser = BeautifulSoupHTMLParser(*args, **kwargs)
+        parser.soup = self.soup
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        for chunk in self.chunks:
+            parser.feed(decoder.decode(chunk))
+        parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+        parser.already_closed_empty_element = []
+
+def _streaming_lxml_builder(chunks, encoding: str):
+    from bs4.builder import LXMLTreeBuilder
+
+    class _StreamingLXMLTreeBuilder(LXMLTreeBuilder):
+        """lxml tree builder that pulls markup from a chunk iterator"""
+
+        def prepare_markup(self, markup, *args, **kwargs):
+            yield markup, encoding, None, False
+
+        def feed(self, markup):
+            self.parser = self.parser_for(encoding)
+            for chunk in chunks:
+                self.parser.feed(chunk)
+            self.parser.close()
+
+    return _StreamingLXMLTreeBuilder()
+
+# Backends that can build the tree while the page is still downloading
+STREAMING_HTML_BUILDERS = {
+    'lxml': _streaming_lxml_builder,
+    'html.parser': _StreamingHTMLParserTreeBuilder,
+}
+
+_CHARSET_PATTERN = re.compile(rb'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def _detect_encoding(content_type: str, head: bytes) -> str:
+    """Pick the page encoding from the Content-Type header or a <meta> tag"""
+    for source in (content_type.encode('latin-1', 'ignore'), head[:4096]):
+        match = _CHARSET_PATTERN.search(source)
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode('ascii')).name
+            except LookupError:
+                continue
+    return 'utf-8'
+
+class _MeteredChunks:
+    """Chunk iterator that counts bytes and the time spent waiting for them"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.bytes = 0
+        self.wait_seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            chunk = next(self._chunks)
+        finally:
+            self.wait_seconds += time.perf_counter() - start
+        self.bytes += len(chunk)
+        return chunk
+
+def parse_portfolio_html_stream(chunks, content_type: str = '') -> BeautifulSoup:
+    """Parse a page incrementally as its chunks arrive, with the same parse
+    metrics as parse_portfolio_html (download waits are not parse time)"""
+    chunks = iter(chunks)
+    head = next(chunks, b'')
+    encoding = _detect_encoding(content_type, head)
+    source = _MeteredChunks(itertools.chain([head], chunks))
+    builder = STREAMING_HTML_BUILDERS[ACTIVE_HTML_PARSER](source, encoding)
+    soup = _measured_parse(lambda: BeautifulSoup('', builder=builder), lambda: source.bytes, lambda: source.wait_seconds)
+    metrics.incr(f'scrape.parse.{ACTIVE_HTML_PARSER}.incremental')
+    return soup
+
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+
+def _cached_getaddrinfo(host, port, family=0, type=0) -> tuple:
+    """socket.getaddrinfo behind the scraper's TTL cache; returns ``(addresses, cached)``"""
+    key = (host, port, family, type)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+    if cached and cached[0] > now:
+        metrics.incr('http_client.dns_cache_hits')
+        return cached[1], True
+    
+    result = socket.getaddrinfo(host, port, family, type)
+    metrics.incr('http_client.dns_lookups')
+    if HTTP_DNS_CACHE_TTL > 0:
+        with _dns_cache_lock:
+            if len(_dns_cache) >= 4096:
+                _dns_cache.clear()
+            _dns_cache[key] = (now + HTTP_DNS_CACHE_TTL, result)
+    return result, False
+
+def _forget_dns(host, port, family=0, type=0):
+    with _dns_cache_lock:
+        _dns_cache.pop((host, port, family, type), None)
+
+class _CachedDnsConnectionMixin:
+    """Resolve the host through the scraper's DNS cache before connecting.
+
+    Only the scraping pool's connections use the cache; the rest of the
+    process (model SDKs, SMTP) resolves names as usual. When no cached
+    address accepts the connection the entry is dropped and the host is
+    resolved again once.
+    """
+
+    def _new_conn(self):
+        host = self._dns_host.strip('[]')
+        lookup = (host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        for _ in range(2):
+            try:
+                addresses, cached = _cached_getaddrinfo(*lookup)
+            except socket.gaierror as e:
+                raise NameResolutionError(self.host, self, e) from e
+            last_error = None
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    return super()._new_conn()
+                except (ConnectTimeoutError, NewConnectionError) as e:
+                    last_error = e
+                finally:
+                    self._dns_host = host
+            if not cached:
+                break
+            _forget_dns(*lookup)
+        raise last_error or NewConnectionError(self, f'No addresses found for {host}')
+
+class _CachedDnsHTTPConnection(_CachedDnsConnectionMixin, HTTPConnection):
+    pass
+
+class _CachedDnsHTTPSConnection(_CachedDnsConnectionMixin, HTTPSConnection):
+    pass
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDnsHTTPConnection
+
+    def _new_conn(self):
+        metrics.incr('http_client.connections_opened')
+        return super()._new_conn()
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDnsHTTPSConnection
+
+    def _new_conn(self):
+        metrics.incr('http_client.connections_opened')
+        return super()._new_conn()
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with per-host pool sizes that counts new connections"""
+
+    def __init__(self, host_maxsize: dict, **kwargs):
+        self.host_maxsize = host_maxsize
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
         }
+
+    def get_connection(self, url, proxies=None):
+        host = urlparse(url).hostname or ''
+        maxsize = next(
+            (size for suffix, size in self.host_maxsize.items() if host == suffix or host.endswith('.' + suffix)),
+            None
+        )
+        if proxies or maxsize is None:
+            return super().get_connection(url, proxies)
+        return self.poolmanager.connection_from_url(url, pool_kwargs={'maxsize': maxsize})
+
+class _HttpxRawStream:
+    """File-like view of a streamed httpx response for requests.Response.raw"""
+
+    def __init__(self, httpx_response):
+        self._response = httpx_response
+        self._chunks = httpx_response.iter_bytes()
+        self._buffer = b''
+
+    def read(self, amt=None, **kwargs):
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._chunks.close()
+        self._response.close()
+
+class PooledHttpClient:
+    """Process-wide pooled HTTP client for outbound scraping.
+
+    Connections are kept alive in one shared urllib3 pool (sized per host
+    via HTTP_POOL_HOST_MAXSIZE) and handed out to thread-local sessions, so
+    repeated conversions for the same hosts skip DNS, TCP and TLS setup.
+    With HTTP_CLIENT_HTTP2 and the ``h2`` package installed, requests go
+    through an HTTP/2-capable httpx client instead. Both paths share the
+    retry policy (exponential backoff with jitter, honouring Retry-After)
+    and always return ``requests.Response`` objects.
+    """
+
+    RETRY_STATUSES = {429, 502, 503, 504}
+
+    def __init__(self, http2: bool = False):
+        host_maxsize = {}
+        for item in filter(None, (part.strip() for part in HTTP_POOL_HOST_MAXSIZE.split(','))):
+            suffix, _, size = item.partition('=')
+            host_maxsize[suffix.strip().lower()] = int(size)
+        self._adapter = _PooledHTTPAdapter(
+            host_maxsize,
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self._local = threading.local()
+        self._httpx_client = None
+        
+        if http2:
+            if importlib.util.find_spec('h2'):
+                import httpx
+                self._httpx_client = httpx.Client(
+                    http2=True,
+                    verify=False,
+                    follow_redirects=True,
+                    headers=SCRAPE_HEADERS,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_POOL_CONNECTIONS * HTTP_POOL_MAXSIZE,
+                        max_keepalive_connections=HTTP_POOL_CONNECTIONS,
+                    ),
+                )
+            else:
+                print("HTTP_CLIENT_HTTP2 is set but the 'h2' package is not installed, using HTTP/1.1")
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(SCRAPE_HEADERS)
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+        return session
+
+    def _send_httpx(self, url: str, headers: dict, timeout: tuple, stream: bool) -> requests.Response:
+        import httpx
         
-        # Try multiple approaches for robust scraping
-        session = requests.Session()
-        session.headers.update(headers)
+        def trace(event_name, info):
+            if event_name == 'connection.connect_tcp.started':
+                metrics.incr('http_client.connections_opened')
         
-        # First try with SSL verification disabled for problematic sites
         try:
-            response = session.get(url, timeout=20, verify=False, allow_redirects=True)
-            response.raise_for_status()
-        except (requests.exceptions.SSLError, requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-            # If SSL fails, try with different approach
+            httpx_response = self._httpx_client.send(
+                self._httpx_client.build_request(
+                    'GET', url, headers=headers,
+                    timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+                    extensions={'trace': trace},
+                ),
+                stream=True,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = requests.structures.CaseInsensitiveDict(httpx_response.headers)
+        response.url = str(httpx_response.url)
+        response.reason = httpx_response.reason_phrase
+        response.encoding = httpx_response.charset_encoding
+        response.raw = _HttpxRawStream(httpx_response)
+        if not stream:
+            # Reading the whole body hands the connection back to the pool
+            response.content
+        return response
+
+    def _retry_delay(self, attempt: int, response: requests.Response = None) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), HTTP_RETRY_MAX_BACKOFF)
+        delay = min(HTTP_RETRY_BACKOFF * (2 ** attempt), HTTP_RETRY_MAX_BACKOFF)
+        return delay * random.uniform(0.5, 1.5)
+
+    def get(self, url: str, headers: dict = None, timeout: tuple = None, stream: bool = False) -> requests.Response:
+        """GET ``url`` with the shared retry policy.
+
+        Connection errors, timeouts and 429/502/503/504 responses are retried
+        up to HTTP_RETRY_TOTAL times. The last error is re-raised, and the
+        last retryable response is returned as-is.
+        """
+        timeout = timeout or (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        for attempt in range(HTTP_RETRY_TOTAL + 1):
+            metrics.incr('http_client.requests')
+            response = None
             try:
-                response = session.get(url, timeout=30, verify=False, allow_redirects=True)
-                response.raise_for_status()
-            except Exception as e:
-                print(f"Failed to scrape {url}: {str(e)}")
-                # Return a basic template with the URL for AI processing
-                return f"""
+                if self._httpx_client is not None:
+                    response = self._send_httpx(url, headers, timeout, stream)
+                else:
+                    response = self._session().get(
+                        url, headers=headers, timeout=timeout, stream=stream,
+                        verify=False, allow_redirects=True
+                    )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == HTTP_RETRY_TOTAL:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES or attempt == HTTP_RETRY_TOTAL:
+                    return response
+                response.close()
+            
+            metrics.incr('http_client.retries')
+            time.sleep(self._retry_delay(attempt, response))
+
+    def stats(self) -> dict:
+        counters = metrics.snapshot()['counters']
+        request_count = counters.get('http_client.requests', 0)
+        opened = counters.get('http_client.connections_opened', 0)
+        return {
+            'http2': self._httpx_client is not None,
+            'requests': request_count,
+            'connections_opened': opened,
+            'connection_reuse_rate': max(0.0, 1 - opened / request_count) if request_count else 0.0,
+            'retries': counters.get('http_client.retries', 0),
+            'dns_cache_entries': len(_dns_cache),
+        }
+
+http_client = PooledHttpClient(http2=HTTP_CLIENT_HTTP2)
+
+class PortfolioFetchError(Exception):
+    """Raised when a portfolio page is unreachable or not an HTML page"""
+
+# Content types worth parsing; a missing header is given the benefit of the doubt
+SCRAPE_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain', '')
+
+class FetchedPage:
+    """A downloaded portfolio page.
+
+    ``content`` holds at most SCRAPE_MAX_BYTES; ``truncated`` is set when the
+    download was cut off there. ``soup`` is filled in when the page was
+    parsed during the download, in which case ``content`` stays empty.
+    """
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes = b'',
+                 body_bytes: int = 0, truncated: bool = False, soup: BeautifulSoup = None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.body_bytes = body_bytes
+        self.truncated = truncated
+        self.soup = soup
+
+def _iter_capped_body(response: requests.Response, page: FetchedPage):
+    """Yield body chunks until SCRAPE_MAX_BYTES, then stop reading"""
+    for chunk in response.iter_content(SCRAPE_CHUNK_SIZE):
+        remaining = SCRAPE_MAX_BYTES - page.body_bytes
+        if len(chunk) > remaining:
+            page.truncated = True
+            chunk = chunk[:remaining]
+        page.body_bytes += len(chunk)
+        if chunk:
+            yield chunk
+        if page.truncated:
+            return
+
+def fetch_portfolio_page(url: str, headers: dict = None, parse: bool = False) -> FetchedPage:
+    """Stream a portfolio page through the shared pooled client.
+
+    Non-HTML responses are rejected from their headers before any body is
+    read, and the body is capped at SCRAPE_MAX_BYTES. Oversized pages are
+    cut off and flagged as truncated instead of failing. With ``parse`` the
+    page is also parsed, incrementally while downloading when
+    SCRAPE_INCREMENTAL_PARSE is on and the active backend supports it.
+    """
+    fetch_start = time.perf_counter()
+    
+    try:
+        response = http_client.get(url, headers=headers, stream=True)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        raise PortfolioFetchError(str(e)) from e
+    
+    try:
+        response.raise_for_status()
+        page = FetchedPage(response.url or url, response.status_code, response.headers)
+        if response.status_code == 304:
+            return page
+        
+        content_type = response.headers.get('Content-Type', '')
+        if content_type.split(';')[0].strip().lower() not in SCRAPE_CONTENT_TYPES:
+            metrics.incr('scrape.fetch.rejected_content_type')
+            raise PortfolioFetchError(f"Unsupported content type '{content_type}' for {url}")
+        
+        try:
+            body = _iter_capped_body(response, page)
+            if parse and SCRAPE_INCREMENTAL_PARSE and ACTIVE_HTML_PARSER in STREAMING_HTML_BUILDERS:
+                page.soup = parse_portfolio_html_stream(body, content_type)
+            else:
+                page.content = b''.join(body)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise PortfolioFetchError(str(e)) from e
+    finally:
+        response.close()
+    
+    if page.truncated:
+        print(f"⚠️ {url} exceeded {SCRAPE_MAX_BYTES:,} bytes, page truncated")
+        metrics.incr('scrape.fetch.truncated')
+    metrics.observe('scrape.fetch.seconds', time.perf_counter() - fetch_start)
+    metrics.observe('scrape.fetch.bytes', page.body_bytes)
+    
+    if parse and page.soup is None:
+        page.soup = parse_portfolio_html(page.content)
+    return page
+
+http_cache = DiskCache(HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES) if HTTP_CACHE_ENABLED else None
+
+def _extract_page(fetched: FetchedPage) -> dict:
+    """Extract one fetched page, preferring embedded structured data.
+
+    When the structured data is complete enough the heuristic DOM walk is
+    skipped entirely; otherwise the heuristics only fill the fields the
+    structured data left empty.
+    """
+    completeness = 0.0
+    if STRUCTURED_DATA_ENABLED:
+        portfolio_data = extract_structured_data(fetched.soup)
+        completeness = structured_data_completeness(portfolio_data)
+    structured = STRUCTURED_DATA_ENABLED and completeness >= STRUCTURED_DATA_MIN_COMPLETENESS
+    
+    if structured:
+        print(f"⚡ Using embedded structured data for {fetched.url} (completeness {completeness:.2f})")
+        metrics.incr('scrape.structured.fast_path')
+        text_content = page_text(fetched.soup)
+    else:
+        heuristic_data, text_content = extract_portfolio_data(fetched.soup)
+        if completeness:
+            for key, value in heuristic_data.items():
+                if not portfolio_data.get(key):
+                    portfolio_data[key] = value
+        else:
+            portfolio_data = heuristic_data
+    
+    return {
+        'url': fetched.url,
+        'portfolio_data': portfolio_data,
+        'text_content': text_content,
+        'section_urls': find_section_links(fetched.soup, fetched.url),
+        'truncated': fetched.truncated,
+        'structured': structured,
+        'structured_completeness': completeness,
+    }
+
+# Bump whenever _extract_page's output changes, so cached extractions are not reused
+PAGE_EXTRACTOR_VERSION = 1
+
+def page_cache_key(final_url: str) -> str:
+    return DiskCache.make_key(
+        'page', final_url, PAGE_EXTRACTOR_VERSION, ACTIVE_HTML_PARSER,
+        STRUCTURED_DATA_ENABLED, STRUCTURED_DATA_MIN_COMPLETENESS,
+    )
+
+def scrape_page(url: str) -> dict:
+    """Fetch and extract one page, going through the on-disk HTTP cache.
+
+    Entries are keyed by the final (post-redirect) URL and the extractor
+    settings (page_cache_key) and hold the extracted result plus the page's
+    ETag/Last-Modified validators. Within
+    HTTP_CACHE_TTL an entry is served without touching the network; after
+    that it is revalidated with If-None-Match/If-Modified-Since and a 304
+    reuses the cached result as-is.
+    """
+    if http_cache is None:
+        return _extract_page(fetch_portfolio_page(url, parse=True))
+    
+    # Requested URLs map to the final URL they redirected to last time
+    final_url = http_cache.get(DiskCache.make_key('alias', url)) or url
+    page_key = page_cache_key(final_url)
+    cached = http_cache.get(page_key)
+    
+    if cached and time.time() - cached['fetched_at'] < HTTP_CACHE_TTL:
+        metrics.incr('http_cache.hits')
+        metrics.incr('http_cache.bytes_saved', cached['body_bytes'])
+        return cached['page']
+    
+    conditional_headers = {}
+    if cached and cached.get('etag'):
+        conditional_headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        conditional_headers['If-Modified-Since'] = cached['last_modified']
+    
+    response = fetch_portfolio_page(final_url, headers=conditional_headers or None, parse=True)
+    
+    if cached and response.status_code == 304:
+        metrics.incr('http_cache.revalidated')
+        metrics.incr('http_cache.bytes_saved', cached['body_bytes'])
+        cached['fetched_at'] = time.time()
+        http_cache.set(page_key, cached)
+        return cached['page']
+    
+    metrics.incr('http_cache.misses')
+    page = _extract_page(response)
+    if 'no-store' not in response.headers.get('Cache-Control', ''):
+        evicted = http_cache.set(page_cache_key(page['url']), {
+            'fetched_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_bytes': response.body_bytes,
+            'page': page,
+        })
+        if page['url'] != url:
+            http_cache.set(DiskCache.make_key('alias', url), page['url'])
+        metrics.incr('http_cache.evictions', evicted)
+    return page
+
+def unreachable_portfolio_text(url: str) -> str:
+    """Placeholder extraction text for a portfolio that could not be fetched"""
+    return f"""
 PROFESSIONAL PORTFOLIO DATA EXTRACTION:
 
 PERSONAL INFORMATION:
@@ -158,9 +2158,77 @@ ACHIEVEMENTS: [Extract achievements from context]
 
 PORTFOLIO URL: {url}
 ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract information from the portfolio URL and context.
-                """
+    """
+
+def scrape_portfolio_data(url: str, crawl: bool = None, on_event=None) -> dict:
+    """Scrape a portfolio (and its section pages when crawling).
+
+    Returns ``portfolio_data``, ``text_content``, ``structured``, which
+    is True when the landing page's embedded structured data was complete
+    enough to use without heuristics, and ``confidence`` from
+    scrape_confidence() over the merged data. Raises PortfolioFetchError when the
+    landing page cannot be fetched. ``on_event(name, data)`` is told when
+    the landing page has been fetched.
+    """
+    if crawl is None:
+        crawl = PORTFOLIO_CRAWL_ENABLED
+    try:
+        page = scrape_page(url)
+        if on_event:
+            on_event('fetched', {
+                'url': page['url'],
+                'truncated': page['truncated'],
+                'structured': page['structured'],
+                'structured_completeness': page['structured_completeness'],
+                'section_urls': page['section_urls'] if crawl else [],
+            })
+        
+        portfolio_data = page['portfolio_data']
+        text_content = page['text_content']
+        structured = page['structured']
+        if page['truncated']:
+            portfolio_data['truncated'] = True
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Complete structured data already covers the section pages
+        if crawl and not structured:
+            section_urls = page['section_urls'][:CRAWL_MAX_PAGES]
+            if section_urls:
+                print(f"🔗 Crawling {len(section_urls)} section pages for {url}")
+                for section_page in crawl_section_pages(section_urls):
+                    merge_portfolio_data(portfolio_data, section_page['portfolio_data'])
+                    text_content += PAGE_TEXT_SEPARATOR + section_page['text_content']
+        
+        return {
+            'portfolio_data': portfolio_data,
+            'text_content': text_content,
+            'structured': structured,
+            'confidence': scrape_confidence(portfolio_data),
+        }
+        
+    except PortfolioFetchError:
+        raise
+    except Exception as e:
+        print(f"Error scraping portfolio: {str(e)}")
+        raise e
+
+def scrape_portfolio(url: str, crawl: bool = None) -> str:
+    """Scrape portfolio website and extract relevant information for professional resume"""
+    try:
+        scraped = scrape_portfolio_data(url, crawl=crawl)
+    except PortfolioFetchError as e:
+        print(f"Failed to scrape {url}: {str(e)}")
+        # Return a basic template with the URL for AI processing
+        return unreachable_portfolio_text(url)
+    return format_portfolio_text(scraped['portfolio_data'], scraped['text_content'])
+
+def extract_portfolio_data(soup: BeautifulSoup) -> tuple:
+    """Run the section extractors over a parsed page.
+
+    Returns the ``portfolio_data`` dict and the page's full text content.
+    """
+    try:
+        extract_start = time.perf_counter()
+        dom_index = PortfolioDomIndex(soup)
         
         # Extract structured data for professional resume
         portfolio_data = {
@@ -180,28 +2248,15 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
         }
         
         # Enhanced name extraction
-        name_selectors = [
-            'h1', '.name', '#name', '[class*="name"]', '[id*="name"]',
-            '.hero h1', '.header h1', '.intro h1', '.profile h1',
-            '.title h1', '.main-title', '.hero-title'
-        ]
-        
-        for selector in name_selectors:
-            name_elem = soup.select_one(selector)
+        for selector in NAME_SELECTORS:
+            name_elem = dom_index.select_one(selector)
             if name_elem and name_elem.get_text().strip():
                 portfolio_data['name'] = name_elem.get_text().strip()
                 break
         
         # Enhanced title extraction
-        title_selectors = [
-            'h2', '.title', '#title', '[class*="title"]', '[id*="title"]',
-            '.role', '.position', '.job-title', '.profession',
-            '.hero h2', '.header h2', '.intro h2', '.profile h2',
-            '.subtitle', '.tagline', '.description'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
+        for selector in TITLE_SELECTORS:
+            title_elem = dom_index.select_one(selector)
             if title_elem and title_elem.get_text().strip():
                 title_text = title_elem.get_text().strip()
                 # Clean up title text
@@ -214,18 +2269,20 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
         phone_pattern = r'[\+]?[1-9][\d\s\-\(\)]{7,15}'
         
         # Find emails and phones in text content and links
-        text_content = soup.get_text()
-        emails = re.findall(email_pattern, text_content)
+        full_text = soup.get_text()
+        emails = re.findall(email_pattern, full_text)
         if emails:
             portfolio_data['email'] = emails[0]
         
-        phones = re.findall(phone_pattern, text_content)
+        phones = re.findall(phone_pattern, full_text)
         if phones:
             portfolio_data['phone'] = phones[0].replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
         
         # Enhanced link extraction
-        links = soup.find_all('a', href=True)
+        links = dom_index.by_tag.get('a', [])
         for link in links:
+            if not link.has_attr('href'):
+                continue
             href = link['href']
             link_text = link.get_text().strip().lower()
             
@@ -242,30 +2299,18 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
                 portfolio_data['phone'] = phone
         
         # Enhanced skills extraction
-        skill_selectors = [
-            '.skills', '#skills', '[class*="skill"]', '[id*="skill"]',
-            '.technologies', '.tech-stack', '.tools', '.languages',
-            '.frontend', '.backend', '.database', '.frameworks'
-        ]
-        
-        for selector in skill_selectors:
-            skill_elem = soup.select_one(selector)
+        for selector in SKILL_SELECTORS:
+            skill_elem = dom_index.select_one(selector)
             if skill_elem:
                 # Extract skills from text
                 skill_text = skill_elem.get_text()
                 skills = []
                 
-                # Common skill patterns
-                skill_patterns = [
-                    r'\b(?:React|Angular|Vue|JavaScript|TypeScript|HTML|CSS|Node\.js|Python|Java|C\+\+|C#|PHP|Ruby|Go|Rust|Swift|Kotlin|Dart)\b',
-                    r'\b(?:MongoDB|PostgreSQL|MySQL|SQLite|Redis|Firebase|Supabase|AWS|Azure|GCP|Docker|Kubernetes|Git|GitHub|GitLab)\b',
-                    r'\b(?:Express|FastAPI|Django|Flask|Spring|Laravel|Rails|Next\.js|Nuxt\.js|Tailwind|Bootstrap|Material-UI|Ant Design)\b',
-                    r'\b(?:REST|GraphQL|JWT|OAuth|Jest|Cypress|Selenium|Postman|Swagger|CI/CD|Agile|Scrum|MVC|MVVM)\b'
-                ]
-                
-                for pattern in skill_patterns:
-                    found_skills = re.findall(pattern, skill_text, re.IGNORECASE)
-                    skills.extend(found_skills)
+                # Known skills from the taxonomy, found in a single scan
+                skills.extend(
+                    canonical for canonical, category in skill_matcher.find(skill_text)
+                    if category != 'Role'
+                )
                 
                 # Also extract comma-separated skills
                 comma_skills = [skill.strip() for skill in skill_text.split(',') if skill.strip() and len(skill.strip()) > 2]
@@ -277,74 +2322,11 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
         portfolio_data['skills'] = list(set([skill.strip() for skill in portfolio_data['skills'] if skill.strip()]))
         
         # Enhanced projects extraction
-        project_selectors = [
-            '.project', '#project', '[class*="project"]', '[id*="project"]',
-            '.portfolio-item', '.work-item', '.case-study', '.app',
-            '.card', '.item', '.work', '.portfolio'
-        ]
-        
-        for selector in project_selectors:
-            project_elems = soup.select(selector)
-            for project in project_elems:
-                project_data = {
-                    'title': '',
-                    'desc': '',
-                    'tech': [],
-                    'github': '',
-                    'demo': ''
-                }
-                
-                # Extract project title
-                title_selectors = ['h3', 'h4', '.title', '.name', '.project-title', '.project-name']
-                for title_sel in title_selectors:
-                    title_elem = project.select_one(title_sel)
-                    if title_elem:
-                        project_data['title'] = title_elem.get_text().strip()
-                        break
-                
-                # Extract project description
-                desc_selectors = ['p', '.description', '.desc', '.project-desc', '.summary']
-                for desc_sel in desc_selectors:
-                    desc_elem = project.select_one(desc_sel)
-                    if desc_elem:
-                        desc_text = desc_elem.get_text().strip()
-                        if len(desc_text) > 10:  # Avoid very short descriptions
-                            project_data['desc'] = desc_text
-                            break
-                
-                # Extract project technologies
-                tech_selectors = ['.tech', '.technologies', '.stack', '.tools', '.languages']
-                for tech_sel in tech_selectors:
-                    tech_elem = project.select_one(tech_sel)
-                    if tech_elem:
-                        tech_text = tech_elem.get_text()
-                        tech_list = [tech.strip() for tech in tech_text.split(',') if tech.strip()]
-                        project_data['tech'].extend(tech_list)
-                
-                # Extract project links
-                project_links = project.find_all('a', href=True)
-                for link in project_links:
-                    href = link['href']
-                    link_text = link.get_text().strip().lower()
-                    
-                    if 'github.com' in href or 'github' in link_text:
-                        project_data['github'] = href
-                    elif any(domain in href for domain in ['vercel.app', 'netlify.app', 'herokuapp.com', 'render.com', 'surge.sh', 'firebaseapp.com']):
-                        project_data['demo'] = href
-                    elif 'demo' in link_text or 'live' in link_text or 'view' in link_text:
-                        project_data['demo'] = href
-                
-                if project_data['title'] and len(project_data['title']) > 2:
-                    portfolio_data['projects'].append(project_data)
+        portfolio_data['projects'].extend(extract_projects(dom_index))
         
         # Enhanced education extraction
-        education_selectors = [
-            '.education', '#education', '[class*="education"]', '[id*="education"]',
-            '.academic', '.degree', '.university', '.college', '.school'
-        ]
-        
-        for selector in education_selectors:
-            edu_elem = soup.select_one(selector)
+        for selector in EDUCATION_SELECTORS:
+            edu_elem = dom_index.select_one(selector)
             if edu_elem:
                 edu_data = {
                     'Institute_name': '',
@@ -391,13 +2373,8 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
                     portfolio_data['education'].append(edu_data)
         
         # Enhanced about section extraction
-        about_selectors = [
-            '.about', '#about', '[class*="about"]', '[id*="about"]',
-            '.intro', '.summary', '.bio', '.description', '.profile'
-        ]
-        
-        for selector in about_selectors:
-            about_elem = soup.select_one(selector)
+        for selector in ABOUT_SELECTORS:
+            about_elem = dom_index.select_one(selector)
             if about_elem:
                 about_text = about_elem.get_text().strip()
                 if len(about_text) > 20:  # Avoid very short descriptions
@@ -405,13 +2382,8 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
                     break
         
         # Enhanced experience extraction
-        experience_selectors = [
-            '.experience', '#experience', '[class*="experience"]', '[id*="experience"]',
-            '.work', '.employment', '.career', '.job', '.position'
-        ]
-        
-        for selector in experience_selectors:
-            exp_elem = soup.select_one(selector)
+        for selector in EXPERIENCE_SELECTORS:
+            exp_elem = dom_index.select_one(selector)
             if exp_elem:
                 exp_data = {
                     'Company': '',
@@ -449,8 +2421,47 @@ ADDITIONAL CONTEXT: Unable to scrape website directly. Please extract informatio
                 if exp_data['Company'] or exp_data['Position']:
                     portfolio_data['experience'].append(exp_data)
         
-        # Format the extracted data into a comprehensive text for AI processing
-        portfolio_text = f"""
+        # Contact details above come from the full text; the prompt only
+        # needs the page content without navigation and footers
+        text_content = page_text(soup)
+        metrics.observe('scrape.extract.seconds', time.perf_counter() - extract_start)
+        
+        return portfolio_data, text_content
+        
+    except Exception as e:
+        print(f"Error extracting portfolio data: {str(e)}")
+        raise e
+
+# Joins the landing page's text and each crawled section page's in text_content
+PAGE_TEXT_SEPARATOR = '\f'
+
+def budget_page_texts(pages: List[str], max_chars: int) -> List[str]:
+    """Cut page texts to ``max_chars`` in total, shared between the pages.
+
+    Every page gets an equal share and whatever short pages leave unused
+    goes to the longer ones, so crawled section pages are not crowded out
+    by the landing page. Cuts fall on line boundaries where possible.
+    """
+    budgets = {}
+    remaining = max_chars
+    pending = sorted(range(len(pages)), key=lambda index: len(pages[index]))
+    while pending:
+        index = pending.pop(0)
+        budgets[index] = min(len(pages[index]), remaining // (len(pending) + 1))
+        remaining -= budgets[index]
+    
+    budgeted = []
+    for index, text in enumerate(pages):
+        if len(text) > budgets[index]:
+            text = text[:budgets[index]].rsplit('\n', 1)[0]
+        if text:
+            budgeted.append(text)
+    return budgeted
+
+def _verbose_portfolio_text(portfolio_data: dict, text_content: str) -> str:
+    """Original prompt layout: Python reprs plus 3000 characters of raw page text"""
+    context = '\n'.join(budget_page_texts(text_content.split(PAGE_TEXT_SEPARATOR), 3000))
+    portfolio_text = f"""
 PROFESSIONAL PORTFOLIO DATA EXTRACTION:
 
 PERSONAL INFORMATION:
@@ -481,63 +2492,851 @@ ACHIEVEMENTS:
 ACHIEVEMENTS: {portfolio_data['achievements']}
 
 ADDITIONAL CONTENT FOR CONTEXT:
-{text_content[:3000]}
-        """
-        
-        return portfolio_text.strip()
-        
-    except Exception as e:
-        print(f"Error scraping portfolio: {str(e)}")
-        raise e
+{context}
+    """
+    
+    if portfolio_data.get('truncated'):
+        portfolio_text += "\nNOTE: The portfolio page exceeded the download limit and was truncated.\n"
+    
+    return portfolio_text.strip()
 
-def extract_resume_data_from_portfolio(portfolio_text: str) -> dict:
-    """Extract resume data from portfolio text using AI for professional resume generation"""
-    try:
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert at extracting professional information from portfolio websites and converting it into a structured resume format that matches industry standards.
+def format_portfolio_text(portfolio_data: dict, text_content: str) -> str:
+    """Format the extracted data into a comprehensive text for AI processing"""
+    verbose_text = _verbose_portfolio_text(portfolio_data, text_content)
+    if not PROMPT_COMPACTION_ENABLED:
+        return verbose_text
+    
+    compact_text = compact_portfolio_text(portfolio_data, text_content)
+    tokens_before = estimate_tokens(verbose_text)
+    tokens_after = estimate_tokens(compact_text)
+    metrics.observe('prompt.tokens_before', tokens_before)
+    metrics.observe('prompt.tokens_after', tokens_after)
+    metrics.incr('prompt.tokens_saved', tokens_before - tokens_after)
+    return compact_text
+
+# Subtrees that never carry resume content
+BOILERPLATE_TAGS = {
+    'nav', 'footer', 'aside', 'script', 'style', 'noscript', 'template',
+    'svg', 'iframe', 'form', 'button', 'select'
+}
+BOILERPLATE_ROLES = {'navigation', 'contentinfo', 'search', 'dialog'}
+_BOILERPLATE_NAME = re.compile(r'cookie|consent|gdpr|newsletter|subscribe|breadcrumb|navbar|skip-link|sr-only|share', re.IGNORECASE)
+BLOCK_TAGS = {
+    'address', 'article', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'figcaption',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'ol', 'p',
+    'pre', 'section', 'table', 'td', 'th', 'tr', 'ul'
+}
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9])')
+# Words, numbers and runs of punctuation; tracks BPE token counts for
+# English prose closely enough to compare prompt variants
+_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]+')
+# Single-word lines mixing letters and digits (item-3, slide-12) are
+# generated labels; they dedupe with the digits ignored
+_GENERATED_LABEL = re.compile(r'^(?=\S*[a-z])(?=\S*\d)\S+$')
+# Link and button captions that carry no content on their own
+LINK_CAPTIONS = {
+    'github', 'source', 'code', 'live', 'live demo', 'demo', 'view', 'view project',
+    'read more', 'learn more', 'home', 'contact', 'resume', 'download cv', 'menu'
+}
 
-Based on the portfolio data provided, extract and structure the following information in a professional resume format:
+def _is_boilerplate(elem: Tag) -> bool:
+    if elem.name in BOILERPLATE_TAGS or elem.get('role') in BOILERPLATE_ROLES:
+        return True
+    if elem.get('aria-hidden') == 'true' or elem.has_attr('hidden'):
+        return True
+    names = ' '.join(elem.get('class') or []) + ' ' + (elem.get('id') or '')
+    return bool(_BOILERPLATE_NAME.search(names))
+
+def page_text(soup: BeautifulSoup) -> str:
+    """Visible page text without navigation, footers and other boilerplate.
+
+    Block-level elements start a new line; inline text is kept together so
+    sentences are not split across lines. The soup is not modified.
+    """
+    parts = []
+    stack = [soup]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            if _is_boilerplate(node):
+                continue
+            if node.name in BLOCK_TAGS:
+                parts.append('\n')
+                stack.append('\n')
+            stack.extend(reversed(node.contents))
+        elif isinstance(node, str) and type(node) in (str, NavigableString):
+            # Comments, doctypes and CDATA are NavigableString subclasses
+            parts.append(node)
+    return '\n'.join(' '.join(line.split()) for line in ''.join(parts).split('\n') if line.strip())
+
+def estimate_tokens(text: str) -> int:
+    return len(_TOKEN_PATTERN.findall(text))
+
+def _normalize_sentence(sentence: str) -> str:
+    return ' '.join(sentence.lower().split()).strip(' .!?;:,-|•·')
+
+def dedupe_text(text: str, known: set = None) -> str:
+    """Collapse whitespace and drop repeated lines and sentences.
+
+    Sentences whose normalised form is in ``known`` (content already sent
+    as a structured field) are dropped as well.
+    """
+    seen = set(known or ())
+    lines = []
+    for raw_line in text.split('\n'):
+        line = ' '.join(raw_line.split())
+        kept = []
+        for sentence in _SENTENCE_BOUNDARY.split(line):
+            key = _normalize_sentence(sentence)
+            if _GENERATED_LABEL.match(key):
+                key = re.sub(r'\d+', '#', key)
+            if len(key) < 2 or key in seen:
+                continue
+            seen.add(key)
+            kept.append(sentence)
+        if kept:
+            lines.append(' '.join(kept))
+    return '\n'.join(lines)
+
+def _compact_json(value) -> str:
+    """JSON without whitespace or empty fields"""
+    def prune(item):
+        if isinstance(item, dict):
+            return {key: prune(val) for key, val in item.items() if val not in ('', None, [], {})}
+        if isinstance(item, list):
+            # Drop entries repeated verbatim (the same block matched twice)
+            pruned = []
+            for val in map(prune, item):
+                if val not in pruned:
+                    pruned.append(val)
+            return pruned
+        return item
+    return json.dumps(prune(value), ensure_ascii=False, separators=(',', ':'))
+
+def _compact_skills(skills: List[str]) -> List[str]:
+    compacted = []
+    seen = set()
+    for skill in skills:
+        # Heuristic extraction can return a whole newline-separated block as one skill
+        for part in skill.split('\n'):
+            part = ' '.join(part.split())
+            if part and part.lower() not in seen:
+                seen.add(part.lower())
+                compacted.append(part)
+    return compacted
+
+def compact_portfolio_text(portfolio_data: dict, text_content: str) -> str:
+    """Compact prompt layout: one line per non-empty field, structured lists
+    as minimal JSON and the page text deduplicated against both."""
+    contact = [
+        f"{label}: {portfolio_data.get(key)}"
+        for label, key in (('EMAIL', 'email'), ('PHONE', 'phone'), ('LOCATION', 'location'),
+                           ('LINKEDIN', 'linkedin'), ('GITHUB', 'github'))
+        if portfolio_data.get(key)
+    ]
+    lines = ["PORTFOLIO DATA:"]
+    for label, key in (('NAME', 'name'), ('TITLE', 'title')):
+        if portfolio_data.get(key):
+            lines.append(f"{label}: {portfolio_data[key]}")
+    lines.extend(contact)
+    if portfolio_data.get('about'):
+        lines.append(f"ABOUT: {' '.join(portfolio_data['about'].split())}")
+    skills = _compact_skills(portfolio_data.get('skills', []))
+    if skills:
+        lines.append(f"SKILLS: {', '.join(skills)}")
+    for label, key in (('EDUCATION', 'education'), ('EXPERIENCE', 'experience'),
+                       ('PROJECTS', 'projects'), ('ACHIEVEMENTS', 'achievements')):
+        if portfolio_data.get(key):
+            lines.append(f"{label}: {_compact_json(portfolio_data[key])}")
+    
+    # Anything already sent as a field is not repeated in the page text
+    known = set(LINK_CAPTIONS)
+    for key in ('name', 'title', 'email', 'phone', 'location'):
+        if portfolio_data.get(key):
+            known.add(_normalize_sentence(portfolio_data[key]))
+    for sentence in _SENTENCE_BOUNDARY.split(portfolio_data.get('about', '')):
+        known.add(_normalize_sentence(sentence))
+    known.update(_normalize_sentence(skill) for skill in skills)
+    for project in portfolio_data.get('projects', []):
+        known.add(_normalize_sentence(project.get('title', '')))
+        known.add(_normalize_sentence(', '.join(project.get('tech', []))))
+        for sentence in _SENTENCE_BOUNDARY.split(project.get('desc', '')):
+            known.add(_normalize_sentence(sentence))
+    
+    # Each crawled page gets its share of the budget, deduplicated against earlier pages
+    pages = []
+    for page in text_content.split(PAGE_TEXT_SEPARATOR):
+        page = dedupe_text(page, known)
+        known.update(_normalize_sentence(sentence) for line in page.split('\n') for sentence in _SENTENCE_BOUNDARY.split(line))
+        pages.append(page)
+    context = '\n'.join(budget_page_texts(pages, PROMPT_CONTEXT_MAX_CHARS))
+    if context:
+        lines.append("PAGE TEXT:")
+        lines.append(context)
+    
+    if portfolio_data.get('truncated'):
+        lines.append("NOTE: The portfolio page exceeded the download limit and was truncated.")
+    
+    return '\n'.join(lines)
+
+# Per-card lookups inside a project element, in priority order
+PROJECT_TITLE_SELECTORS = ['h3', 'h4', '.title', '.name', '.project-title', '.project-name']
+PROJECT_DESC_SELECTORS = ['p', '.description', '.desc', '.project-desc', '.summary']
+PROJECT_TECH_SELECTORS = ['.tech', '.technologies', '.stack', '.tools', '.languages']
+PROJECT_DEMO_DOMAINS = ['vercel.app', 'netlify.app', 'herokuapp.com', 'render.com', 'surge.sh', 'firebaseapp.com']
+
+def _first_matches(card: Tag, selector_groups: list) -> list:
+    """Walk ``card`` once and collect the lookups for every selector group.
+
+    Returns, per group, the first element in document order matching each
+    selector (plain tag names or ``.class`` tokens), followed by the card's
+    links.
+    """
+    found = [[None] * len(selectors) for selectors in selector_groups]
+    links = []
+    for elem in card.descendants:
+        if not isinstance(elem, Tag):
+            continue
+        classes = elem.get('class') or []
+        for group, selectors in zip(found, selector_groups):
+            for rank, selector in enumerate(selectors):
+                if group[rank] is None and (
+                    selector[1:] in classes if selector.startswith('.') else elem.name == selector
+                ):
+                    group[rank] = elem
+        if elem.name == 'a' and elem.has_attr('href'):
+            links.append(elem)
+    return found + [links]
+
+def _project_from_card(card: Tag) -> dict:
+    titles, descs, techs, links = _first_matches(
+        card, [PROJECT_TITLE_SELECTORS, PROJECT_DESC_SELECTORS, PROJECT_TECH_SELECTORS]
+    )
+    project_data = {
+        'title': '',
+        'desc': '',
+        'tech': [],
+        'github': '',
+        'demo': ''
+    }
+    
+    title_elem = next((elem for elem in titles if elem is not None), None)
+    if title_elem:
+        project_data['title'] = title_elem.get_text().strip()
+    
+    for desc_elem in descs:
+        if desc_elem:
+            desc_text = desc_elem.get_text().strip()
+            if len(desc_text) > 10:  # Avoid very short descriptions
+                project_data['desc'] = desc_text
+                break
+    
+    seen_tech_elems = set()
+    for tech_elem in techs:
+        if tech_elem and id(tech_elem) not in seen_tech_elems:
+            seen_tech_elems.add(id(tech_elem))
+            tech_list = [tech.strip() for tech in tech_elem.get_text().split(',') if tech.strip()]
+            project_data['tech'].extend(tech_list)
+    
+    for link in links:
+        href = link['href']
+        link_text = link.get_text().strip().lower()
+        
+        if 'github.com' in href or 'github' in link_text:
+            project_data['github'] = href
+        elif any(domain in href for domain in PROJECT_DEMO_DOMAINS):
+            project_data['demo'] = href
+        elif 'demo' in link_text or 'live' in link_text or 'view' in link_text:
+            project_data['demo'] = href
+    
+    return project_data
+
+def extract_projects(dom_index: PortfolioDomIndex) -> List[dict]:
+    """Extract one project per card element.
+
+    PROJECT_SELECTORS overlap heavily (``.card``, ``.item``,
+    ``[class*="project"]``...), so every matching element is considered
+    once, in document order. Elements that wrap two or more titled
+    candidates are section containers rather than cards and are skipped,
+    and anything nested inside an accepted card is skipped too.
+    """
+    seen = set()
+    candidates = []
+    for selector in PROJECT_SELECTORS:
+        for elem in dom_index.select(selector):
+            if id(elem) not in seen:
+                seen.add(id(elem))
+                candidates.append(elem)
+    position = dom_index.position
+    candidates.sort(key=lambda elem: position[id(elem)])
+    
+    # A candidate is "titled" if a title element sits anywhere below it
+    title_positions = sorted({
+        position[id(elem)]
+        for selector in PROJECT_TITLE_SELECTORS
+        for elem in dom_index.select(selector)
+    })
+    
+    def descendants_in(elem, positions):
+        start = position[id(elem)]
+        end = dom_index.subtree_end[start]
+        return bisect.bisect_right(positions, end) - bisect.bisect_right(positions, start)
+    
+    titled = [elem for elem in candidates if descendants_in(elem, title_positions)]
+    titled_positions = [position[id(elem)] for elem in titled]
+    
+    projects = []
+    accepted_until = -1
+    for elem in titled:
+        start = position[id(elem)]
+        if start <= accepted_until:
+            continue
+        if descendants_in(elem, titled_positions) >= 2:
+            continue
+        project_data = _project_from_card(elem)
+        if project_data['title'] and len(project_data['title']) > 2:
+            projects.append(project_data)
+            accepted_until = dom_index.subtree_end[start]
+    
+    metrics.observe('scrape.projects.candidates', len(candidates))
+    metrics.observe('scrape.projects.accepted', len(projects))
+    return projects
+
+# Keys looked up (in order) when mapping embedded JSON onto portfolio_data
+STRUCTURED_FIELD_ALIASES = {
+    'name': ('name', 'fullName', 'full_name', 'displayName'),
+    'title': ('jobTitle', 'headline', 'title', 'role', 'position', 'tagline'),
+    'email': ('email', 'mail'),
+    'phone': ('telephone', 'phone', 'phoneNumber', 'mobile'),
+    'location': ('location', 'address', 'city'),
+    'about': ('bio', 'about', 'summary', 'description', 'intro'),
+    'skills': ('skills', 'knowsAbout', 'technologies', 'techStack', 'stack', 'tools'),
+    'projects': ('projects', 'works', 'portfolio'),
+    'experience': ('experience', 'experiences', 'workExperience', 'jobs', 'employment', 'work'),
+    'education': ('education', 'educations', 'schools', 'alumniOf'),
+    'achievements': ('achievements', 'awards', 'award', 'certifications', 'honors'),
+    'links': ('sameAs', 'socials', 'social', 'socialLinks', 'links', 'profiles'),
+}
+STRUCTURED_PROJECT_ALIASES = {
+    'title': ('title', 'name', 'projectName'),
+    'desc': ('description', 'desc', 'summary', 'about'),
+    'tech': ('tech', 'techStack', 'stack', 'technologies', 'tags', 'skills', 'tools'),
+    'github': ('github', 'repo', 'repository', 'source', 'sourceCode', 'codeUrl'),
+    'demo': ('demo', 'live', 'liveUrl', 'url', 'link', 'homepage', 'website'),
+}
+STRUCTURED_EXPERIENCE_ALIASES = {
+    'Company': ('company', 'companyName', 'organization', 'employer', 'worksFor', 'name'),
+    'Position': ('role', 'position', 'title', 'jobTitle'),
+    'Duration': ('duration', 'period', 'dates'),
+    'Skills': ('skills', 'tech', 'technologies', 'stack'),
+}
+STRUCTURED_EDUCATION_ALIASES = {
+    'Institute_name': ('school', 'institution', 'institute', 'university', 'college', 'name'),
+    'Degree_name': ('degree', 'qualification', 'program', 'field'),
+    'year': ('year', 'graduationYear', 'end', 'endDate'),
+    'marks': ('grade', 'gpa', 'cgpa', 'marks', 'score'),
+}
+# Share of a resume each field represents when scoring structured data
+STRUCTURED_DATA_FIELD_WEIGHTS = {
+    'name': 0.2, 'email': 0.1, 'about': 0.1, 'skills': 0.2,
+    'projects': 0.2, 'experience': 0.1, 'education': 0.1,
+}
+STRUCTURED_PROFILE_MAX_NODES = 20000
+
+_NUXT_ASSIGNMENT = re.compile(r'^\s*window\.__NUXT__\s*=\s*(\{.*\})\s*;?\s*$', re.DOTALL)
+_NUXT_DEVALUE_WRAPPERS = ('Reactive', 'ShallowReactive', 'Ref', 'ShallowRef')
+
+def _lookup(obj: dict, aliases: tuple):
+    for key in aliases:
+        value = obj.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+def _structured_text(value) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, dict):
+        if value.get('name'):
+            return _structured_text(value['name'])
+        # schema.org PostalAddress
+        parts = [value.get(key) for key in ('addressLocality', 'addressRegion', 'addressCountry')]
+        return ', '.join(_structured_text(part) for part in parts if part)
+    if isinstance(value, list):
+        return ', '.join(filter(None, (_structured_text(item) for item in value)))
+    return ''
+
+def _structured_list(value) -> List[str]:
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    if isinstance(value, list):
+        return [text for text in (_structured_text(item) for item in value) if text]
+    text = _structured_text(value)
+    return [text] if text else []
+
+def _structured_urls(value) -> List[str]:
+    if isinstance(value, dict):
+        return [url for url in value.values() if isinstance(url, str)]
+    return [url for url in _structured_list(value) if url.startswith('http')]
+
+def _structured_project(item) -> dict:
+    if not isinstance(item, dict):
+        return {'title': _structured_text(item), 'desc': '', 'tech': [], 'github': '', 'demo': ''}
+    project_data = {
+        'title': _structured_text(_lookup(item, STRUCTURED_PROJECT_ALIASES['title'])),
+        'desc': _structured_text(_lookup(item, STRUCTURED_PROJECT_ALIASES['desc'])),
+        'tech': _structured_list(_lookup(item, STRUCTURED_PROJECT_ALIASES['tech'])),
+        'github': _structured_text(_lookup(item, STRUCTURED_PROJECT_ALIASES['github'])),
+        'demo': _structured_text(_lookup(item, STRUCTURED_PROJECT_ALIASES['demo'])),
+    }
+    if 'github.com' in project_data['demo'] and not project_data['github']:
+        project_data['github'], project_data['demo'] = project_data['demo'], ''
+    return project_data
+
+def _structured_experience(item) -> dict:
+    if not isinstance(item, dict):
+        return {'Company': _structured_text(item), 'Position': '', 'Duration': '', 'Skills': []}
+    duration = _structured_text(_lookup(item, STRUCTURED_EXPERIENCE_ALIASES['Duration']))
+    if not duration:
+        start = _structured_text(_lookup(item, ('start', 'startDate', 'from')))
+        end = _structured_text(_lookup(item, ('end', 'endDate', 'to')))
+        duration = f"{start} - {end}" if start and end else start or end
+    return {
+        'Company': _structured_text(_lookup(item, STRUCTURED_EXPERIENCE_ALIASES['Company'])),
+        'Position': _structured_text(_lookup(item, STRUCTURED_EXPERIENCE_ALIASES['Position'])),
+        'Duration': duration,
+        'Skills': _structured_list(_lookup(item, STRUCTURED_EXPERIENCE_ALIASES['Skills'])),
+    }
 
-1. NAME: Full name of the person
-2. TITLE: Current role or title (e.g., Full Stack Developer, Frontend Developer, Software Engineer)
-3. CONTACT: Email, phone, location, LinkedIn, GitHub, portfolio URL
-4. ABOUT: Professional summary or objective (2-3 sentences about career goals, expertise, and what you bring to the table)
-5. EDUCATION: Institution name, degree, year, GPA if mentioned
-6. SKILLS: Technical skills organized by category (Frontend, Backend, Database, Tools & DevOps)
-7. PROJECTS: Project names, descriptions, technologies used, GitHub links, live demo links
-8. EXPERIENCE: Work experience, internships, positions held with company names and durations
-9. ACHIEVEMENTS: Certifications, awards, notable accomplishments
+def _structured_education(item) -> dict:
+    if not isinstance(item, dict):
+        return {'Institute_name': _structured_text(item), 'Degree_name': '', 'year': '', 'marks': ''}
+    return {
+        field: _structured_text(_lookup(item, aliases))
+        for field, aliases in STRUCTURED_EDUCATION_ALIASES.items()
+    }
 
-Format the response as a comprehensive, professional resume summary that follows industry standards and is ready for LaTeX resume generation. If information is missing, make reasonable assumptions based on the context and portfolio content.
+def _structured_achievement(item) -> dict:
+    if not isinstance(item, dict):
+        return {'achievement_name': _structured_text(item), 'description': ''}
+    return {
+        'achievement_name': _structured_text(_lookup(item, ('name', 'title'))),
+        'description': _structured_text(_lookup(item, ('description', 'about', 'issuer'))),
+    }
 
-Example format:
-NAME: [Full Name]
-TITLE: [Current Position - e.g., Full Stack Developer]
-CONTACT: [Email, Phone, Location, LinkedIn, GitHub]
-ABOUT: [Professional summary about career goals and expertise - 2-3 sentences]
-EDUCATION: [Institution, Degree, Year, GPA]
-SKILLS: [Organized by Frontend, Backend, Database, Tools & DevOps]
-PROJECTS: [Detailed project descriptions with technologies and links]
-EXPERIENCE: [Work experience with company names and durations]
-ACHIEVEMENTS: [Certifications and awards]
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
 
-Ensure the extracted data is professional, well-structured, and ready for high-quality resume generation."""
-                },
-                {
-                    "role": "user",
-                    "content": f"Extract and structure resume information from this portfolio data for professional resume generation:\n\n{portfolio_text}"
-                }
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            stream=False,
-        )
+def map_profile_object(profile: dict) -> dict:
+    """Map a profile-like JSON object (schema.org Person, a Next.js page
+    prop, ...) onto the ``portfolio_data`` fields."""
+    def field(name):
+        return _lookup(profile, STRUCTURED_FIELD_ALIASES[name])
+    
+    portfolio_data = {
+        'name': _structured_text(field('name')),
+        'title': _structured_text(field('title')),
+        'email': _structured_text(field('email')).replace('mailto:', ''),
+        'phone': _structured_text(field('phone')).replace('tel:', ''),
+        'location': _structured_text(field('location')),
+        'linkedin': _structured_text(profile.get('linkedin')),
+        'github': _structured_text(profile.get('github')),
+        'skills': _structured_list(field('skills')),
+        'projects': [_structured_project(item) for item in _as_list(field('projects'))],
+        'education': [_structured_education(item) for item in _as_list(field('education'))],
+        'about': _structured_text(field('about'))[:500],
+        'experience': [_structured_experience(item) for item in _as_list(field('experience'))],
+        'achievements': [_structured_achievement(item) for item in _as_list(field('achievements'))],
+    }
+    for url in _structured_urls(field('links')):
+        if 'linkedin.com' in url and not portfolio_data['linkedin']:
+            portfolio_data['linkedin'] = url
+        elif 'github.com' in url and not portfolio_data['github']:
+            portfolio_data['github'] = url
+    if not portfolio_data['experience'] and isinstance(profile.get('worksFor'), (dict, str)):
+        portfolio_data['experience'].append({
+            'Company': _structured_text(profile['worksFor']),
+            'Position': portfolio_data['title'],
+            'Duration': '',
+            'Skills': [],
+        })
+    
+    portfolio_data['projects'] = [project for project in portfolio_data['projects'] if len(project['title']) > 2]
+    portfolio_data['education'] = [edu for edu in portfolio_data['education'] if edu['Institute_name'] or edu['Degree_name']]
+    portfolio_data['experience'] = [exp for exp in portfolio_data['experience'] if exp['Company'] or exp['Position']]
+    portfolio_data['achievements'] = [item for item in portfolio_data['achievements'] if item['achievement_name']]
+    return portfolio_data
+
+def _jsonld_type_matches(node: dict, type_name: str) -> bool:
+    return type_name in _as_list(node.get('@type'))
+
+def _jsonld_persons(data) -> list:
+    persons = []
+    for node in _as_list(data):
+        if not isinstance(node, dict):
+            continue
+        if _jsonld_type_matches(node, 'Person'):
+            persons.append(node)
+        elif isinstance(node.get('mainEntity'), dict) and _jsonld_type_matches(node['mainEntity'], 'Person'):
+            persons.append(node['mainEntity'])
+        persons.extend(_jsonld_persons(node.get('@graph')))
+    return persons
+
+def _profile_score(obj: dict) -> int:
+    return sum(1 for aliases in STRUCTURED_FIELD_ALIASES.values() if _lookup(obj, aliases) is not None)
+
+def find_profile_object(data) -> dict:
+    """Return the object in an embedded app-state blob that looks most like
+    a person's profile, or None if nothing has at least three profile fields.
+
+    The blob is walked breadth first and the walk is capped at
+    STRUCTURED_PROFILE_MAX_NODES nodes, since framework state can be large.
+    """
+    best, best_score = None, 2
+    queue = deque([data])
+    visited = 0
+    while queue and visited < STRUCTURED_PROFILE_MAX_NODES:
+        node = queue.popleft()
+        visited += 1
+        if isinstance(node, dict):
+            score = _profile_score(node)
+            if score > best_score:
+                best, best_score = node, score
+            queue.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            queue.extend(value for value in node if isinstance(value, (dict, list)))
+    return best
+
+def _revive_nuxt_payload(payload: list):
+    """Rebuild the object graph from a Nuxt 3 ``__NUXT_DATA__`` payload, which
+    stores every value once in a flat array and refers to it by index."""
+    revived = {}
+    
+    def revive(index, depth=0):
+        if not isinstance(index, int) or isinstance(index, bool) or not 0 <= index < len(payload) or depth > 50:
+            return None
+        if index in revived:
+            return revived[index]
+        value = payload[index]
+        if isinstance(value, dict):
+            result = revived[index] = {}
+            for key, child in value.items():
+                result[key] = revive(child, depth + 1)
+        elif isinstance(value, list):
+            if len(value) == 2 and value[0] in _NUXT_DEVALUE_WRAPPERS:
+                result = revived[index] = revive(value[1], depth + 1)
+            else:
+                result = revived[index] = []
+                result.extend(revive(child, depth + 1) for child in value)
+        else:
+            result = revived[index] = value
+        return result
+    
+    return revive(0)
+
+def _embedded_app_state(soup: BeautifulSoup) -> list:
+    """Collect parsed framework state blobs (Next.js, Nuxt 2 and Nuxt 3)"""
+    blobs = []
+    for script in soup.find_all('script'):
+        text = script.string
+        if not text:
+            continue
+        try:
+            if script.get('id') == '__NEXT_DATA__':
+                blobs.append(json.loads(text))
+            elif script.get('id') == '__NUXT_DATA__':
+                payload = json.loads(text)
+                if isinstance(payload, list):
+                    blobs.append(_revive_nuxt_payload(payload))
+            elif '__NUXT__' in text:
+                # Only the plain object-literal form; Nuxt 2 usually emits a
+                # minified IIFE that cannot be read without running it
+                match = _NUXT_ASSIGNMENT.match(text)
+                if match:
+                    blobs.append(json.loads(match.group(1)))
+        except ValueError as e:
+            print(f"Skipping unparseable embedded state in <script id={script.get('id')}>: {str(e)}")
+    return blobs
+
+def _microdata_persons(soup: BeautifulSoup) -> list:
+    persons = []
+    for scope in soup.find_all(attrs={'itemscope': True, 'itemtype': re.compile(r'schema\.org/Person', re.IGNORECASE)}):
+        person = {}
+        for prop in scope.find_all(attrs={'itemprop': True}):
+            # Properties of nested items (an Organization, a PostalAddress...)
+            # belong to that item, not to the person
+            if prop.find_parent(attrs={'itemscope': True}) is not scope:
+                continue
+            value = prop.get('content') or prop.get('href') or prop.get_text(' ', strip=True)
+            for name in prop['itemprop'].split():
+                if name in ('sameAs', 'knowsAbout'):
+                    person.setdefault(name, []).append(value)
+                else:
+                    person.setdefault(name, value)
+        persons.append(person)
+    return persons
+
+def extract_structured_data(soup: BeautifulSoup) -> dict:
+    """Read embedded structured data before any DOM heuristics run.
+
+    Sources are schema.org ``Person`` JSON-LD and microdata plus framework
+    app state (``__NEXT_DATA__``, ``window.__NUXT__``, ``__NUXT_DATA__``).
+    Earlier sources win field by field. Returns the merged
+    ``portfolio_data`` dict; use structured_data_completeness() to decide
+    whether it is good enough on its own.
+    """
+    extract_start = time.perf_counter()
+    profiles = []
+    
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            profiles.extend(_jsonld_persons(json.loads(script.string or '')))
+        except ValueError as e:
+            print(f"Skipping unparseable JSON-LD block: {str(e)}")
+    profiles.extend(_microdata_persons(soup))
+    for blob in _embedded_app_state(soup):
+        profile = find_profile_object(blob)
+        if profile:
+            profiles.append(profile)
+    
+    portfolio_data = {
+        'name': '', 'title': '', 'email': '', 'phone': '', 'location': '',
+        'linkedin': '', 'github': '', 'skills': [], 'projects': [],
+        'education': [], 'about': '', 'experience': [], 'achievements': []
+    }
+    for profile in profiles:
+        for key, value in map_profile_object(profile).items():
+            if value and not portfolio_data[key]:
+                portfolio_data[key] = value
+            elif key == 'skills':
+                # Skills are commonly split across JSON-LD knowsAbout and app state
+                merge_portfolio_data(portfolio_data, {'skills': value})
+    
+    metrics.observe('scrape.structured.seconds', time.perf_counter() - extract_start)
+    return portfolio_data
+
+def structured_data_completeness(portfolio_data: dict) -> float:
+    """Weighted share of resume fields present, between 0.0 and 1.0"""
+    return round(sum(
+        weight for field, weight in STRUCTURED_DATA_FIELD_WEIGHTS.items()
+        if portfolio_data.get(field)
+    ), 3)
+
+_EMAIL_PATTERN = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+_NAME_WORD = re.compile(r"^[A-Z][A-Za-z.'-]*$")
+_NAME_STOPWORDS = {
+    'hi', 'hello', "i'm", 'im', 'i', 'am', 'welcome', 'home', 'portfolio', 'resume', 'about', 'menu',
+    'developer', 'engineer', 'designer'
+}
+_SKILL_HEADING = re.compile(r'^(?:(?:technical|core|my)\s+)?(?:skills?|technologies|tech stack|tools)\s*:?$', re.IGNORECASE)
+_GENERIC_COMPANY_WORDS = {'company', 'corp', 'inc', 'llc', 'ltd', 'tech', 'solutions', 'systems'}
+# Scraped fields the model is asked for when they fail validation, and the
+# Candidate section each one fills
+RULE_BASED_SECTION_FIELDS = {
+    'name': 'name',
+    'email': 'Contact_Info',
+    'skills': 'Skills',
+    'projects': 'Projects',
+    'experience': 'Experience',
+    'education': 'Education',
+}
+
+def _plausible_name(name: str) -> bool:
+    words = name.split()
+    return (
+        1 < len(words) <= 4 and len(name) <= 60
+        and all(_NAME_WORD.match(word) for word in words)
+        and not any(word.lower().strip('.,!') in _NAME_STOPWORDS for word in words)
+    )
+
+def clean_skills(skills: List[str]) -> List[str]:
+    """Compacted skills without section headings and run-on text blocks"""
+    return [skill for skill in _compact_skills(skills) if len(skill) <= 40 and not _SKILL_HEADING.match(skill)]
+
+def _confident_projects(projects: list) -> list:
+    return [p for p in projects if p.get('title') and len(p.get('desc', '').strip()) >= 20]
+
+def _confident_experience(experience: list) -> list:
+    # The heuristics match bare suffixes like "Tech" as the company name
+    return [
+        exp for exp in experience
+        if exp.get('Position') and len(exp.get('Company', '').strip()) > 3
+        and exp['Company'].strip().lower() not in _GENERIC_COMPANY_WORDS
+    ]
+
+def _confident_education(education: list) -> list:
+    return [edu for edu in education if len(edu.get('Institute_name', '').strip()) > 3 and edu.get('Degree_name')]
+
+def confident_fields(portfolio_data: dict) -> set:
+    """Fields whose scraped values pass validation, not just exist"""
+    checks = {
+        'name': _plausible_name(portfolio_data.get('name', '')),
+        'email': bool(_EMAIL_PATTERN.match(portfolio_data.get('email', ''))),
+        'about': len(portfolio_data.get('about', '').strip()) >= 40,
+        'skills': len(clean_skills(portfolio_data.get('skills', []))) >= 3,
+        'projects': bool(_confident_projects(portfolio_data.get('projects', []))),
+        'experience': bool(_confident_experience(portfolio_data.get('experience', []))),
+        'education': bool(_confident_education(portfolio_data.get('education', []))),
+    }
+    return {field for field, ok in checks.items() if ok}
+
+def scrape_confidence(portfolio_data: dict) -> float:
+    """Weighted share of resume fields that passed validation, between 0.0 and 1.0"""
+    fields = confident_fields(portfolio_data)
+    return round(sum(weight for field, weight in STRUCTURED_DATA_FIELD_WEIGHTS.items() if field in fields), 3)
+
+def missing_sections(portfolio_data: dict) -> List[str]:
+    """Candidate sections the rule-based builder leaves empty"""
+    fields = confident_fields(portfolio_data)
+    return [section for field, section in RULE_BASED_SECTION_FIELDS.items() if field not in fields]
+
+def candidate_from_portfolio_data(portfolio_data: dict) -> Candidate:
+    """Build a Candidate straight from scraped data without a model call,
+    keeping only the entries that pass the confidence checks"""
+    contact = {}
+    if _EMAIL_PATTERN.match(portfolio_data.get('email', '')):
+        contact['email'] = portfolio_data['email']
+    if len(re.sub(r'\D', '', portfolio_data.get('phone', ''))) >= 10:
+        contact['phone'] = portfolio_data['phone'].strip()
+    for key in ('location', 'linkedin', 'github'):
+        if portfolio_data.get(key):
+            contact[key] = portfolio_data[key]
+
+    return Candidate(
+        name=portfolio_data['name'].strip() if _plausible_name(portfolio_data.get('name', '')) else '',
+        Education=[
+            Education(Institute_name=edu['Institute_name'].strip(), Degree_name=edu['Degree_name'], marks=edu.get('marks', ''))
+            for edu in _confident_education(portfolio_data.get('education', []))
+        ],
+        Projects=[
+            Project(project_name=p['title'], about_project=p['desc'].strip(), skills_used=p.get('tech', []))
+            for p in _confident_projects(portfolio_data.get('projects', []))
+        ],
+        Experience=[
+            Experience(Position_name=exp['Position'], Company_name=exp['Company'].strip(), skills_used=exp.get('Skills', []))
+            for exp in _confident_experience(portfolio_data.get('experience', []))
+        ],
+        Achivements=[
+            Achivements(Achivement_name=a['achievement_name'], institute_name='', about=a.get('description', ''))
+            for a in portfolio_data.get('achievements', []) if a.get('achievement_name')
+        ],
+        Skills=clean_skills(portfolio_data.get('skills', [])),
+        Position_of_Responsibility=[],
+        Contact_Info=contact,
+    )
+
+# Same-origin links whose path contains one of these are crawled as section pages
+CRAWL_SECTION_KEYWORDS = (
+    'project', 'work', 'portfolio', 'about', 'experience', 'resume', 'cv',
+    'skill', 'education', 'career'
+)
+CRAWL_SKIP_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.zip', '.mp4')
+
+crawl_executor = ThreadPoolExecutor(max_workers=CRAWL_MAX_WORKERS, thread_name_prefix='crawl')
+_crawl_host_limits = {}
+_crawl_host_limits_lock = threading.Lock()
+
+def _crawl_host_limit(host: str) -> threading.BoundedSemaphore:
+    with _crawl_host_limits_lock:
+        if host not in _crawl_host_limits:
+            _crawl_host_limits[host] = threading.BoundedSemaphore(CRAWL_PER_HOST_CONCURRENCY)
+        return _crawl_host_limits[host]
+
+def find_section_links(soup: BeautifulSoup, base_url: str) -> List[str]:
+    """Return same-origin section page URLs linked from the landing page"""
+    base = urlparse(base_url)
+    seen = {urldefrag(base_url)[0].rstrip('/')}
+    section_urls = []
+    
+    for link in soup.find_all('a', href=True):
+        absolute_url = urldefrag(urljoin(base_url, link['href']))[0]
+        parsed = urlparse(absolute_url)
+        path = parsed.path.lower()
+        
+        if parsed.scheme not in ('http', 'https') or parsed.netloc != base.netloc:
+            continue
+        if path.endswith(CRAWL_SKIP_EXTENSIONS):
+            continue
+        if not any(keyword in path for keyword in CRAWL_SECTION_KEYWORDS):
+            continue
+        if absolute_url.rstrip('/') in seen:
+            continue
+        
+        seen.add(absolute_url.rstrip('/'))
+        section_urls.append(absolute_url)
+        if len(section_urls) >= CRAWL_MAX_PAGES:
+            break
+    
+    return section_urls
+
+def _scrape_section_page(url: str) -> dict:
+    with _crawl_host_limit(urlparse(url).netloc):
+        return scrape_page(url)
+
+def crawl_section_pages(section_urls: List[str]) -> list:
+    """Fetch and extract section pages concurrently within the crawl budget.
+
+    Returns the scrape_page result for each page that finished in time, in
+    link order. Failed or slow pages are skipped rather than failing the
+    whole conversion.
+    """
+    crawl_start = time.perf_counter()
+    futures = [crawl_executor.submit(_scrape_section_page, url) for url in section_urls]
+    done, not_done = wait(futures, timeout=CRAWL_TIME_BUDGET)
+    for future in not_done:
+        future.cancel()
+    
+    results = []
+    for url, future in zip(section_urls, futures):
+        if future not in done:
+            print(f"Crawl budget exhausted before {url} finished")
+            metrics.incr('crawl.pages_timed_out')
+            continue
+        try:
+            results.append(future.result())
+        except Exception as e:
+            print(f"Skipping section page {url}: {str(e)}")
+            metrics.incr('crawl.pages_failed')
+    
+    metrics.incr('crawl.pages_fetched', len(results))
+    metrics.observe('crawl.seconds', time.perf_counter() - crawl_start)
+    return results
+
+def _merge_key(item):
+    if isinstance(item, dict) and item.get('title'):
+        return item['title'].strip().lower()
+    if isinstance(item, str):
+        return item.strip().lower()
+    return json.dumps(item, sort_keys=True)
+
+def merge_portfolio_data(portfolio_data: dict, page_data: dict) -> dict:
+    """Merge data scraped from a section page into the landing page data"""
+    for key, value in page_data.items():
+        if isinstance(value, list):
+            existing = portfolio_data.setdefault(key, [])
+            existing_keys = {_merge_key(item) for item in existing}
+            for item in value:
+                if _merge_key(item) not in existing_keys:
+                    existing_keys.add(_merge_key(item))
+                    existing.append(item)
+        elif value and not portfolio_data.get(key):
+            portfolio_data[key] = value
+        elif key == 'about' and len(value) > len(portfolio_data[key]):
+            # Dedicated about pages usually carry the fuller summary
+            portfolio_data[key] = value
+    return portfolio_data
+
+def extract_resume_data_from_portfolio(portfolio_text: str, on_delta=None) -> dict:
+    """Extract resume data from portfolio text using AI for professional resume generation"""
+    try:
+        extracted_text = run_prompt('summarise', on_delta=on_delta, portfolio_text=portfolio_text)
         
         return {
-            'extracted_text': chat_completion.choices[0].message.content,
+            'extracted_text': extracted_text,
             'portfolio_text': portfolio_text
         }
         
@@ -545,6 +3344,44 @@ Ensure the extracted data is professional, well-structured, and ready for high-q
         print(f"Error extracting resume data: {str(e)}")
         raise e
 
+def format_structured_resume_text(portfolio_data: dict) -> str:
+    """Render structured portfolio data in the same layout the extraction
+    prompt asks the model for, so it can go straight to get_all_info()."""
+    contact = [portfolio_data.get(key, '') for key in ('email', 'phone', 'location', 'linkedin', 'github')]
+    lines = [
+        f"NAME: {portfolio_data['name']}",
+        f"TITLE: {portfolio_data['title']}",
+        f"CONTACT: {', '.join(item for item in contact if item)}",
+        f"ABOUT: {portfolio_data['about']}",
+        "EDUCATION:",
+    ]
+    for edu in portfolio_data['education']:
+        details = [edu.get('Degree_name'), edu.get('year'), edu.get('marks')]
+        lines.append(f"- {edu.get('Institute_name', '')}: {', '.join(item for item in details if item)}")
+    lines.append(f"SKILLS: {', '.join(portfolio_data['skills'])}")
+    lines.append("PROJECTS:")
+    for project in portfolio_data['projects']:
+        line = f"- {project['title']}: {project['desc']}"
+        if project['tech']:
+            line += f" (Technologies: {', '.join(project['tech'])})"
+        if project['github']:
+            line += f" GitHub: {project['github']}"
+        if project['demo']:
+            line += f" Demo: {project['demo']}"
+        lines.append(line)
+    lines.append("EXPERIENCE:")
+    for exp in portfolio_data['experience']:
+        line = f"- {exp['Position']} at {exp['Company']}"
+        if exp.get('Duration'):
+            line += f" ({exp['Duration']})"
+        if exp.get('Skills'):
+            line += f" Skills: {', '.join(exp['Skills'])}"
+        lines.append(line)
+    lines.append("ACHIEVEMENTS:")
+    for achievement in portfolio_data['achievements']:
+        lines.append(f"- {achievement['achievement_name']}: {achievement.get('description', '')}")
+    return '\n'.join(lines)
+
 def generate_enhanced_latex_resume(resume_data: dict, template: str = "professional") -> str:
     """Generate highly professional LaTeX resume matching the provided template format"""
     
@@ -1738,23 +4575,429 @@ document.head.appendChild(styleSheet);
 
     return base_js
 
+class UploadRequest(Request):
+    """Request that keeps uploaded files in a bounded in-memory buffer.
+
+    Werkzeug writes uploads over 500KB to a temporary file on disk; here
+    they stay in memory up to UPLOAD_SPOOL_MAX_BYTES and only then spill
+    to UPLOAD_SPILL_DIR (tmpfs by default). Spilled files are anonymous,
+    so nothing is left behind if the process dies mid-request.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES, dir=UPLOAD_SPILL_DIR)
+
 app = Flask(__name__)
+app.request_class = UploadRequest
+app.config['MAX_CONTENT_LENGTH'] = UPLOAD_MAX_BYTES
 CORS(app)
 
 # Create directories
-UPLOAD_FOLDER = 'uploads'
 GENERATED_FOLDER = 'generated_websites'
-for folder in [UPLOAD_FOLDER, GENERATED_FOLDER]:
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+if not os.path.exists(GENERATED_FOLDER):
+    os.makedirs(GENERATED_FOLDER)
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['GENERATED_FOLDER'] = GENERATED_FOLDER
 ALLOWED_EXTENSIONS = {'pdf'}
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+@app.errorhandler(413)
+def upload_too_large(error):
+    return jsonify({'error': f'File too large, the limit is {UPLOAD_MAX_BYTES // (1024 * 1024)}MB'}), 413
+
+def provider_busy_response(error: ProviderBusyError):
+    """503 with a Retry-After hint for calls the model rate limiter turned away"""
+    print(f"⏳ Model provider busy: {str(error)}")
+    response = jsonify({'error': f'The AI service is busy, please retry shortly: {str(error)}'})
+    response.status_code = 503
+    if error.retry_after:
+        response.headers['Retry-After'] = str(max(1, round(error.retry_after)))
+    return response
+
+@app.before_request
+def read_llm_cache_bypass():
+    llm_cache_bypass.set(request.headers.get(LLM_CACHE_BYPASS_HEADER, '').lower() in ('1', 'true', 'yes'))
+
+class JobLatencyHistogram(LatencyHistogram):
+    """LatencyHistogram with buckets up to about a day; queue waits and long
+    conversions would all land in the two-minute top bucket"""
+
+    BOUNDS = tuple(round(0.05 * 1.25 ** i, 3) for i in range(66))
+
+class JobQueueFull(Exception):
+    """Too many jobs are waiting; ``retry_after`` is a hint in seconds for the client"""
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class JobQueue:
+    """Persistent queue of background jobs, run by a bounded thread pool.
+
+    Jobs are rows in a SQLite table, so they survive a restart and several
+    processes on one host can share the file. ``handler(job)`` runs each job
+    and returns its response fields; a 503 from it (a busy model provider)
+    puts the job back in the queue after its Retry-After, and running jobs
+    whose heartbeat is older than ``stale_after`` seconds (their process
+    died) are claimed again, both up to ``max_attempts``. Workers start with
+    the first submitted or polled job.
+    """
+
+    FINISHED = ('succeeded', 'failed')
+    POLL_INTERVAL = 1.0
+    PURGE_INTERVAL = 60.0
+
+    def __init__(self, path: str, handler, workers: int, max_queued: int, max_attempts: int,
+                 result_ttl: float, stale_after: float):
+        self.path = path
+        self.handler = handler
+        self.workers = workers
+        self.max_queued = max_queued
+        self.max_attempts = max_attempts
+        self.result_ttl = result_ttl
+        self.stale_after = stale_after
+        self.wait_latency = JobLatencyHistogram(LLM_LATENCY_WINDOW)
+        self.run_latency = JobLatencyHistogram(LLM_LATENCY_WINDOW)
+        self._local = threading.local()
+        self._changed = threading.Condition()
+        self._threads = []
+        self._running = set()
+        self._last_purge = 0.0
+        self._connection().executescript('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                run_after REAL NOT NULL,
+                started_at REAL,
+                heartbeat_at REAL,
+                finished_at REAL,
+                status_code INTEGER,
+                mimetype TEXT,
+                response_headers TEXT,
+                result BLOB,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, run_after);
+        ''')
+        columns = {row['name'] for row in self._connection().execute('PRAGMA table_info(jobs)')}
+        if 'heartbeat_at' not in columns:
+            self._connection().execute('ALTER TABLE jobs ADD COLUMN heartbeat_at REAL')
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _start_workers(self):
+        with self._changed:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f'job-worker-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            thread = threading.Thread(target=self._heartbeat, name='job-heartbeat', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, path: str, headers: dict, body: bytes) -> str:
+        """Queue a job; raises JobQueueFull once ``max_queued`` jobs are waiting"""
+        self._start_workers()
+        connection = self._connection()
+        queued = connection.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+        if queued >= self.max_queued:
+            metrics.incr('jobs.rejected')
+            raise JobQueueFull(f'{queued} jobs are already queued', retry_after=max(1.0, self.run_latency.quantile(0.5)))
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        connection.execute(
+            "INSERT INTO jobs (id, path, headers, body, status, created_at, run_after) VALUES (?, ?, ?, ?, 'queued', ?, ?)",
+            (job_id, path, json.dumps(headers), body, now, now),
+        )
+        metrics.incr('jobs.submitted')
+        with self._changed:
+            self._changed.notify_all()
+        return job_id
+
+    def get(self, job_id: str) -> dict:
+        """The job's row without its request body, or None"""
+        self._start_workers()
+        row = self._connection().execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        del job['body']
+        if job['status'] == 'queued':
+            job['position'] = self._connection().execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'queued' AND created_at < ?", (job['created_at'],)
+            ).fetchone()[0]
+        return job
+
+    def wait(self, job_id: str, timeout: float) -> dict:
+        """get(), long-polling up to ``timeout`` seconds for the job to finish.
+
+        Jobs finished by this process wake the poll at once; jobs of other
+        processes sharing the file are seen within POLL_INTERVAL.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job['status'] in self.FINISHED or remaining <= 0:
+                return job
+            with self._changed:
+                self._changed.wait(min(remaining, self.POLL_INTERVAL))
+
+    def _claim(self) -> dict:
+        connection = self._connection()
+        now = time.time()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            stale = connection.execute(
+                "UPDATE jobs SET status = 'queued', run_after = ? "
+                "WHERE status = 'running' AND COALESCE(heartbeat_at, started_at) < ? AND attempts < ?",
+                (now, now - self.stale_after, self.max_attempts),
+            ).rowcount
+            lost = connection.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, body = NULL, error = 'Job was lost while running' "
+                "WHERE status = 'running' AND COALESCE(heartbeat_at, started_at) < ?",
+                (now, now - self.stale_after),
+            ).rowcount
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' AND run_after <= ? ORDER BY run_after, created_at LIMIT 1", (now,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ?, heartbeat_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    (now, now, row['id'])
+                )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        if stale:
+            print(f"♻️ Requeued {stale} stale job(s)")
+            metrics.incr('jobs.requeued_stale', stale)
+        if lost:
+            print(f"❌ {lost} job(s) lost after {self.max_attempts} attempts")
+            metrics.incr('jobs.failed', lost)
+        if row is None:
+            return None
+        self._running.add(row['id'])
+        wait_seconds = now - row['run_after']
+        metrics.observe('jobs.wait_seconds', wait_seconds)
+        self.wait_latency.observe(wait_seconds)
+        return dict(row, attempts=row['attempts'] + 1, started_at=now)
+
+    def _finish(self, job: dict, outcome: dict):
+        self._running.discard(job['id'])
+        connection = self._connection()
+        now = time.time()
+        run_seconds = now - job['started_at']
+        metrics.observe('jobs.run_seconds', run_seconds)
+        self.run_latency.observe(run_seconds)
+        if outcome.get('status_code') == 503 and job['attempts'] < self.max_attempts:
+            retry_after = outcome.get('retry_after') or 5
+            print(f"⏳ Job {job['id']} hit a busy provider, retrying in {retry_after:g}s")
+            metrics.incr('jobs.retried')
+            connection.execute(
+                "UPDATE jobs SET status = 'queued', run_after = ? WHERE id = ?", (now + retry_after, job['id'])
+            )
+        else:
+            status = 'succeeded' if outcome.get('status_code', 500) < 400 else 'failed'
+            metrics.incr(f'jobs.{status}')
+            connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, body = NULL, status_code = ?, mimetype = ?, "
+                "response_headers = ?, result = ?, error = ? WHERE id = ?",
+                (status, now, outcome.get('status_code'), outcome.get('mimetype'),
+                 json.dumps(outcome.get('headers', {})), outcome.get('body'), outcome.get('error'), job['id']),
+            )
+        with self._changed:
+            self._changed.notify_all()
+
+    def purge(self) -> int:
+        """Drop finished jobs older than ``result_ttl``"""
+        removed = self._connection().execute(
+            "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?", (time.time() - self.result_ttl,)
+        ).rowcount
+        metrics.incr('jobs.purged', removed)
+        return removed
+
+    def _heartbeat(self):
+        """Keep the jobs this process is running from looking stale"""
+        while True:
+            time.sleep(self.stale_after / 4)
+            try:
+                for job_id in list(self._running):
+                    self._connection().execute(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND status = 'running'", (time.time(), job_id)
+                    )
+            except sqlite3.Error as e:
+                print(f"❌ Job heartbeat error: {str(e)}")
+
+    def _work(self):
+        while True:
+            try:
+                job = self._claim()
+                if job is None:
+                    if time.monotonic() - self._last_purge > self.PURGE_INTERVAL:
+                        self._last_purge = time.monotonic()
+                        self.purge()
+                    with self._changed:
+                        self._changed.wait(self.POLL_INTERVAL)
+                    continue
+                try:
+                    outcome = self.handler(job)
+                except Exception as e:
+                    print(f"❌ Job {job['id']} crashed: {str(e)}")
+                    traceback.print_exc()
+                    outcome = {'status_code': 500, 'error': str(e)}
+                self._finish(job, outcome)
+            except sqlite3.Error as e:
+                print(f"❌ Job queue error: {str(e)}")
+                time.sleep(self.POLL_INTERVAL)
+
+    def stats(self) -> dict:
+        connection = self._connection()
+        counts = dict(connection.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+        oldest = connection.execute("SELECT MIN(created_at) FROM jobs WHERE status = 'queued'").fetchone()[0]
+        return {
+            'workers': self.workers,
+            'max_queued': self.max_queued,
+            'queued': counts.get('queued', 0),
+            'running': counts.get('running', 0),
+            'stored_results': counts.get('succeeded', 0) + counts.get('failed', 0),
+            'oldest_queued_seconds': round(time.time() - oldest, 3) if oldest else 0.0,
+            'wait_seconds': self.wait_latency.stats(),
+            'run_seconds': self.run_latency.stats(),
+        }
+
+# Request headers the job handlers read, carried over to the replayed request
+JOB_REQUEST_HEADERS = ('Content-Type', LLM_CACHE_BYPASS_HEADER)
+JOB_RESPONSE_HEADERS = ('Content-Disposition', 'Retry-After')
+
+def run_request_job(job: dict) -> dict:
+    """Replay a queued POST through the app and capture the response"""
+    print(f"🔄 Running job {job['id']} ({job['path']}, attempt {job['attempts']})")
+    response = app.test_client().post(job['path'], data=job['body'], headers=json.loads(job['headers']))
+    outcome = {
+        'status_code': response.status_code,
+        'mimetype': response.mimetype,
+        'headers': {name: response.headers[name] for name in JOB_RESPONSE_HEADERS if name in response.headers},
+        'body': response.get_data(),
+    }
+    if response.is_json and response.status_code >= 400:
+        outcome['error'] = (response.get_json(silent=True) or {}).get('error')
+    if 'Retry-After' in response.headers:
+        outcome['retry_after'] = float(response.headers['Retry-After'])
+    return outcome
+
+job_queue = JobQueue(
+    JOB_QUEUE_PATH, run_request_job, workers=JOB_WORKERS, max_queued=JOB_MAX_QUEUED,
+    max_attempts=JOB_MAX_ATTEMPTS, result_ttl=JOB_RESULT_TTL, stale_after=JOB_STALE_SECONDS,
+) if JOB_QUEUE_ENABLED else None
+
+def wants_async_job() -> bool:
+    return (
+        request.args.get('async', '').lower() in ('1', 'true', 'yes')
+        or 'respond-async' in request.headers.get('Prefer', '').lower()
+    )
+
+def accepts_async_job(view):
+    """Let a POST endpoint run as a background job.
+
+    With ``Prefer: respond-async`` or ``?async=true`` the request is queued
+    and answered at once with 202 and the job's status URL; the worker
+    replays it without those markers, so the view itself is unchanged.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if job_queue is None or not wants_async_job():
+            return view(*args, **kwargs)
+        headers = {name: request.headers[name] for name in JOB_REQUEST_HEADERS if name in request.headers}
+        try:
+            job_id = job_queue.submit(request.path, headers, request.get_data())
+        except JobQueueFull as e:
+            print(f"⏳ Job queue full: {str(e)}")
+            response = jsonify({'error': f'Too many jobs are queued, please retry shortly: {str(e)}'})
+            response.status_code = 503
+            response.headers['Retry-After'] = str(max(1, round(e.retry_after)))
+            return response
+        print(f"📥 Queued job {job_id} for {request.path}")
+        response = jsonify({'success': True, 'job_id': job_id, 'status': 'queued', 'status_url': f'/jobs/{job_id}'})
+        response.status_code = 202
+        response.headers['Location'] = f'/jobs/{job_id}'
+        return response
+    return wrapper
+
+_JOB_ID = re.compile(r'^[0-9a-f]{32}$')
+
+def job_document(job: dict) -> dict:
+    document = {
+        'job_id': job['id'],
+        'path': job['path'],
+        'status': job['status'],
+        'attempts': job['attempts'],
+        'created_at': datetime.fromtimestamp(job['created_at']).isoformat(),
+    }
+    if job['status'] == 'queued':
+        document['position'] = job['position']
+    if job['started_at']:
+        document['queued_seconds'] = round(job['started_at'] - job['created_at'], 3)
+    if job['status'] in JobQueue.FINISHED:
+        document['run_seconds'] = round(job['finished_at'] - job['started_at'], 3) if job['started_at'] else 0.0
+        document['status_code'] = job['status_code']
+        if job['mimetype'] == 'application/json' and job['result']:
+            document['result'] = json.loads(job['result'])
+        elif job['result'] is not None:
+            document['result_url'] = f"/jobs/{job['id']}/result"
+        if job['error']:
+            document['error'] = job['error']
+    return document
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Status of a background job, with the endpoint's JSON response once it
+    has finished. ``?wait=N`` long-polls up to N seconds (at most
+    JOB_POLL_MAX_WAIT) for it to finish."""
+    if job_queue is None:
+        return jsonify({'error': 'Job queue is disabled'}), 404
+    if not _JOB_ID.match(job_id):
+        return jsonify({'error': 'Unknown job'}), 404
+    try:
+        wait_seconds = min(max(float(request.args.get('wait', 0)), 0.0), JOB_POLL_MAX_WAIT)
+    except ValueError:
+        return jsonify({'error': 'wait must be a number of seconds'}), 400
+    
+    job = job_queue.wait(job_id, wait_seconds) if wait_seconds else job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return jsonify(job_document(job))
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """The finished job's response as the endpoint returned it, e.g. a PDF"""
+    if job_queue is None:
+        return jsonify({'error': 'Job queue is disabled'}), 404
+    job = job_queue.get(job_id) if _JOB_ID.match(job_id) else None
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    if job['status'] not in JobQueue.FINISHED or job['result'] is None:
+        return jsonify({'error': f"Job is {job['status']}", 'status_url': f'/jobs/{job_id}'}), 409
+    return Response(job['result'], status=job['status_code'], mimetype=job['mimetype'], headers=json.loads(job['response_headers']))
+
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({
@@ -1770,6 +5013,82 @@ def health_check():
         ]
     })
 
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Expose in-process pipeline metrics"""
+    snapshot = metrics.snapshot()
+    counters = snapshot['counters']
+    http_cache_lookups = sum(counters.get(f'http_cache.{name}', 0) for name in ('hits', 'revalidated', 'misses'))
+    llm_cache_hits = counters.get('llm_cache.memory_hits', 0) + counters.get('llm_cache.disk_hits', 0)
+    llm_cache_lookups = llm_cache_hits + counters.get('llm_cache.misses', 0)
+    upload_cache_lookups = counters.get('upload_cache.hits', 0) + counters.get('upload_cache.misses', 0)
+    return jsonify({
+        'html_parser_backend': ACTIVE_HTML_PARSER,
+        'pdf_text_backend': ACTIVE_PDF_TEXT_BACKEND,
+        'http_client': http_client.stats(),
+        'http_cache': {
+            **(http_cache.stats() if http_cache else {'enabled': False}),
+            'hit_ratio': (counters.get('http_cache.hits', 0) + counters.get('http_cache.revalidated', 0)) / http_cache_lookups if http_cache_lookups else 0.0,
+            'bytes_saved': counters.get('http_cache.bytes_saved', 0),
+        },
+        'singleflight': {
+            flight.name: {
+                **flight.stats(),
+                'executed': counters.get(f'singleflight.{flight.name}.executed', 0),
+                'coalesced': counters.get(f'singleflight.{flight.name}.coalesced', 0),
+            }
+            for flight in (conversion_flight, upload_flight)
+        },
+        'prompts': prompt_stats(),
+        'llm_limiter': {
+            limiter.name: {
+                **limiter.stats(),
+                **{
+                    event: counters.get(f'llm_limiter.{limiter.name}.{event}', 0)
+                    for event in ('throttled', 'rejected', 'retries', 'provider_throttled', 'concurrency_decreases')
+                },
+            }
+            for limiter in (groq_limiter, gemini_limiter)
+        },
+        'extraction': {
+            'rule_based_enabled': RULE_BASED_EXTRACTION_ENABLED,
+            'min_confidence': RULE_BASED_MIN_CONFIDENCE,
+            'requests': counters.get('extract.requests', 0),
+            'rule_based': counters.get('extract.rule_based', 0),
+            'no_llm': counters.get('extract.no_llm', 0),
+            'llm_fill': counters.get('extract.llm_fill', 0),
+            'no_llm_share': counters.get('extract.no_llm', 0) / counters['extract.requests'] if counters.get('extract.requests') else 0.0,
+            'llm_seconds_saved': counters.get('extract.llm_seconds_saved', 0),
+        },
+        'llm_latency': {provider: histogram.stats() for provider, histogram in provider_latency.items()},
+        'llm_hedge': {
+            'enabled': LLM_HEDGE_ENABLED,
+            'primary': LLM_HEDGE_PRIMARY,
+            'delay_seconds': hedge_delay(LLM_HEDGE_PRIMARY),
+            **{
+                event: counters.get(f'llm_hedge.{event}', 0)
+                for event in ('calls', 'hedged', 'failovers', 'backup_wins', 'cancelled')
+            },
+        },
+        'upload_cache': {
+            **(upload_cache.stats() if upload_cache else {'enabled': False}),
+            'hit_ratio': counters.get('upload_cache.hits', 0) / upload_cache_lookups if upload_cache_lookups else 0.0,
+        },
+        'jobs': {
+            **(job_queue.stats() if job_queue else {'enabled': False}),
+            **{
+                event: counters.get(f'jobs.{event}', 0)
+                for event in ('submitted', 'rejected', 'succeeded', 'failed', 'retried', 'requeued_stale')
+            },
+        },
+        'llm_cache': {
+            **(llm_cache.stats() if llm_cache else {'enabled': False}),
+            'hit_ratio': llm_cache_hits / llm_cache_lookups if llm_cache_lookups else 0.0,
+            'seconds_saved': counters.get('llm_cache.seconds_saved', 0),
+        },
+        **snapshot
+    })
+
 @app.route('/test', methods=['GET'])
 def test_endpoint():
     """Test endpoint to verify system functionality"""
@@ -1835,6 +5154,7 @@ def test_endpoint():
         }), 500
 
 @app.route('/', methods=['POST'])
+@accepts_async_job
 def upload_pdf():
     try:
         if 'file' not in request.files:
@@ -1843,54 +5163,354 @@ def upload_pdf():
         file = request.files['file']
         if file.filename == '' or not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file'}), 400
-
-        # Save and process file
-        unique_filename = f"{uuid.uuid4()}_{file.filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
         
+        upload_size = file.stream.seek(0, os.SEEK_END)
+        metrics.observe('upload.bytes', upload_size)
+        metrics.incr('upload.spilled' if upload_size > UPLOAD_SPOOL_MAX_BYTES else 'upload.in_memory')
+        
+        # Identical uploads in flight at the same time share one parse
+        content_hash = hash_upload(file.stream)
+        flight_key = DiskCache.make_key(content_hash, llm_cache_bypass.get())
         try:
-            file.save(filepath)
-            
-            # Extract text from PDF
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                if len(pdf_reader.pages) > 0:
-                    content = pdf_reader.pages[0].extract_text()
-                else:
-                    return jsonify({'error': 'PDF file has no pages'}), 400
-            
-            if not content:
-                return jsonify({'error': 'Could not extract text from PDF'}), 400
-            
-            # Parse with GROQ
-            info = get_all_info(content)
-            
-            # Convert to dict for website generation
-            data = {
-                "name": info.name,
-                "education": [{"Institute_name": edu.Institute_name, "Degree_name": edu.Degree_name, "Marks": edu.marks} for edu in info.Education],
-                "Contact_Info": info.Contact_Info,
-                "skills": info.Skills,
-                "projects": [{"title": p.project_name, "desc": p.about_project, "tech": p.skills_used} for p in info.Projects],
-                "Experience": [{"Company": exp.Company_name, "Position": exp.Position_name, "Skills": exp.skills_used} for exp in info.Experience],
-                "Achievements": [{"achievement_name": a.Achivement_name, "institute_name": a.institute_name, "description": a.about} for a in info.Achivements],
-                "Position_of_responsibility": [{"position_name": p.Position_name, "soc_name": p.Society_name, "description": p.Description} for p in info.Position_of_Responsibility]
-            }
-            
-            return jsonify({
-                'success': True,
-                'data': data,
-                'message': 'Resume parsed successfully'
-            })
-            
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            data, cached = upload_flight.do(flight_key, load_resume_upload, content_hash, file.stream)
+        except ResumeUploadError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify({
+            'success': True,
+            'data': data,
+            'content_hash': content_hash,
+            'cached': cached,
+            'message': 'Resume parsed successfully'
+        })
                 
+    except RequestEntityTooLarge:
+        raise
+    except ProviderBusyError as e:
+        return provider_busy_response(e)
     except Exception as e:
         print(f"Error: {str(e)}")
         return jsonify({'error': f'Failed to process resume: {str(e)}'}), 500
 
+class ResumeUploadError(Exception):
+    """An uploaded resume that cannot be parsed (reported as a 400)"""
+
+_pdf_process_pool = None
+_pdf_process_pool_lock = threading.Lock()
+
+def _get_pdf_process_pool() -> ProcessPoolExecutor:
+    """Workers are started from a clean process, not forked from this one:
+    a fork copies locks that other request threads may be holding (the
+    pdfium backend's lock among them) and the worker would deadlock on them."""
+    global _pdf_process_pool
+    with _pdf_process_pool_lock:
+        if _pdf_process_pool is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _pdf_process_pool = ProcessPoolExecutor(max_workers=PDF_PROCESS_WORKERS,
+                                                    mp_context=multiprocessing.get_context(start_method))
+        return _pdf_process_pool
+
+def _reset_pdf_process_pool():
+    """Drop a broken pool so the next large document starts a new one"""
+    global _pdf_process_pool
+    with _pdf_process_pool_lock:
+        if _pdf_process_pool is not None:
+            _pdf_process_pool.shutdown(wait=False)
+        _pdf_process_pool = None
+
+class PdfTextBackend(abc.ABC):
+    """Text extraction from PDF bytes with one library.
+
+    ``module`` is the import the backend needs; ``supports_layout`` says
+    whether it can keep the page's visual layout (PDF_TEXT_LAYOUT).
+    """
+
+    module = None
+    supports_layout = False
+
+    @abc.abstractmethod
+    def open(self, pdf_bytes: bytes):
+        ...
+
+    @abc.abstractmethod
+    def page_count(self, document) -> int:
+        ...
+
+    @abc.abstractmethod
+    def page_text(self, document, number: int, layout: bool) -> str:
+        ...
+
+    def close(self, document):
+        pass
+
+    def extract_pages(self, document, page_numbers: list, layout: bool) -> list:
+        """Returns ``(page number, text, seconds)`` per page"""
+        pages = []
+        for number in page_numbers:
+            page_start = time.perf_counter()
+            text = self.page_text(document, number, layout) or ''
+            pages.append((number, text, time.perf_counter() - page_start))
+        return pages
+
+class PyPDF2TextBackend(PdfTextBackend):
+    def open(self, pdf_bytes: bytes):
+        return PyPDF2.PdfReader(BytesIO(pdf_bytes))
+
+    def page_count(self, document) -> int:
+        return len(document.pages)
+
+    def page_text(self, document, number: int, layout: bool) -> str:
+        return document.pages[number].extract_text()
+
+class PypdfTextBackend(PdfTextBackend):
+    module = 'pypdf'
+    supports_layout = True
+
+    def open(self, pdf_bytes: bytes):
+        from pypdf import PdfReader
+        return PdfReader(BytesIO(pdf_bytes))
+
+    def page_count(self, document) -> int:
+        return len(document.pages)
+
+    def page_text(self, document, number: int, layout: bool) -> str:
+        if layout:
+            # Layout mode pads with spaces to keep columns apart; trailing runs carry nothing
+            text = document.pages[number].extract_text(extraction_mode='layout')
+            return '\n'.join(line.rstrip() for line in text.splitlines())
+        return document.pages[number].extract_text()
+
+class PdfminerTextBackend(PdfTextBackend):
+    """pdfminer.six always runs its layout analysis, which groups text into
+    boxes per column, so multi-column pages come out in reading order."""
+
+    module = 'pdfminer'
+
+    def open(self, pdf_bytes: bytes):
+        return pdf_bytes
+
+    def page_count(self, document) -> int:
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+        return sum(1 for _ in PDFPage.create_pages(PDFDocument(PDFParser(BytesIO(document)))))
+
+    def page_text(self, document, number: int, layout: bool) -> str:
+        return self.extract_pages(document, [number], layout)[0][1]
+
+    def extract_pages(self, document, page_numbers: list, layout: bool) -> list:
+        # One pass over the document; pdfminer has no cheap random page access
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LAParams, LTTextContainer
+        pages = []
+        page_start = time.perf_counter()
+        layouts = extract_pages(BytesIO(document), page_numbers=page_numbers, laparams=LAParams())
+        for number, page_layout in zip(sorted(page_numbers), layouts):
+            text = ''.join(element.get_text() for element in page_layout if isinstance(element, LTTextContainer))
+            pages.append((number, text, time.perf_counter() - page_start))
+            page_start = time.perf_counter()
+        return pages
+
+class PdfiumTextBackend(PdfTextBackend):
+    """pypdfium2 (PDFium, C++): the fastest backend. PDFium is not thread
+    safe, so calls within one process are serialised."""
+
+    module = 'pypdfium2'
+    _lock = threading.Lock()
+
+    def open(self, pdf_bytes: bytes):
+        import pypdfium2
+        with self._lock:
+            return pypdfium2.PdfDocument(pdf_bytes)
+
+    def page_count(self, document) -> int:
+        with self._lock:
+            return len(document)
+
+    def page_text(self, document, number: int, layout: bool) -> str:
+        with self._lock:
+            page = document[number]
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+
+    def close(self, document):
+        with self._lock:
+            document.close()
+
+# name -> backend, in fallback order
+PDF_TEXT_BACKENDS = {
+    'pypdfium2': PdfiumTextBackend(),
+    'pypdf': PypdfTextBackend(),
+    'pdfminer': PdfminerTextBackend(),
+    'pypdf2': PyPDF2TextBackend(),
+}
+
+def resolve_pdf_text_backend(requested: str) -> str:
+    """Return the configured PDF text backend, or the next installed one"""
+    names = list(PDF_TEXT_BACKENDS)
+    if requested not in PDF_TEXT_BACKENDS:
+        print(f"Unknown PDF_TEXT_BACKEND '{requested}', using pypdf2")
+        return 'pypdf2'
+    for name in names[names.index(requested):]:
+        module = PDF_TEXT_BACKENDS[name].module
+        if module is None or importlib.util.find_spec(module):
+            if name != requested:
+                print(f"PDF text backend '{requested}' is not installed, falling back to '{name}'")
+            if PDF_TEXT_LAYOUT and not PDF_TEXT_BACKENDS[name].supports_layout:
+                print(f"PDF text backend '{name}' has no layout mode, PDF_TEXT_LAYOUT is ignored")
+            return name
+
+ACTIVE_PDF_TEXT_BACKEND = resolve_pdf_text_backend(PDF_TEXT_BACKEND)
+
+def _extract_pdf_pages(backend_name: str, pdf_bytes: bytes, page_numbers: list, layout: bool) -> list:
+    """Extract the given pages in a worker process"""
+    backend = PDF_TEXT_BACKENDS[backend_name]
+    document = backend.open(pdf_bytes)
+    try:
+        return backend.extract_pages(document, page_numbers, layout)
+    finally:
+        backend.close(document)
+
+def extract_pdf_text(pdf_stream) -> str:
+    """Extract the text of up to PDF_MAX_PAGES pages of a binary PDF stream,
+    in page order, with the active PDF text backend.
+
+    Documents with PDF_PARALLEL_MIN_PAGES pages or more are split into
+    contiguous runs of pages, one per worker process. If the pool is not
+    usable the pages are extracted in this process instead.
+    """
+    extract_start = time.perf_counter()
+    backend_name = ACTIVE_PDF_TEXT_BACKEND
+    backend = PDF_TEXT_BACKENDS[backend_name]
+    pdf_stream.seek(0)
+    pdf_bytes = pdf_stream.read()
+    document = backend.open(pdf_bytes)
+    try:
+        page_count = backend.page_count(document)
+        if page_count == 0:
+            raise ResumeUploadError('PDF file has no pages')
+        page_numbers = list(range(min(page_count, PDF_MAX_PAGES)))
+        if page_count > PDF_MAX_PAGES:
+            print(f"⚠️ PDF has {page_count} pages, extracting the first {PDF_MAX_PAGES}")
+            metrics.incr('pdf.truncated')
+        
+        pages = None
+        if len(page_numbers) >= PDF_PARALLEL_MIN_PAGES and PDF_PROCESS_WORKERS > 1:
+            chunk_size = -(-len(page_numbers) // PDF_PROCESS_WORKERS)
+            chunks = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+            try:
+                pool = _get_pdf_process_pool()
+                pages = [
+                    page
+                    for chunk in pool.map(_extract_pdf_pages, [backend_name] * len(chunks), [pdf_bytes] * len(chunks),
+                                          chunks, [PDF_TEXT_LAYOUT] * len(chunks))
+                    for page in chunk
+                ]
+                metrics.incr('pdf.parallel')
+            except BrokenProcessPool as e:
+                print(f"⚠️ PDF process pool unavailable, extracting in-process: {str(e)}")
+                _reset_pdf_process_pool()
+        if pages is None:
+            pages = backend.extract_pages(document, page_numbers, PDF_TEXT_LAYOUT)
+    finally:
+        backend.close(document)
+    
+    for number, text, seconds in pages:
+        metrics.observe(f'pdf.{backend_name}.page_seconds', seconds)
+    metrics.incr('pdf.pages', len(pages))
+    elapsed = time.perf_counter() - extract_start
+    metrics.observe(f'pdf.{backend_name}.extract_seconds', elapsed)
+    slowest = max(pages, key=lambda page: page[2])
+    print(f"📄 Extracted {len(pages)} PDF pages with {backend_name} in {elapsed:.2f}s (slowest: page {slowest[0] + 1}, {slowest[2]:.2f}s)")
+    return '\n\n'.join(text.strip() for number, text, seconds in sorted(pages) if text.strip())
+
+def hash_upload(stream) -> str:
+    """SHA-256 of an uploaded file, read in chunks; leaves the stream rewound"""
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(64 * 1024), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+def parse_resume_upload(pdf_stream) -> Candidate:
+    """Extract and parse an uploaded PDF resume.
+
+    ``pdf_stream`` is read in place; nothing is written to disk.
+    """
+    content = extract_pdf_text(pdf_stream)
+    if not content:
+        raise ResumeUploadError('Could not extract text from PDF')
+    
+    # Parse with GROQ
+    return get_all_info(content)
+
+def resume_upload_data(info: Candidate) -> dict:
+    """Convert a parsed resume to the dict used for website generation"""
+    return {
+        "name": info.name,
+        "education": [{"Institute_name": edu.Institute_name, "Degree_name": edu.Degree_name, "Marks": edu.marks} for edu in info.Education],
+        "Contact_Info": info.Contact_Info,
+        "skills": info.Skills,
+        "projects": [{"title": p.project_name, "desc": p.about_project, "tech": p.skills_used} for p in info.Projects],
+        "Experience": [{"Company": exp.Company_name, "Position": exp.Position_name, "Skills": exp.skills_used} for exp in info.Experience],
+        "Achievements": [{"achievement_name": a.Achivement_name, "institute_name": a.institute_name, "description": a.about} for a in info.Achivements],
+        "Position_of_responsibility": [{"position_name": p.Position_name, "soc_name": p.Society_name, "description": p.Description} for p in info.Position_of_Responsibility]
+    }
+
+upload_cache = DiskCache(UPLOAD_CACHE_DIR, UPLOAD_CACHE_MAX_BYTES, ttl=UPLOAD_CACHE_TTL) if UPLOAD_CACHE_ENABLED else None
+
+def upload_cache_key(content_hash: str) -> str:
+    # A new parse prompt or text extraction setting can change the result for the same file
+    return DiskCache.make_key('upload', content_hash, PROMPTS['parse'].id, PDF_MAX_PAGES, ACTIVE_PDF_TEXT_BACKEND, PDF_TEXT_LAYOUT)
+
+def load_resume_upload(content_hash: str, pdf_stream) -> tuple:
+    """Website data for an uploaded resume, from upload_cache when the same
+    file was parsed before. Returns ``(data, cached)``.
+
+    Entries hold the parsed Candidate and the derived dict, keyed by the
+    file's SHA-256; LLM_CACHE_BYPASS_HEADER forces a fresh parse.
+    """
+    key = upload_cache_key(content_hash)
+    if upload_cache is not None and not llm_cache_bypass.get():
+        entry = upload_cache.get(key)
+        if entry is not None:
+            metrics.incr('upload_cache.hits')
+            print(f"⚡ Upload cache hit for {content_hash[:12]}")
+            return entry['data'], True
+        metrics.incr('upload_cache.misses')
+    
+    info = parse_resume_upload(pdf_stream)
+    data = resume_upload_data(info)
+    if upload_cache is not None:
+        evicted = upload_cache.set(key, {'candidate': info.model_dump(), 'data': data})
+        metrics.incr('upload_cache.evictions', evicted)
+    return data, False
+
+_CONTENT_HASH = re.compile(r'^[0-9a-f]{64}$')
+
+@app.route('/upload-cache/<content_hash>', methods=['DELETE'])
+def invalidate_upload_cache(content_hash):
+    """Forget the cached parse of one uploaded file (its ``content_hash``)"""
+    if upload_cache is None:
+        return jsonify({'error': 'Upload cache is disabled'}), 404
+    if not _CONTENT_HASH.match(content_hash):
+        return jsonify({'error': 'content_hash must be a SHA-256 hex digest'}), 400
+    removed = upload_cache.delete(upload_cache_key(content_hash))
+    return jsonify({'success': True, 'removed': removed})
+
+@app.route('/upload-cache', methods=['DELETE'])
+def clear_upload_cache():
+    """Forget every cached upload parse"""
+    if upload_cache is None:
+        return jsonify({'error': 'Upload cache is disabled'}), 404
+    upload_cache.clear()
+    return jsonify({'success': True})
+
 @app.route('/generate-website', methods=['POST'])
 def generate_website():
     try:
@@ -1930,45 +5550,162 @@ def generate_website():
         print(f"Error generating website: {str(e)}")
         return jsonify({'error': f'Failed to generate website: {str(e)}'}), 500
 
+class ComponentEditError(Exception):
+    """A model response that does not yield usable component HTML"""
+
+_COMPONENT_SECTION = re.compile(r'^\s*=+\s*component\s+(\d+)\s*=+\s*$', re.IGNORECASE | re.MULTILINE)
+_CODE_FENCE = re.compile(r'^\s*```[\w-]*\s*$', re.MULTILINE)
+_PATCH_BLOCK = re.compile(
+    r'^<{5,}\s*SEARCH\s*\n(.*?)\n={5,}\s*\n(.*?)\n?>{5,}\s*REPLACE\s*$',
+    re.DOTALL | re.MULTILINE
+)
+
+def compact_component_html(component_html: str) -> str:
+    """Drop indentation and blank lines; the generated markup is indented
+    for reading, which the model gains nothing from"""
+    return '\n'.join(line.strip() for line in component_html.splitlines() if line.strip())
+
+def format_component_batch(components: list) -> str:
+    sections = []
+    for number, component in enumerate(components, 1):
+        sections.append(
+            f"=== component {number} ===\n"
+            f"Type: {component['component_type']}\n"
+            f"Instructions: {component['instructions']}\n"
+            f"HTML:\n{component['component_html']}"
+        )
+    return '\n\n'.join(sections)
+
+def split_component_sections(response_text: str, count: int) -> dict:
+    """Split a model response into per-component sections keyed by number.
+
+    Markdown fences are ignored wherever they appear. A response without
+    section headers is taken as the answer for a lone component.
+    """
+    text = _CODE_FENCE.sub('', response_text)
+    headers = list(_COMPONENT_SECTION.finditer(text))
+    if not headers:
+        return {1: text.strip()} if count == 1 else {}
+    sections = {}
+    for header, following in zip(headers, headers[1:] + [None]):
+        end = following.start() if following else len(text)
+        sections.setdefault(int(header.group(1)), text[header.end():end].strip())
+    return sections
+
+def _find_patch_target(html: str, search: str) -> tuple:
+    start = html.find(search)
+    if start != -1:
+        return start, start + len(search)
+    # Models often re-indent or re-wrap the lines they copy, and they see the
+    # compacted markup; any whitespace run still has to match whitespace
+    pattern = r'\s+'.join(re.escape(token) for token in search.split())
+    match = re.search(pattern, html)
+    if not match:
+        raise ComponentEditError(f"edit does not match the component: {search[:80]!r}")
+    return match.span()
+
+def apply_component_section(component_html: str, section: str) -> tuple:
+    """Apply one response section to a component.
+
+    Returns ``(html, mode)`` where mode is ``patch`` for SEARCH/REPLACE
+    blocks and ``full`` for a complete replacement.
+    """
+    blocks = _PATCH_BLOCK.findall(section)
+    if blocks:
+        html = component_html
+        for search, replacement in blocks:
+            if not search.strip():
+                raise ComponentEditError("edit has an empty SEARCH block")
+            start, end = _find_patch_target(html, search)
+            html = html[:start] + replacement + html[end:]
+        return html, 'patch'
+    # Anything around the markup is commentary the model was asked to leave out
+    start, end = section.find('<'), section.rfind('>')
+    if start == -1 or end < start:
+        raise ComponentEditError("response contains no HTML")
+    return section[start:end + 1], 'full'
+
+def modify_components(components: list) -> list:
+    """Apply edit instructions to several components with one Gemini call.
+
+    Each component is a dict with ``component_html``, ``component_type``
+    and ``instructions``. Returns one result per component, in order, with
+    ``success`` and either ``modified_html`` and ``edit_mode`` or ``error``.
+    Only the prompt's copy of the markup is compacted; patches are applied
+    to the HTML as sent, so untouched parts keep their formatting.
+    """
+    prompt = PROMPTS['modify_component']
+    compacted = [{**component, 'component_html': compact_component_html(component['component_html'])} for component in components]
+    response_text = gemini_generate_text(prompt.id, prompt.text(components=format_component_batch(compacted)))
+    sections = split_component_sections(response_text, len(components))
+    
+    results = []
+    for number, component in enumerate(components, 1):
+        try:
+            if number not in sections:
+                raise ComponentEditError("no response for this component")
+            modified_html, mode = apply_component_section(component['component_html'], sections[number])
+            metrics.incr(f'modify_component.{mode}')
+            results.append({'success': True, 'modified_html': modified_html, 'edit_mode': mode})
+        except ComponentEditError as e:
+            print(f"⚠️ Component {number} ({component['component_type']}) not modified: {str(e)}")
+            metrics.incr('modify_component.failed')
+            results.append({'success': False, 'error': str(e)})
+    return results
+
 @app.route('/modify-component', methods=['POST'])
 def modify_component():
+    """Modify one component, or with ``components`` a batch of them.
+
+    A batch is a list of ``{component_html, component_type, instructions}``
+    where ``instructions`` defaults to the top-level ``instructions``; it is
+    answered with per-component ``results``.
+    """
     try:
-        request_data = request.get_json()
-        component_html = request_data.get('component_html')
+        request_data = request.get_json(silent=True) or {}
         instructions = request_data.get('instructions')
+        
+        if 'components' in request_data:
+            components = request_data['components']
+            if not isinstance(components, list) or not components:
+                return jsonify({'error': 'components must be a non-empty list'}), 400
+            if len(components) > MODIFY_COMPONENT_MAX_BATCH:
+                return jsonify({'error': f'At most {MODIFY_COMPONENT_MAX_BATCH} components per batch'}), 400
+            components = [
+                {**component, 'instructions': component.get('instructions') or instructions}
+                for component in components if isinstance(component, dict)
+            ]
+            if len(components) != len(request_data['components']) or not all(
+                all([component.get('component_html'), component.get('instructions'), component.get('component_type')])
+                for component in components
+            ):
+                return jsonify({'error': 'Missing required data'}), 400
+            
+            results = modify_components(components)
+            return jsonify({'success': all(result['success'] for result in results), 'results': results})
+        
+        component_html = request_data.get('component_html')
         component_type = request_data.get('component_type')
         
         if not all([component_html, instructions, component_type]):
             return jsonify({'error': 'Missing required data'}), 400
         
-        # Use Gemini to modify the component
-        prompt = f"""
-        You are a web developer. I have an HTML component that I want to modify based on user instructions.
-        
-        Current HTML component:
-        {component_html}
-        
-        Component type: {component_type}
-        
-        User instructions: {instructions}
-        
-        Please provide the modified HTML component that follows the user's instructions while maintaining the same structure and CSS classes. Only return the HTML code, no explanations.
-        """
-        
-        response = gemini_model.generate_content(prompt)
-        modified_html = response.text.strip()
-        
-        # Clean up the response (remove markdown formatting if present)
-        if modified_html.startswith('```html'):
-            modified_html = modified_html[7:]
-        if modified_html.endswith('```'):
-            modified_html = modified_html[:-3]
+        result = modify_components([{
+            'component_html': component_html,
+            'component_type': component_type,
+            'instructions': instructions,
+        }])[0]
+        if not result['success']:
+            raise ComponentEditError(result['error'])
         
         return jsonify({
             'success': True,
-            'modified_html': modified_html.strip()
+            'modified_html': result['modified_html'],
+            'edit_mode': result['edit_mode']
         })
         
+    except ProviderBusyError as e:
+        return provider_busy_response(e)
     except Exception as e:
         print(f"Error modifying component: {str(e)}")
         return jsonify({'error': f'Failed to modify component: {str(e)}'}), 500
@@ -2011,12 +5748,14 @@ def download_website(website_id):
         return jsonify({'error': f'Failed to create download: {str(e)}'}), 500
 
 @app.route('/convert-portfolio', methods=['POST'])
+@accepts_async_job
 def convert_portfolio():
     """Convert portfolio URL to resume data with enhanced logging"""
     try:
         request_data = request.get_json()
         portfolio_url = request_data.get('portfolioUrl')
         template = request_data.get('template', 'professional')
+        crawl = request_data.get('crawl')
         
         print(f"\n🔄 PORTFOLIO CONVERSION REQUEST")
         print(f"URL: {portfolio_url}")
@@ -2028,7 +5767,7 @@ def convert_portfolio():
         
         # Use enhanced extraction
         print("🔍 Starting enhanced portfolio data extraction...")
-        resume_data = enhanced_portfolio_data_extraction(portfolio_url)
+        resume_data = coalesced_portfolio_extraction(portfolio_url, crawl=crawl)
         
         print(f"✅ Portfolio conversion completed successfully!")
         print(f" Final data summary:")
@@ -2044,12 +5783,216 @@ def convert_portfolio():
             'message': 'Portfolio converted to professional resume successfully'
         })
         
+    except ProviderBusyError as e:
+        return provider_busy_response(e)
     except Exception as e:
         print(f"❌ Portfolio conversion error: {str(e)}")
         traceback.print_exc()
         return jsonify({'error': f'Failed to convert portfolio: {str(e)}'}), 500
 
+conversion_flight = SingleFlight('convert')
+upload_flight = SingleFlight('upload')
+
+def normalize_portfolio_url(url: str) -> str:
+    """Canonical form of a portfolio URL for request coalescing: lowercase
+    scheme and host, no default port, fragment or trailing slash, sorted
+    query parameters."""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower() or 'https'
+    host = (parsed.hostname or '').lower()
+    if parsed.port and parsed.port != {'http': 80, 'https': 443}.get(scheme):
+        host = f'{host}:{parsed.port}'
+    query = '&'.join(sorted(part for part in parsed.query.split('&') if part))
+    return f"{scheme}://{host}{parsed.path.rstrip('/')}" + (f'?{query}' if query else '')
+
+def coalesced_portfolio_extraction(portfolio_url: str, crawl: bool = None, fallback: bool = True) -> dict:
+    """enhanced_portfolio_data_extraction, shared between identical concurrent requests.
+
+    Requests bypassing the LLM cache only share a flight with each other, so
+    they never receive a result built from cached responses.
+    """
+    key = DiskCache.make_key(normalize_portfolio_url(portfolio_url), crawl, fallback, llm_cache_bypass.get())
+    return conversion_flight.do(key, enhanced_portfolio_data_extraction, portfolio_url, crawl=crawl, fallback=fallback)
+
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_CONVERT_CONCURRENCY, thread_name_prefix='batch')
+
+def _convert_batch_item(portfolio_url: str, crawl: bool = None) -> dict:
+    item_start = time.perf_counter()
+    try:
+        return coalesced_portfolio_extraction(portfolio_url, crawl=crawl, fallback=False)
+    finally:
+        metrics.observe('batch.item_seconds', time.perf_counter() - item_start)
+
+@app.route('/convert-portfolio/batch', methods=['POST'])
+def convert_portfolio_batch():
+    """Convert many portfolio URLs, streaming one NDJSON line per finished item.
+
+    Lines arrive in completion order and carry the item's ``index`` in the
+    request. A final ``{"done": true, ...}`` line summarises the batch.
+    """
+    request_data = request.get_json(silent=True) or {}
+    portfolio_urls = request_data.get('portfolioUrls')
+    template = request_data.get('template', 'professional')
+    crawl = request_data.get('crawl')
+    
+    if not isinstance(portfolio_urls, list) or not portfolio_urls:
+        return jsonify({'error': 'portfolioUrls must be a non-empty list'}), 400
+    if len(portfolio_urls) > BATCH_CONVERT_MAX_URLS:
+        return jsonify({'error': f'At most {BATCH_CONVERT_MAX_URLS} portfolio URLs per batch'}), 400
+    
+    print(f"\n🔄 BATCH PORTFOLIO CONVERSION REQUEST")
+    print(f"URLs: {len(portfolio_urls)}")
+    print(f"Template: {template}")
+    metrics.incr('batch.requests')
+    metrics.incr('batch.items', len(portfolio_urls))
+    
+    def generate():
+        batch_start = time.perf_counter()
+        futures = {}
+        succeeded = 0
+        failed = 0
+        try:
+            for index, portfolio_url in enumerate(portfolio_urls):
+                if not isinstance(portfolio_url, str) or urlparse(portfolio_url).scheme not in ('http', 'https'):
+                    failed += 1
+                    metrics.incr('batch.items_failed')
+                    yield json.dumps({
+                        'index': index,
+                        'portfolioUrl': portfolio_url,
+                        'success': False,
+                        'error': 'Invalid portfolio URL'
+                    }) + '\n'
+                    continue
+                # Each worker runs in a copy of this request's context so the
+                # LLM cache bypass flag carries over
+                context = contextvars.copy_context()
+                futures[batch_executor.submit(context.run, _convert_batch_item, portfolio_url, crawl)] = (index, portfolio_url)
+            
+            for future in as_completed(futures):
+                index, portfolio_url = futures[future]
+                try:
+                    line = {
+                        'index': index,
+                        'portfolioUrl': portfolio_url,
+                        'success': True,
+                        'data': future.result(),
+                        'template': template
+                    }
+                    succeeded += 1
+                    metrics.incr('batch.items_succeeded')
+                except Exception as e:
+                    print(f"❌ Batch item {index} ({portfolio_url}) failed: {str(e)}")
+                    line = {
+                        'index': index,
+                        'portfolioUrl': portfolio_url,
+                        'success': False,
+                        'error': f'Failed to convert portfolio: {str(e)}'
+                    }
+                    failed += 1
+                    metrics.incr('batch.items_failed')
+                yield json.dumps(line) + '\n'
+            
+            print(f"✅ Batch conversion finished: {succeeded} succeeded, {failed} failed")
+            yield json.dumps({
+                'done': True,
+                'total': len(portfolio_urls),
+                'succeeded': succeeded,
+                'failed': failed,
+                'seconds': round(time.perf_counter() - batch_start, 3)
+            }) + '\n'
+        finally:
+            # Client went away or we finished: drop work that has not started
+            for future in futures:
+                future.cancel()
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+class ConversionCancelled(Exception):
+    """Raised inside a streamed conversion once its client has disconnected"""
+
+STREAM_HEARTBEAT_SECONDS = 15
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.route('/convert-portfolio/stream', methods=['POST'])
+def convert_portfolio_stream():
+    """Convert a portfolio URL, streaming progress as server-sent events.
+
+    Emits the stage events from enhanced_portfolio_data_extraction, then
+    ``result`` with the same payload /convert-portfolio returns (or
+    ``error``). Comment lines are sent while a stage is quiet so proxies do
+    not time the connection out.
+    """
+    request_data = request.get_json(silent=True) or {}
+    portfolio_url = request_data.get('portfolioUrl')
+    template = request_data.get('template', 'professional')
+    crawl = request_data.get('crawl')
+    
+    if not portfolio_url:
+        return jsonify({'error': 'Portfolio URL is required'}), 400
+    
+    print(f"\n🔄 STREAMING PORTFOLIO CONVERSION REQUEST")
+    print(f"URL: {portfolio_url}")
+    metrics.incr('stream.requests')
+    
+    events = queue.Queue()
+    cancelled = threading.Event()
+    
+    def on_event(name, data):
+        if cancelled.is_set():
+            raise ConversionCancelled()
+        events.put((name, data))
+    
+    def run():
+        try:
+            resume_data = enhanced_portfolio_data_extraction(portfolio_url, crawl=crawl, on_event=on_event)
+            events.put(('result', {
+                'success': True,
+                'data': resume_data,
+                'template': template,
+                'message': 'Portfolio converted to professional resume successfully'
+            }))
+        except ConversionCancelled:
+            print(f"Streaming conversion of {portfolio_url} cancelled by client")
+            metrics.incr('stream.cancelled')
+        except Exception as e:
+            traceback.print_exc()
+            events.put(('error', {'error': f'Failed to convert portfolio: {str(e)}'}))
+        finally:
+            events.put(None)
+    
+    # A copy of the request context carries the LLM cache bypass flag
+    worker = threading.Thread(target=contextvars.copy_context().run, args=(run,), daemon=True)
+    
+    def generate():
+        worker.start()
+        try:
+            while True:
+                try:
+                    item = events.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                if item is None:
+                    break
+                yield sse_event(*item)
+        finally:
+            # Stops the pipeline at its next stage if the client went away
+            cancelled.set()
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/generate-resume-pdf', methods=['POST'])
+@accepts_async_job
 def generate_resume_pdf():
     """Generate high-quality professional PDF resume from LaTeX"""
     try:
@@ -2095,21 +6038,95 @@ def generate_resume_pdf():
         return jsonify({'error': f'Failed to generate professional resume PDF: {str(e)}'}), 500
 
 # Add this function after the scrape_portfolio function
-def enhanced_portfolio_data_extraction(portfolio_url: str) -> dict:
-    """Enhanced portfolio data extraction with comprehensive logging"""
+def enhanced_portfolio_data_extraction(portfolio_url: str, crawl: bool = None, fallback: bool = True, on_event=None) -> dict:
+    """Enhanced portfolio data extraction with comprehensive logging.
+
+    With ``fallback=False`` extraction errors are raised instead of being
+    replaced by placeholder resume data. ``on_event(name, data)``, when
+    given, is called as each stage finishes: ``fetched``, ``scraped``,
+    ``rule_based`` when the scraped data is confident enough to skip the
+    full model extraction, ``llm_started``/``llm_delta``/``llm_completed``
+    per model call, and ``parsed``.
+    """
     print(f"🔍 Starting enhanced data extraction for: {portfolio_url}")
+    emit = on_event or (lambda name, data: None)
+    
+    def llm_stage(stage):
+        emit('llm_started', {'stage': stage})
+        return lambda text: emit('llm_delta', {'stage': stage, 'text': text})
     
     try:
         # Scrape portfolio
-        portfolio_text = scrape_portfolio(portfolio_url)
-        print(f"✅ Portfolio scraping completed. Text length: {len(portfolio_text)}")
+        try:
+            scraped = scrape_portfolio_data(portfolio_url, crawl=crawl, on_event=on_event)
+            emit('scraped', {
+                'portfolio_data': scraped['portfolio_data'],
+                'structured': scraped['structured'],
+                'confidence': scraped['confidence'],
+            })
+        except PortfolioFetchError as e:
+            print(f"Failed to scrape {portfolio_url}: {str(e)}")
+            emit('fetch_failed', {'url': portfolio_url, 'error': str(e)})
+            scraped = None
+        
+        metrics.incr('extract.requests')
+        confidence = scraped['confidence'] if scraped else 0.0
+        rule_based = bool(scraped) and RULE_BASED_EXTRACTION_ENABLED and confidence >= RULE_BASED_MIN_CONFIDENCE
+        llm_start = time.perf_counter()
         
-        # Extract structured data
-        extracted_data = extract_resume_data_from_portfolio(portfolio_text)
-        print(f"✅ AI data extraction completed")
+        if rule_based:
+            # The scraper already found the resume; the model only fills gaps
+            parsed_info = candidate_from_portfolio_data(scraped['portfolio_data'])
+            missing = missing_sections(scraped['portfolio_data'])
+            print(f"⚡ Built resume from scraped data (confidence {confidence:.2f}), missing: {', '.join(missing) or 'none'}")
+            emit('rule_based', {'confidence': confidence, 'missing': missing})
+            metrics.incr('extract.rule_based')
+            if missing and RULE_BASED_FILL_MISSING:
+                portfolio_text = format_portfolio_text(scraped['portfolio_data'], scraped['text_content'])
+                parsed_info = fill_missing_sections(parsed_info, missing, portfolio_text, on_delta=llm_stage('fill_sections'))
+                emit('llm_completed', {'stage': 'fill_sections'})
+                metrics.incr('extract.llm_fill')
+            else:
+                metrics.incr('extract.no_llm')
+        elif scraped and scraped['structured']:
+            # Embedded structured data is already what the first model pass produces
+            extracted_text = format_structured_resume_text(scraped['portfolio_data'])
+            metrics.incr('extract.llm_calls_skipped')
+            print(f"⚡ Skipped AI summarisation, using embedded structured data")
+            parsed_info = get_all_info(extracted_text, on_delta=llm_stage('parse'))
+            emit('llm_completed', {'stage': 'parse'})
+        else:
+            if scraped:
+                portfolio_text = format_portfolio_text(scraped['portfolio_data'], scraped['text_content'])
+            else:
+                portfolio_text = unreachable_portfolio_text(portfolio_url)
+            print(f"✅ Portfolio scraping completed. Text length: {len(portfolio_text)}")
+            
+            if LLM_EXTRACTION_MODE == 'single_pass':
+                parsed_info = extract_candidate_from_portfolio(portfolio_text, on_delta=llm_stage('single_pass'))
+                emit('llm_completed', {'stage': 'single_pass'})
+                print(f"✅ Single-pass AI extraction completed")
+            else:
+                # Extract structured data
+                extracted_text = extract_resume_data_from_portfolio(portfolio_text, on_delta=llm_stage('summarise'))['extracted_text']
+                emit('llm_completed', {'stage': 'summarise'})
+                print(f"✅ AI data extraction completed")
+                
+                # Parse with enhanced validation
+                parsed_info = get_all_info(extracted_text, on_delta=llm_stage('parse'))
+                emit('llm_completed', {'stage': 'parse'})
         
-        # Parse with enhanced validation
-        parsed_info = get_all_info(extracted_data['extracted_text'])
+        llm_elapsed = time.perf_counter() - llm_start
+        if rule_based:
+            # Compare against the model time full extractions have been taking
+            typical = metrics.average('extract.llm.seconds')
+            if typical:
+                saved = max(0.0, typical - llm_elapsed)
+                metrics.incr('extract.llm_seconds_saved', saved)
+                print(f"⏱️ Rule-based extraction saved ~{saved:.1f}s of model time")
+        elif scraped:
+            metrics.observe('extract.llm.seconds', llm_elapsed)
+        emit('parsed', {'name': parsed_info.name, 'skills': parsed_info.Skills})
         print(f"✅ Data parsing completed")
         
         # Convert to comprehensive resume format
@@ -2135,22 +6152,26 @@ def enhanced_portfolio_data_extraction(portfolio_url: str) -> dict:
         
         return resume_data
         
+    except (ConversionCancelled, ProviderBusyError):
+        raise
     except Exception as e:
         print(f"❌ Enhanced extraction failed: {str(e)}")
+        if not fallback:
+            raise
         # Return professional fallback data
         return create_professional_fallback_data(portfolio_url)
 
 def get_professional_title(skills: List[str]) -> str:
     """Determine professional title based on skills"""
-    skill_text = ' '.join(skills).lower()
+    found = {category for _, category in skill_matcher.find(', '.join(skills))}
     
-    if any(tech in skill_text for tech in ['full stack', 'fullstack']):
+    if 'Role' in found:
         return "Senior Full Stack Developer"
-    elif any(tech in skill_text for tech in ['frontend', 'react', 'vue', 'angular']):
+    elif 'Frontend' in found:
         return "Frontend Developer"
-    elif any(tech in skill_text for tech in ['backend', 'node', 'python', 'java']):
+    elif 'Backend' in found:
         return "Backend Developer"
-    elif any(tech in skill_text for tech in ['devops', 'aws', 'docker', 'kubernetes']):
+    elif 'DevOps' in found:
         return "DevOps Engineer"
     else:
         return "Software Developer"
@@ -2160,23 +6181,15 @@ def categorize_skills(skills: List[str]) -> dict:
     categories = {
         "Frontend": [],
         "Backend": [],
+        "Data Science": [],
         "Database": [],
         "DevOps & Tools": [],
         "Other": []
     }
     
     for skill in skills:
-        skill_lower = skill.lower()
-        if any(tech in skill_lower for tech in ['html', 'css', 'javascript', 'react', 'vue', 'angular', 'next', 'tailwind']):
-            categories["Frontend"].append(skill)
-        elif any(tech in skill_lower for tech in ['node', 'python', 'java', 'php', 'express', 'fastapi', 'django']):
-            categories["Backend"].append(skill)
-        elif any(tech in skill_lower for tech in ['mongodb', 'postgresql', 'mysql', 'redis', 'sql']):
-            categories["Database"].append(skill)
-        elif any(tech in skill_lower for tech in ['docker', 'kubernetes', 'aws', 'git', 'ci/cd', 'jenkins']):
-            categories["DevOps & Tools"].append(skill)
-        else:
-            categories["Other"].append(skill)
+        category = skill_matcher.category_of(skill)
+        categories[SKILL_CATEGORY_SECTIONS.get(category, "Other")].append(skill)
     
     return categories
 
@@ -2358,7 +6371,6 @@ if __name__ == '__main__':
     os.environ['FLASK_DEBUG'] = os.getenv('FLASK_DEBUG', 'False')
     
     # Create necessary directories
-    os.makedirs('uploads', exist_ok=True)
     os.makedirs('generated_websites', exist_ok=True)
     
     print("Starting Portfolio to Resume Converter...")
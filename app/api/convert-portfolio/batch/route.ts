@@ -0,0 +1,58 @@
+import { NextRequest, NextResponse } from "next/server";
+
+export async function POST(request: NextRequest) {
+  try {
+    const body = await request.json();
+    const { portfolioUrls, template, crawl } = body;
+
+    if (!Array.isArray(portfolioUrls) || portfolioUrls.length === 0) {
+      return NextResponse.json(
+        { error: "portfolioUrls must be a non-empty list" },
+        { status: 400 }
+      );
+    }
+
+    console.log(
+      `🔄 Converting ${portfolioUrls.length} portfolios with template: ${template}`
+    );
+
+    // No timeout here: results are streamed back as each conversion finishes
+    const response = await fetch(
+      "http://localhost:5000/convert-portfolio/batch",
+      {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+        },
+        body: JSON.stringify({
+          portfolioUrls,
+          template,
+          crawl,
+        }),
+        signal: request.signal,
+      }
+    );
+
+    if (!response.ok || !response.body) {
+      const errorData = await response.json().catch(() => ({}));
+      console.error("Backend error:", errorData);
+      return NextResponse.json(
+        { error: errorData.error || "Failed to convert portfolios" },
+        { status: response.status || 500 }
+      );
+    }
+
+    return new Response(response.body, {
+      headers: {
+        "Content-Type": "application/x-ndjson",
+        "Cache-Control": "no-cache",
+      },
+    });
+  } catch (error: any) {
+    console.error("Error converting portfolios:", error);
+    return NextResponse.json(
+      { error: error.message || "Failed to convert portfolios" },
+      { status: 500 }
+    );
+  }
+}
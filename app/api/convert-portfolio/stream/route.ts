@@ -0,0 +1,66 @@
+import { NextRequest, NextResponse } from "next/server";
+
+export async function POST(request: NextRequest) {
+  try {
+    const body = await request.json();
+    const { portfolioUrl, template, crawl } = body;
+
+    if (!portfolioUrl) {
+      return NextResponse.json(
+        { error: "Portfolio URL is required" },
+        { status: 400 }
+      );
+    }
+
+    try {
+      new URL(portfolioUrl);
+    } catch {
+      return NextResponse.json(
+        { error: "Invalid portfolio URL format" },
+        { status: 400 }
+      );
+    }
+
+    console.log(`🔄 Streaming portfolio conversion: ${portfolioUrl}`);
+
+    // No timeout here: the backend sends events (or keep-alives) throughout
+    const response = await fetch(
+      "http://localhost:5000/convert-portfolio/stream",
+      {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+        },
+        body: JSON.stringify({
+          portfolioUrl,
+          template,
+          crawl,
+        }),
+        signal: request.signal,
+      }
+    );
+
+    if (!response.ok || !response.body) {
+      const errorData = await response.json().catch(() => ({}));
+      console.error("Backend error:", errorData);
+      return NextResponse.json(
+        { error: errorData.error || "Failed to convert portfolio" },
+        { status: response.status || 500 }
+      );
+    }
+
+    return new Response(response.body, {
+      headers: {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        Connection: "keep-alive",
+      },
+    });
+  } catch (error: any) {
+    console.error("Error streaming portfolio conversion:", error);
+    return NextResponse.json(
+      { error: error.message || "Failed to convert portfolio" },
+      { status: 500 }
+    );
+  }
+}
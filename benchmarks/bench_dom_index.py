@@ -0,0 +1,72 @@
+"""Compare PortfolioDomIndex with the per-selector soup lookups it replaces.
+
+Usage: python benchmarks/bench_dom_index.py [--repeat N] [fixture.html ...]
+
+For every fixture the page is parsed once, then all of scrape_portfolio's
+section selectors are resolved twice: with one ``soup.select_one`` /
+``soup.select`` traversal per selector, and through a freshly built index
+(index build time included). Both paths must return the same elements.
+"""
+import argparse
+
+from common import best_of, load_html_fixtures, print_table
+
+from bs4 import BeautifulSoup
+
+import app
+
+SINGLE_SELECTORS = (
+    app.NAME_SELECTORS + app.TITLE_SELECTORS + app.SKILL_SELECTORS
+    + app.EDUCATION_SELECTORS + app.ABOUT_SELECTORS + app.EXPERIENCE_SELECTORS
+)
+
+
+def per_selector(soup):
+    found = [soup.select_one(selector) for selector in SINGLE_SELECTORS]
+    found += [soup.select(selector) for selector in app.PROJECT_SELECTORS]
+    return found
+
+
+def indexed(soup):
+    dom_index = app.PortfolioDomIndex(soup)
+    found = [dom_index.select_one(selector) for selector in SINGLE_SELECTORS]
+    found += [dom_index.select(selector) for selector in app.PROJECT_SELECTORS]
+    return found
+
+
+def same_elements(left, right) -> bool:
+    for a, b in zip(left, right):
+        if isinstance(a, list):
+            if [id(elem) for elem in a] != [id(elem) for elem in b]:
+                return False
+        elif a is not b:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('fixtures', nargs='*')
+    args = parser.parse_args()
+
+    rows = []
+    for name, content in load_html_fixtures(args.fixtures).items():
+        soup = BeautifulSoup(content, 'html.parser')
+        if not same_elements(per_selector(soup), indexed(soup)):
+            raise SystemExit(f'{name}: index results differ from soup.select')
+        before = best_of(lambda: per_selector(soup), args.repeat)
+        after = best_of(lambda: indexed(soup), args.repeat)
+        rows.append([
+            name,
+            len(content),
+            f'{before * 1000:.2f}',
+            f'{after * 1000:.2f}',
+            f'{before / after:.1f}x',
+        ])
+
+    print_table(['fixture', 'bytes', 'per-selector ms', 'indexed ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Compare single-pass and two-pass LLM extraction on the saved portfolios.
+
+Usage: python benchmarks/bench_llm_extraction.py [--repeat N] [--gemini] [fixture.html ...]
+
+This script calls the Groq API and needs a real GROQ_API_KEY. Each fixture
+is scraped with the DOM heuristics (the path that reaches the model) and
+the resulting portfolio text is run through both modes. Latency is the
+median wall time per conversion. Token counts come from the API's usage
+field, summed over every call a conversion makes. The LLM response cache
+is disabled so every repeat reaches the API. ``--gemini`` also runs the
+single-pass prompt on Gemini (the hedge's other leg, needs a real
+GEMINI_API_KEY) and fails if its reply does not validate as a Candidate.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from common import load_html_fixtures, print_table
+
+os.environ['LLM_CACHE_ENABLED'] = 'false'
+
+import app
+
+
+def portfolio_text(content: bytes) -> str:
+    portfolio_data, text_content = app.extract_portfolio_data(app.parse_portfolio_html(content))
+    return app.format_portfolio_text(portfolio_data, text_content)
+
+
+def two_pass(text: str):
+    return app.get_all_info(app.extract_resume_data_from_portfolio(text)['extracted_text'])
+
+
+def single_pass(text: str):
+    return app.extract_candidate_from_portfolio(text)
+
+
+def gemini_single_pass(text: str):
+    content = app.run_prompt_on('gemini', 'single_pass', validate=app.Candidate.model_validate_json, portfolio_text=text)
+    return app.Candidate.model_validate_json(content)
+
+
+def llm_totals() -> dict:
+    counters = app.metrics.snapshot()['counters']
+    return {
+        field: sum(value for name, value in counters.items() if name.startswith('llm.') and name.endswith(f'.{field}'))
+        for field in ('calls', 'prompt_tokens', 'completion_tokens')
+    }
+
+
+def run(mode_fn, text: str, repeat: int) -> dict:
+    before = llm_totals()
+    timings = []
+    candidate = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        candidate = mode_fn(text)
+        timings.append(time.perf_counter() - start)
+    after = llm_totals()
+    return {
+        'ms': statistics.median(timings) * 1000,
+        **{field: (after[field] - before[field]) / repeat for field in after},
+        'candidate': candidate,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--gemini', action='store_true')
+    parser.add_argument('fixtures', nargs='*')
+    args = parser.parse_args()
+
+    if os.getenv('GROQ_API_KEY', 'benchmark') == 'benchmark':
+        sys.exit('GROQ_API_KEY must be set to a real key to run this benchmark')
+    if args.gemini and os.getenv('GEMINI_API_KEY', 'benchmark') == 'benchmark':
+        sys.exit('GEMINI_API_KEY must be set to a real key to run the Gemini leg')
+
+    modes = [('two_pass', two_pass), ('single_pass', single_pass)]
+    if args.gemini:
+        modes.append(('gemini_single_pass', gemini_single_pass))
+
+    rows = []
+    for name, content in load_html_fixtures(args.fixtures).items():
+        text = portfolio_text(content)
+        for mode, mode_fn in modes:
+            result = run(mode_fn, text, args.repeat)
+            candidate = result['candidate']
+            rows.append([
+                name,
+                mode,
+                f"{result['ms']:.0f}",
+                f"{result['calls']:.0f}",
+                f"{result['prompt_tokens']:.0f}",
+                f"{result['completion_tokens']:.0f}",
+                f"{len(candidate.Skills)}/{len(candidate.Projects)}/{len(candidate.Experience)}/{len(candidate.Education)}",
+            ])
+
+    print_table(
+        ['fixture', 'mode', 'median ms', 'calls', 'prompt tok', 'completion tok', 'skills/proj/exp/edu'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""Compare the PDF text extraction backends on the resume fixtures.
+
+Usage: python benchmarks/bench_pdf_backends.py [--repeat 3] [--regenerate] [resume.pdf ...]
+
+Every installed backend in app.PDF_TEXT_BACKENDS (plus layout mode where a
+backend supports it) extracts all pages of the corpus in a fresh worker
+process, so peak memory is not inflated by earlier runs. "pages/s" is from
+the fastest of ``--repeat`` passes over the corpus. "peak RSS" is the rise
+in the worker's maximum resident size, which also covers memory the C
+backends allocate; "py heap" is the tracemalloc peak of the Python heap
+only. "tokens" is app.estimate_tokens() over the extracted text: what the
+model would be sent. The corpus in fixtures/resumes is generated with
+reportlab (``--regenerate`` rebuilds it) and includes a two-column layout.
+"""
+import argparse
+import resource
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from common import FIXTURES_DIR, print_table
+from bench_pdf_extraction import build_resume
+
+from reportlab import rl_config
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import BaseDocTemplate, Frame, FrameBreak, PageTemplate, Paragraph, Spacer
+
+import app
+
+RESUME_FIXTURES_DIR = FIXTURES_DIR / 'resumes'
+
+
+def build_two_column_resume(path: Path, pages: int):
+    """Sidebar layout (contact and skills left, experience right), the kind
+    of page content-stream order tends to interleave"""
+    styles = getSampleStyleSheet()
+    width, height = A4
+    sidebar = Frame(0.5 * inch, 0.5 * inch, 2.2 * inch, height - inch, id='sidebar')
+    main = Frame(2.9 * inch, 0.5 * inch, width - 3.4 * inch, height - inch, id='main')
+    doc = BaseDocTemplate(str(path), pagesize=A4, pageTemplates=[PageTemplate(frames=[sidebar, main])])
+    story = []
+    for page in range(pages):
+        story += [Paragraph('Contact', styles['Heading3']), Paragraph('rahul.menon@example.com', styles['Normal']),
+                  Paragraph('github.com/rmenon', styles['Normal']), Paragraph('Skills', styles['Heading3'])]
+        story += [Paragraph(skill, styles['Normal']) for skill in ('Python', 'Django', 'PostgreSQL', 'React', 'Docker', 'AWS')]
+        story.append(FrameBreak())
+        story.append(Paragraph('Rahul Menon' if page == 0 else 'Experience (continued)', styles['Title']))
+        for item in range(8):
+            story.append(Paragraph(
+                f"Senior Engineer at Northwind {item}: migrated {item + 3} services to Kubernetes, owned the "
+                f"billing pipeline and mentored {item % 4 + 1} interns across {page + 2} product launches.",
+                styles['Normal'],
+            ))
+            story.append(Spacer(1, 6))
+        if page < pages - 1:
+            story.append(FrameBreak())
+    doc.build(story)
+
+
+def regenerate_corpus():
+    rl_config.invariant = 1
+    RESUME_FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    build_resume(RESUME_FIXTURES_DIR / 'single_column.pdf', 1)
+    build_two_column_resume(RESUME_FIXTURES_DIR / 'two_column.pdf', 2)
+    build_resume(RESUME_FIXTURES_DIR / 'long_cv.pdf', 6)
+
+
+def extract_all(backend, pdf_bytes: bytes, layout: bool) -> tuple:
+    document = backend.open(pdf_bytes)
+    try:
+        page_numbers = list(range(backend.page_count(document)))
+        pages = backend.extract_pages(document, page_numbers, layout)
+    finally:
+        backend.close(document)
+    return len(pages), '\n\n'.join(text for _, text, _ in pages)
+
+
+def measure(backend_name: str, layout: bool, corpus: list, repeat: int) -> dict:
+    """Runs in a fresh worker process"""
+    backend = app.PDF_TEXT_BACKENDS[backend_name]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [extract_all(backend, pdf_bytes, layout) for pdf_bytes in corpus]
+        best = min(best, time.perf_counter() - start)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    for pdf_bytes in corpus:
+        extract_all(backend, pdf_bytes, layout)
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    text = '\n\n'.join(text for _, text in results)
+    return {
+        'pages': sum(pages for pages, _ in results),
+        'seconds': best,
+        'rss_kb': rss_after - rss_before,
+        'py_peak': py_peak,
+        'chars': len(text),
+        'tokens': app.estimate_tokens(text),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pdfs', nargs='*')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--regenerate', action='store_true')
+    args = parser.parse_args()
+
+    if args.regenerate or not args.pdfs and not RESUME_FIXTURES_DIR.exists():
+        regenerate_corpus()
+    paths = [Path(pdf) for pdf in args.pdfs] or sorted(RESUME_FIXTURES_DIR.glob('*.pdf'))
+    corpus = [path.read_bytes() for path in paths]
+    print(f"corpus: {', '.join(path.name for path in paths)}")
+
+    rows = []
+    for name, backend in app.PDF_TEXT_BACKENDS.items():
+        if backend.module and not app.importlib.util.find_spec(backend.module):
+            rows.append([name, '-', 'not installed', '', '', '', '', ''])
+            continue
+        for layout in ((False, True) if backend.supports_layout else (False,)):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(measure, name, layout, corpus, args.repeat).result()
+            rows.append([
+                name,
+                'yes' if layout else 'no',
+                f"{result['pages'] / result['seconds']:.0f}",
+                f"{result['seconds'] * 1000:.1f}",
+                f"{result['rss_kb'] / 1024:.1f}",
+                f"{result['py_peak'] / (1024 * 1024):.1f}",
+                result['chars'],
+                result['tokens'],
+            ])
+
+    print_table(['backend', 'layout', 'pages/s', 'corpus ms', 'peak RSS +MB', 'py heap MB', 'chars', 'tokens'], rows)
+
+
+if __name__ == '__main__':
+    main()
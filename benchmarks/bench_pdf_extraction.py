@@ -0,0 +1,101 @@
+"""Time PDF text extraction on generated multi-page resumes.
+
+Usage: python benchmarks/bench_pdf_extraction.py [--pages 1 2 4 8 16] [--repeat 3] [--workers N]
+
+Builds one text-heavy resume per page count with reportlab, then compares
+the old first-page-only PyPDF2 read, extracting every page in this process,
+and app.extract_pdf_text(), which splits documents of PDF_PARALLEL_MIN_PAGES
+pages or more across the process pool. The last two use the active
+PDF_TEXT_BACKEND (bench_pdf_backends.py compares backends). "chars" is the
+amount of text each approach recovers; the first-page column shows what
+multi-page resumes used to lose.
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+from common import best_of, print_table
+
+import PyPDF2
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+import app
+
+SECTIONS = ['Experience', 'Projects', 'Education', 'Skills', 'Achievements', 'Publications']
+
+
+def build_resume(path: Path, pages: int):
+    styles = getSampleStyleSheet()
+    story = [Paragraph('Asha Verma', styles['Title']), Paragraph('asha.verma@example.com | github.com/ashaverma', styles['Normal'])]
+    for page in range(pages):
+        story.append(Paragraph(SECTIONS[page % len(SECTIONS)], styles['Heading2']))
+        for item in range(12):
+            story.append(Paragraph(
+                f"Role {page}.{item} at Company {item}: built and operated services in Python, Go and TypeScript, "
+                f"cut p95 latency by {10 + item}% and led a team of {item % 5 + 2} engineers through {page + 2} releases.",
+                styles['Normal'],
+            ))
+            story.append(Spacer(1, 4))
+        if page < pages - 1:
+            story.append(PageBreak())
+    SimpleDocTemplate(str(path), pagesize=A4).build(story)
+
+
+def first_page_text(path: Path) -> str:
+    return PyPDF2.PdfReader(str(path)).pages[0].extract_text()
+
+
+def sequential_text(path: Path) -> str:
+    page_count = len(PyPDF2.PdfReader(str(path)).pages)
+    pages = app._extract_pdf_pages(app.ACTIVE_PDF_TEXT_BACKEND, path.read_bytes(), list(range(page_count)), app.PDF_TEXT_LAYOUT)
+    return '\n\n'.join(text for _, text, _ in pages)
+
+
+def extract_pdf_text(path: Path) -> str:
+    with open(path, 'rb') as pdf_stream:
+        return app.extract_pdf_text(pdf_stream)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=app.PDF_PROCESS_WORKERS)
+    args = parser.parse_args()
+
+    app.PDF_MAX_PAGES = max(args.pages)
+    app.PDF_PROCESS_WORKERS = args.workers
+
+    rows = []
+    with tempfile.TemporaryDirectory() as corpus:
+        paths = {}
+        for pages in args.pages:
+            paths[pages] = Path(corpus) / f'resume_{pages}p.pdf'
+            build_resume(paths[pages], pages)
+
+        # Start the worker processes before anything is timed
+        extract_pdf_text(paths[max(args.pages)])
+
+        for pages, path in paths.items():
+            first = first_page_text(path)
+            pooled = extract_pdf_text(path)
+            rows.append([
+                pages,
+                len(first),
+                len(pooled),
+                f"{best_of(lambda: first_page_text(path), args.repeat) * 1000:.1f}",
+                f"{best_of(lambda: sequential_text(path), args.repeat) * 1000:.1f}",
+                f"{best_of(lambda: extract_pdf_text(path), args.repeat) * 1000:.1f}",
+                'yes' if pages >= app.PDF_PARALLEL_MIN_PAGES and args.workers > 1 else 'no',
+            ])
+
+    print_table(
+        ['pages', 'chars (first page)', 'chars (all pages)', 'first page ms', 'sequential ms', 'extract_pdf_text ms', 'pool'],
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Compare extract_projects with the per-selector project loop it replaced.
+
+Usage: python benchmarks/bench_project_extraction.py [--repeat N] [fixture.html ...]
+
+The legacy loop below is the pre-index implementation kept for reference:
+it appended a project for every element matched by every selector, so
+overlapping selectors and nested cards produced duplicates.
+"""
+import argparse
+
+from common import best_of, load_html_fixtures, print_table
+
+from bs4 import BeautifulSoup
+
+import app
+
+
+def legacy_projects(soup):
+    projects = []
+    for selector in app.PROJECT_SELECTORS:
+        for project in soup.select(selector):
+            project_data = {'title': '', 'desc': '', 'tech': [], 'github': '', 'demo': ''}
+            for title_sel in app.PROJECT_TITLE_SELECTORS:
+                title_elem = project.select_one(title_sel)
+                if title_elem:
+                    project_data['title'] = title_elem.get_text().strip()
+                    break
+            for desc_sel in app.PROJECT_DESC_SELECTORS:
+                desc_elem = project.select_one(desc_sel)
+                if desc_elem and len(desc_elem.get_text().strip()) > 10:
+                    project_data['desc'] = desc_elem.get_text().strip()
+                    break
+            for tech_sel in app.PROJECT_TECH_SELECTORS:
+                tech_elem = project.select_one(tech_sel)
+                if tech_elem:
+                    project_data['tech'].extend(t.strip() for t in tech_elem.get_text().split(',') if t.strip())
+            for link in project.find_all('a', href=True):
+                href = link['href']
+                link_text = link.get_text().strip().lower()
+                if 'github.com' in href or 'github' in link_text:
+                    project_data['github'] = href
+                elif any(domain in href for domain in app.PROJECT_DEMO_DOMAINS):
+                    project_data['demo'] = href
+                elif 'demo' in link_text or 'live' in link_text or 'view' in link_text:
+                    project_data['demo'] = href
+            if project_data['title'] and len(project_data['title']) > 2:
+                projects.append(project_data)
+    return projects
+
+
+def indexed_projects(soup):
+    return app.extract_projects(app.PortfolioDomIndex(soup))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('fixtures', nargs='*')
+    args = parser.parse_args()
+
+    rows = []
+    for name, content in load_html_fixtures(args.fixtures).items():
+        soup = BeautifulSoup(content, 'html.parser')
+        before = legacy_projects(soup)
+        after = indexed_projects(soup)
+        rows.append([
+            name,
+            len(before),
+            len({project['title'] for project in before}),
+            len(after),
+            f'{best_of(lambda: legacy_projects(soup), args.repeat) * 1000:.2f}',
+            f'{best_of(lambda: indexed_projects(soup), args.repeat) * 1000:.2f}',
+        ])
+
+    print_table(
+        ['fixture', 'before count', 'distinct titles', 'after count', 'before ms', 'after ms'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
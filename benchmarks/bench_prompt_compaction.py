@@ -0,0 +1,66 @@
+"""Compare prompt size before and after compaction on the saved portfolios.
+
+Usage: python benchmarks/bench_prompt_compaction.py [fixture.html ...]
+
+"before" is the original layout (Python reprs plus 3000 characters of raw
+page text). "after" is compact_portfolio_text() on the boilerplate-free page
+text. Tokens are app.estimate_tokens() counts. "facts" counts how many
+extracted values (name, contacts, each skill, project titles, institutes,
+companies) still appear verbatim in the prompt, as a quick check that
+compaction does not drop anything the model needs. For a live quality
+check run bench_llm_extraction.py with PROMPT_COMPACTION_ENABLED on and off.
+"""
+import argparse
+
+from common import load_html_fixtures, print_table
+
+import app
+
+
+def extracted_facts(portfolio_data: dict) -> list:
+    facts = [portfolio_data[key] for key in ('name', 'email', 'phone', 'linkedin', 'github') if portfolio_data[key]]
+    facts.extend(app._compact_skills(portfolio_data['skills']))
+    facts.extend(project['title'] for project in portfolio_data['projects'])
+    facts.extend(edu['Institute_name'] for edu in portfolio_data['education'] if edu['Institute_name'])
+    facts.extend(exp['Company'] for exp in portfolio_data['experience'] if exp['Company'])
+    return facts
+
+
+def retained(facts: list, prompt: str) -> str:
+    prompt = prompt.lower()
+    return f"{sum(1 for fact in facts if fact.lower() in prompt)}/{len(facts)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('fixtures', nargs='*')
+    args = parser.parse_args()
+
+    rows = []
+    for name, content in load_html_fixtures(args.fixtures).items():
+        soup = app.parse_portfolio_html(content)
+        portfolio_data, text_content = app.extract_portfolio_data(soup)
+        before = app._verbose_portfolio_text(portfolio_data, soup.get_text())
+        after = app.compact_portfolio_text(portfolio_data, text_content)
+        tokens_before = app.estimate_tokens(before)
+        tokens_after = app.estimate_tokens(after)
+        facts = extracted_facts(portfolio_data)
+        rows.append([
+            name,
+            len(before),
+            len(after),
+            tokens_before,
+            tokens_after,
+            f"{(1 - tokens_after / tokens_before) * 100:.0f}%",
+            retained(facts, before),
+            retained(facts, after),
+        ])
+
+    print_table(
+        ['fixture', 'chars before', 'chars after', 'tokens before', 'tokens after', 'saved', 'facts before', 'facts after'],
+        rows
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Measure resume upload throughput under concurrent requests.
+
+Usage: python benchmarks/bench_upload.py [--pages 2] [--concurrency 1 4 16] [--requests 64]
+
+Posts a generated resume to POST / through the Flask test client from
+several threads. The model call is stubbed out, so only the upload
+pipeline is measured: request parsing, hashing and PDF text extraction.
+"disk" runs the previous pipeline (Werkzeug's default upload buffering,
+saved to uploads/, reopened for PyPDF2, then deleted) on a throwaway
+route. "memory" is the current in-memory pipeline. The upload cache is
+disabled, otherwise every request after the first would be a cache hit and
+nothing would be extracted.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from common import print_table
+
+os.environ['UPLOAD_CACHE_ENABLED'] = 'false'
+
+from bench_pdf_extraction import build_resume
+
+from flask import Request
+
+import app
+
+# Where the legacy pipeline saved uploads; the app itself no longer has one
+LEGACY_UPLOAD_FOLDER = 'uploads'
+
+
+def stub_get_all_info(info, on_delta=None):
+    return app.Candidate(
+        name='Benchmark', Education=[], Projects=[], Experience=[], Achivements=[],
+        Skills=[], Position_of_Responsibility=[], Contact_Info={},
+    )
+
+
+def legacy_upload():
+    """The upload handler as it was before the in-memory pipeline"""
+    file = app.request.files['file']
+    file_bytes = file.read()
+    filepath = os.path.join(LEGACY_UPLOAD_FOLDER, f"{uuid.uuid4()}_{file.filename}")
+    try:
+        with open(filepath, 'wb') as saved:
+            saved.write(file_bytes)
+        with open(filepath, 'rb') as saved:
+            content = app.extract_pdf_text(saved)
+        info = app.get_all_info(content)
+        return app.jsonify({'success': True, 'data': {'name': info.name}})
+    finally:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+
+def run(path: str, pdf_bytes: bytes, concurrency: int, total: int) -> list:
+    def upload(_):
+        client = app.app.test_client()
+        start = time.perf_counter()
+        response = client.post(path, data={'file': (BytesIO(pdf_bytes), 'resume.pdf')}, content_type='multipart/form-data')
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(upload, range(total)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=64)
+    args = parser.parse_args()
+
+    app.get_all_info = stub_get_all_info
+    # Identical uploads would be coalesced; measure every parse
+    app.upload_flight.do = lambda key, fn, *fn_args: fn(*fn_args)
+    app.app.add_url_rule('/bench-legacy-upload', 'bench_legacy_upload', legacy_upload, methods=['POST'])
+    os.makedirs(LEGACY_UPLOAD_FOLDER, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as corpus:
+        path = Path(corpus) / 'resume.pdf'
+        build_resume(path, args.pages)
+        pdf_bytes = path.read_bytes()
+
+    rows = []
+    for concurrency in args.concurrency:
+        for name, route, request_class in (('disk', '/bench-legacy-upload', Request), ('memory', '/', app.UploadRequest)):
+            app.app.request_class = request_class
+            start = time.perf_counter()
+            latencies = run(route, pdf_bytes, concurrency, args.requests)
+            elapsed = time.perf_counter() - start
+            rows.append([
+                concurrency,
+                name,
+                f"{args.requests / elapsed:.1f}",
+                f"{statistics.median(latencies) * 1000:.1f}",
+                f"{sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000:.1f}",
+            ])
+    app.app.request_class = app.UploadRequest
+
+    print(f"resume: {args.pages} pages, {len(pdf_bytes) / 1024:.0f}KB")
+    print_table(['concurrency', 'pipeline', 'uploads/s', 'median ms', 'p95 ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
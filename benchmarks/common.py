@@ -0,0 +1,43 @@
+"""Shared helpers for the benchmark scripts in this folder.
+
+The scripts import ``app`` directly, so dummy API keys are set here to let the
+module initialise without a ``.env`` file; keys from the repo's ``.env`` are
+loaded first and take precedence. Nothing in the benchmarks talks to Groq or
+Gemini unless a script says so explicitly.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+sys.path.insert(0, str(ROOT_DIR))
+load_dotenv(ROOT_DIR / '.env')
+os.environ.setdefault('GROQ_API_KEY', 'benchmark')
+os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+
+
+def load_html_fixtures(names=None) -> dict:
+    """Return {fixture name: raw bytes} for the saved portfolio pages"""
+    paths = [Path(name) for name in names] if names else sorted(FIXTURES_DIR.glob('*.html'))
+    return {path.name: path.read_bytes() for path in paths}
+
+
+def best_of(fn, repeat: int) -> float:
+    """Run ``fn`` ``repeat`` times and return the fastest wall time in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    for line in [headers, ['-' * width for width in widths], *rows]:
+        print('  '.join(str(cell).ljust(width) for cell, width in zip(line, widths)))